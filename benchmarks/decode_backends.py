@@ -0,0 +1,75 @@
+"""
+Benchmark of ``FrameLoaderManager`` decode backends.
+
+Samples the same frame positions from the given video files with every ``DecodeBackend`` and reports the
+wall clock time of each run.
+
+Usage::
+
+    python -m benchmarks.decode_backends --files a.mkv b.mkv --n-samples 50
+
+Results of 20 P-frame samples, 3 runs per backend, on a single-core Intel Xeon with Python 3.11 and
+OpenCV 4.10 (best / mean)::
+
+    3000 frames, 1280x720, MPEG-4 Part 2      Thread 1.156 / 1.183 s    Process 1.489 / 1.499 s
+    400 frames, 640x360, MPEG-4 Part 2        Thread 0.169 / 0.174 s    Process 0.435 / 0.454 s
+    Both files                                Thread 1.041 / 1.058 s    Process 1.454 / 1.469 s
+
+Every run starts a new process pool, which costs about 0.3 s. With a single core, child processes cannot decode
+concurrently, so the process backend only pays off on machines with several cores.
+"""
+import argparse
+import time
+from pathlib import Path
+
+from frame_comparison_tool.utils import FrameType
+from frame_comparison_tool.utils.decode_backend import DecodeBackend
+from frame_comparison_tool.utils.frame_loader_manager import FrameLoaderManager
+
+
+def benchmark(files: list[Path], n_samples: int, seed: int, frame_type: FrameType, backend: DecodeBackend,
+              repeats: int) -> list[float]:
+    """
+    Measures the time needed to sample all frames with a decode backend.
+
+    :param files: Paths to video files.
+    :param n_samples: Number of frames to sample.
+    :param seed: Random seed.
+    :param frame_type: Frame type.
+    :param backend: Decode backend.
+    :param repeats: Number of measured runs.
+    :return: List of run durations in seconds.
+    """
+    durations: list[float] = []
+
+    for _ in range(repeats):
+        manager = FrameLoaderManager(n_samples=n_samples, seed=seed, frame_type=frame_type, decode_backend=backend)
+        manager.add_source(file_paths=files)
+
+        start = time.perf_counter()
+        manager.sample_all_frames()
+        durations.append(time.perf_counter() - start)
+
+        manager.close()
+
+    return durations
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Decode backend benchmark")
+    parser.add_argument('--files', type=Path, nargs='+', required=True, help="Path(s) to video file(s)")
+    parser.add_argument('--n-samples', type=int, default=20, help="Number of frames to sample (default: 20)")
+    parser.add_argument('--seed', type=int, default=42, help="Random seed (default: 42)")
+    parser.add_argument('--frame-type', type=FrameType, choices=list(FrameType), default="B-Type",
+                        help="Frame type (default: B-Type)")
+    parser.add_argument('--repeats', type=int, default=3, help="Number of runs per backend (default: 3)")
+    args = parser.parse_args()
+
+    for backend in DecodeBackend:
+        durations = benchmark(files=args.files, n_samples=args.n_samples, seed=args.seed,
+                              frame_type=args.frame_type, backend=backend, repeats=args.repeats)
+        print(f"{backend.value:>8}: best {min(durations):.3f} s, mean {sum(durations) / len(durations):.3f} s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,136 @@
+"""
+Benchmark of the path a decoded frame takes to the screen.
+
+Decodes frames from a video file and pushes each of them through the previous display pipeline (RGB conversion,
+PIL thumbnail, ``Format_RGB888``) and the current one (BGR kept, ``cv2.resize``, ``Format_BGR888`` over the frame
+memory). Reports the latency and the number of full frame copies per displayed frame. The final ``QPixmap`` upload
+is part of both pipelines.
+
+Usage::
+
+    python -m benchmarks.display_pipeline --file a.mkv --max-size 1280 720
+"""
+import argparse
+import os
+import time
+from pathlib import Path
+from typing import Callable
+
+import cv2
+import numpy as np
+from PIL import Image
+from PySide6.QtGui import QGuiApplication, QImage, QPixmap
+
+from frame_comparison_tool.utils import resize_to_fit
+
+
+def previous_pipeline(frame: np.ndarray, max_size: tuple[int, int]) -> tuple[QPixmap, int]:
+    """
+    Displays a frame the way it was displayed before the BGR display path.
+
+    :param frame: Decoded BGR frame.
+    :param max_size: Maximal width and height of the displayed frame.
+    :return: Tuple containing the pixmap and the number of full frame copies made on the way.
+    """
+    rgb = cv2.cvtColor(src=frame, code=cv2.COLOR_BGR2RGB)
+    image = Image.fromarray(rgb)
+    image.thumbnail(max_size)
+    resized = np.array(image)
+    height, width, _ = resized.shape
+    pixmap = QPixmap.fromImage(QImage(resized.data, width, height, 3 * width, QImage.Format.Format_RGB888))
+
+    # Color conversion, the PIL image, the array converted back from it and the pixmap upload.
+    copies = 2 + (not np.shares_memory(np.asarray(image), rgb)) + 1
+
+    return pixmap, copies
+
+
+def current_pipeline(frame: np.ndarray, max_size: tuple[int, int]) -> tuple[QPixmap, int]:
+    """
+    Displays a frame the way ``Presenter`` and ``View`` display it.
+
+    :param frame: Decoded BGR frame.
+    :param max_size: Maximal width and height of the displayed frame.
+    :return: Tuple containing the pixmap and the number of full frame copies made on the way.
+    """
+    resized = np.ascontiguousarray(resize_to_fit(frame, max_size))
+    height, width = resized.shape[:2]
+    pixmap = QPixmap.fromImage(QImage(resized.data, width, height, resized.strides[0], QImage.Format.Format_BGR888))
+
+    # Only the resize, if the frame does not fit, and the pixmap upload.
+    copies = (not np.shares_memory(resized, frame)) + 1
+
+    return pixmap, copies
+
+
+def benchmark(frames: list[np.ndarray], max_size: tuple[int, int],
+              pipeline: Callable[[np.ndarray, tuple[int, int]], tuple[QPixmap, int]],
+              repeats: int) -> tuple[float, float]:
+    """
+    Measures the time a display pipeline needs per frame.
+
+    :param frames: Decoded BGR frames.
+    :param max_size: Maximal width and height of the displayed frame.
+    :param pipeline: Display pipeline.
+    :param repeats: Number of passes over all frames.
+    :return: Tuple containing the mean latency in milliseconds and the mean number of copies per frame.
+    """
+    durations: list[float] = []
+    copies: list[int] = []
+
+    for _ in range(repeats):
+        for frame in frames:
+            start = time.perf_counter()
+            _, frame_copies = pipeline(frame, max_size)
+            durations.append(time.perf_counter() - start)
+            copies.append(frame_copies)
+
+    return 1000 * sum(durations) / len(durations), sum(copies) / len(copies)
+
+
+def read_frames(file: Path, n_frames: int) -> list[np.ndarray]:
+    """
+    Decodes the first frames of a video file.
+
+    :param file: Path to the video file.
+    :param n_frames: Number of frames to decode.
+    :return: List of BGR frames.
+    """
+    video_capture = cv2.VideoCapture(str(file.absolute()))
+    frames: list[np.ndarray] = []
+
+    while len(frames) < n_frames:
+        success, frame = video_capture.read()
+
+        if not success:
+            break
+
+        frames.append(frame)
+
+    video_capture.release()
+
+    return frames
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Display pipeline benchmark")
+    parser.add_argument('--file', type=Path, required=True, help="Path to a video file")
+    parser.add_argument('--n-frames', type=int, default=20, help="Number of frames to display (default: 20)")
+    parser.add_argument('--max-size', type=int, nargs=2, default=(1280, 720),
+                        help="Maximal displayed width and height (default: 1280 720)")
+    parser.add_argument('--repeats', type=int, default=5, help="Number of passes over all frames (default: 5)")
+    args = parser.parse_args()
+
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    _app = QGuiApplication([])
+
+    frames = read_frames(file=args.file, n_frames=args.n_frames)
+    max_size = tuple(args.max_size)
+
+    for name, pipeline in (('previous', previous_pipeline), ('current', current_pipeline)):
+        latency, copies = benchmark(frames=frames, max_size=max_size, pipeline=pipeline, repeats=args.repeats)
+        print(f"{name:>8}: {latency:.3f} ms per frame, {copies:.1f} frame copies per frame")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""
+Benchmark of switching the displayed source of the same frame.
+
+Fits the first frame of every given video file to the display size and flips between them in the ``View``, once
+with freshly made pixmaps and once with pinned ones. Reports the flip latency against one display refresh.
+
+Usage::
+
+    python -m benchmarks.source_flip --files a.mkv b.mkv --max-size 1280 720
+"""
+import argparse
+import os
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+from PySide6.QtWidgets import QApplication
+
+from frame_comparison_tool.utils import DisplayMode, ViewData, resize_to_fit
+from frame_comparison_tool.view import View
+
+
+def benchmark(view: View, app: QApplication, frames: list[np.ndarray], pinned: bool, flips: int) -> list[float]:
+    """
+    Measures the time needed to display another source.
+
+    :param view: ``View`` instance.
+    :param app: Running application, used to process the deferred pinning.
+    :param frames: Scaled frames, one per source.
+    :param pinned: Whether the frames are pinned before flipping.
+    :param flips: Number of measured flips.
+    :return: List of flip durations in seconds.
+    """
+    view.pin_frames(frames if pinned else [])
+    app.processEvents()
+
+    durations: list[float] = []
+
+    for flip in range(flips):
+        view_data = ViewData(frame=frames[flip % len(frames)], mode=DisplayMode.SCALED)
+
+        start = time.perf_counter()
+        view.update_display(view_data)
+        durations.append(time.perf_counter() - start)
+
+    return durations
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Source flip benchmark")
+    parser.add_argument('--files', type=Path, nargs='+', required=True, help="Path(s) to video file(s)")
+    parser.add_argument('--max-size', type=int, nargs=2, default=(1280, 720),
+                        help="Maximal displayed width and height (default: 1280 720)")
+    parser.add_argument('--flips', type=int, default=100, help="Number of flips (default: 100)")
+    args = parser.parse_args()
+
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    app = QApplication([])
+    view = View()
+
+    frames: list[np.ndarray] = []
+
+    for file in args.files:
+        success, frame = cv2.VideoCapture(str(file.absolute())).read()
+
+        if success:
+            frames.append(resize_to_fit(frame, tuple(args.max_size)))
+
+    refresh_interval = view.get_refresh_interval()
+    print(f"display refresh: {1000 * refresh_interval:.2f} ms")
+
+    for pinned in (False, True):
+        durations = benchmark(view=view, app=app, frames=frames, pinned=pinned, flips=args.flips)
+        mean = sum(durations) / len(durations)
+        print(f"{'pinned' if pinned else 'unpinned':>8}: mean {1000 * mean:.3f} ms, "
+              f"worst {1000 * max(durations):.3f} ms, "
+              f"{sum(duration > refresh_interval for duration in durations)} of {len(durations)} over one refresh")
+
+
+if __name__ == '__main__':
+    main()
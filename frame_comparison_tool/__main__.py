@@ -1,3 +1,5 @@
+from multiprocessing import freeze_support
+
 from PySide6.QtWidgets import QApplication
 
 from frame_comparison_tool.model import Model
@@ -18,4 +20,5 @@ def main():
 
 
 if __name__ == '__main__':
+    freeze_support()
     main()
@@ -4,6 +4,7 @@ from typing import Optional, OrderedDict, Callable
 import numpy as np
 
 from frame_comparison_tool.utils import FrameLoader, FrameType, Task, DisplayMode, Direction
+from frame_comparison_tool.utils.config import PINNED_NEIGHBOURS
 from frame_comparison_tool.utils.frame_loader_manager import FrameLoaderManager
 from frame_comparison_tool.utils.worker import Worker
 from loguru import logger
@@ -28,10 +29,8 @@ class Model:
         """Range (0, `n_samples - 1`), denotes the frame index inside the `frame_positions` list."""
         self.curr_mode = DisplayMode.SCALED
         """Current display mode."""
-        self.max_frame_size: Optional[tuple[int, int]] = None
-        """Maximum frame width and height."""
 
-        self.worker = Worker(frame_loader_manager=self.frame_loader_manager)
+        self.worker = Worker(frame_loader_manager=self.frame_loader_manager, get_focus=self.get_focus)
         self.worker.start()
 
         if files:
@@ -43,11 +42,13 @@ class Model:
 
     def exit_app(self) -> None:
         """
-        Signals to the worker to stop the running thread.
+        Signals to the worker to stop the running thread and releases the frame loading resources.
         """
         if self.worker:
             self.worker.stop()
 
+        self.frame_loader_manager.close()
+
     def set_on_frames_ready_callback(self, on_frames_ready: Callable) -> None:
         """
         Set callback for when frames are ready.
@@ -92,6 +93,61 @@ class Model:
 
         self.worker.on_task_failed_invalid_sources.connect(on_task_failed_invalid_sources)
 
+    def set_on_frame_count_corrected_callback(self, on_frame_count_corrected: Callable) -> None:
+        """
+        Set callback for when a provisional frame count of a source is corrected.
+
+        :param on_frame_count_corrected: Callback function to execute when a frame count is corrected.
+        """
+
+        self.worker.on_frame_count_corrected.connect(on_frame_count_corrected)
+
+    def set_on_frame_ready_callback(self, on_frame_ready: Callable) -> None:
+        """
+        Set callback for when a single frame is decoded during sampling.
+
+        :param on_frame_ready: Callback function to execute when a frame is decoded.
+        """
+
+        self.worker.on_frame_ready.connect(on_frame_ready)
+
+    def set_on_frame_refined_callback(self, on_frame_refined: Callable) -> None:
+        """
+        Set callback for when a preview frame is replaced by its exact frame during sampling.
+
+        :param on_frame_refined: Callback function to execute when a frame is refined.
+        """
+
+        self.worker.on_frame_refined.connect(on_frame_refined)
+
+    def get_focus(self) -> tuple[int, int]:
+        """
+        Get the indices of the currently displayed frame.
+
+        :return: Tuple containing the current source index and frame index.
+        """
+        return self.curr_src_idx, self.curr_frame_idx
+
+    @property
+    def show_overlay(self) -> bool:
+        """Get whether the frame information overlay is shown."""
+        return self.frame_loader_manager.show_overlay
+
+    @show_overlay.setter
+    def show_overlay(self, show_overlay: bool) -> None:
+        """Set whether the frame information overlay is shown."""
+        self.frame_loader_manager.show_overlay = show_overlay
+
+    @property
+    def max_frame_size(self) -> Optional[tuple[int, int]]:
+        """Get maximum frame width and height."""
+        return self.frame_loader_manager.display_size
+
+    @max_frame_size.setter
+    def max_frame_size(self, max_frame_size: tuple[int, int]) -> None:
+        """Set maximum frame width and height."""
+        self.frame_loader_manager.display_size = max_frame_size
+
     @property
     def n_samples(self) -> int:
         """Get number of frames to sample."""
@@ -156,6 +212,29 @@ class Model:
         """
         return self.frame_loader_manager.get_frame(src_idx=self.curr_src_idx, frame_idx=self.curr_frame_idx)
 
+    def get_current_scaled_frame(self) -> Optional[np.ndarray]:
+        """
+        Retrieves current frame of current video source, fitted to the maximum frame size.
+
+        :return: Current scaled frame, ``None`` if it was not decoded yet or the maximum frame size is not known yet.
+        """
+        return self.frame_loader_manager.get_scaled_frame(src_idx=self.curr_src_idx, frame_idx=self.curr_frame_idx)
+
+    def get_pinned_frames(self) -> list[np.ndarray]:
+        """
+        Retrieves the already scaled frames of all video sources at the current frame index, and at its neighbours
+        if `PINNED_NEIGHBOURS` is set. Nothing is pinned outside the scaled mode.
+
+        :return: Frames worth keeping ready for display.
+        """
+        if self.curr_mode != DisplayMode.SCALED or self.n_samples == 0:
+            return []
+
+        frame_indices = [(self.curr_frame_idx + distance) % self.n_samples
+                         for distance in range(-PINNED_NEIGHBOURS, PINNED_NEIGHBOURS + 1)]
+
+        return self.frame_loader_manager.peek_scaled_frames(frame_indices=list(dict.fromkeys(frame_indices)))
+
     def add_sources(self, file_paths: list[Path]) -> list[tuple[Path, bool]]:
         """
         Adds video source to the model.
@@ -169,7 +248,8 @@ class Model:
 
     def delete_source(self, file_path: Path) -> int:
         """
-        Deletes video source from the model.
+        Deletes video source from the model. The running task of the worker is stopped first, an interrupted
+        sampling resumes with the remaining sources afterward.
 
         :param file_path: Path of the video source to delete.
         :return: Index of deleted source.
@@ -177,22 +257,14 @@ class Model:
         if self.curr_src_idx == len(self.frame_loader_manager.sources) - 1 and self.curr_src_idx > 0:
             self.curr_src_idx -= 1
 
-        src_idx = self.frame_loader_manager.delete_source(file_path)
+        with self.worker.paused():
+            src_idx = self.frame_loader_manager.delete_source(file_path)
 
         if len(self.frame_loader_manager.sources) == 0:
             self.curr_frame_idx = 0
 
         return src_idx
 
-    def expand_frames(self, n_samples: int) -> None:
-        """
-        Expands number of sampled frames.
-
-        :param n_samples: New number of frames to sample.
-        """
-
-        self.frame_loader_manager.expand_frames(n_samples=n_samples)
-
     def resample_frames(self) -> None:
         """
         Resample frames from all sources
@@ -212,6 +284,27 @@ class Model:
                              src_idx=self.curr_src_idx,
                              frame_idx=self.curr_frame_idx)
 
+    def cancel_prefetch(self) -> None:
+        """
+        Cancels prefetching of frames reached by offsets, because the current sample changed.
+        """
+
+        self.frame_loader_manager.cancel_prefetch()
+
+    def refocus(self) -> None:
+        """
+        Updates the compressed frame tier around the current frame in the background.
+        """
+
+        self.worker.add_task(Task.REFOCUS)
+
+    def rescale(self) -> None:
+        """
+        Fits the frames around the current frame to the maximum frame size in the background.
+        """
+
+        self.worker.add_task(Task.RESCALE)
+
     def offset_all_frames(self, direction: Direction) -> None:
         """
         Replaces all frames of one source with the closest frames of the same frame type in
@@ -1,11 +1,10 @@
+import time
 from pathlib import Path
 
-import numpy as np
-from PIL import Image
+from loguru import logger
 
 from frame_comparison_tool.model import Model
 from frame_comparison_tool.utils import DisplayMode, ViewData, FrameType, Direction
-from frame_comparison_tool.utils.exceptions import ZeroDimensionError
 from frame_comparison_tool.view import View
 
 
@@ -46,6 +45,9 @@ class Presenter:
         self.model.set_on_task_finished_callback(self._stop_loading)
         self.model.set_on_task_failed_callback(self._stop_task)
         self.model.set_on_task_failed_invalid_sources_callback(self._stop_task_and_delete_sources)
+        self.model.set_on_frame_count_corrected_callback(self._correct_frame_count)
+        self.model.set_on_frame_ready_callback(self._show_ready_frame)
+        self.model.set_on_frame_refined_callback(self._show_refined_frame)
 
     def _connect_signals(self) -> None:
         """
@@ -66,6 +68,7 @@ class Presenter:
         self.view.exit_app_requested.connect(self._exit_app)
         self.view.save_images_requested.connect(self._save_frames)
         self.view.offset_all_frames_requested.connect(self.offset_all_frames)
+        self.view.overlay_toggled.connect(self.toggle_overlay)
 
     def _exit_app(self) -> None:
         """
@@ -100,12 +103,12 @@ class Presenter:
     def change_n_samples(self, n_samples: int) -> None:
         """
         Changes number of frames to sample and update display.
+        Frames at positions shared by the previous and the new number of samples are not decoded again.
 
         :param n_samples: New number of samples.
         """
 
         self.model.update_n_samples(n_samples=n_samples)
-        self.model.expand_frames(n_samples=n_samples)
         self.model.resample_frames()
         self.update_display()
 
@@ -157,6 +160,8 @@ class Presenter:
         """
         self.model.curr_frame_idx += direction
         self.model.curr_frame_idx %= self.model.n_samples
+        self.model.cancel_prefetch()
+        self.model.refocus()
         self.update_display()
 
     def change_source(self, direction: Direction) -> None:
@@ -168,6 +173,30 @@ class Presenter:
 
         self.model.curr_src_idx += direction
         self.model.curr_src_idx %= self.model.source_count
+
+        start = time.perf_counter()
+        self.update_display()
+        self._report_flip_latency(time.perf_counter() - start)
+
+    def _report_flip_latency(self, latency: float) -> None:
+        """
+        Logs the time a source change took to display, warning if it took longer than one display refresh.
+
+        :param latency: Time in seconds between the source change and the new pixmap being set.
+        """
+        refresh_interval = self.view.get_refresh_interval()
+
+        if latency > refresh_interval:
+            logger.warning(f"Source flip took {1000 * latency:.2f} ms, "
+                           f"longer than one display refresh ({1000 * refresh_interval:.2f} ms)")
+        else:
+            logger.debug(f"Source flip took {1000 * latency:.2f} ms")
+
+    def toggle_overlay(self) -> None:
+        """
+        Shows or hides the frame information overlay and updates the current display.
+        """
+        self.model.show_overlay = not self.model.show_overlay
         self.update_display()
 
     def change_mode(self, mode: DisplayMode) -> None:
@@ -182,47 +211,33 @@ class Presenter:
 
     def resize_frame(self, frame_size: tuple[int, int]) -> None:
         """
-        Resizes frame to a certain frame size and updates the current display.
+        Resizes frame to a certain frame size. The frames are scaled in the background,
+        the display is updated once the current frame is ready.
 
         :param frame_size: A tuple containing the desired frame width and height.
         """
         if frame_size != self.model.max_frame_size:
             self.model.max_frame_size = frame_size
-            self.update_display()
+            self.model.rescale()
 
     def update_display(self) -> None:
         """
         Updates the display with the current frame and selected display mode.
-        Applies necessary transformations to the frame.
+        In the scaled mode, the frame fitted to the scroll area is taken from the scaled frame cache,
+        and the frames of all sources at the current frame index are pinned in the view for instant source changes.
         """
         mode: DisplayMode = self.model.curr_mode
         view_data: ViewData
 
-        frame = self.model.get_current_frame()
-
-        if frame is not None and mode == DisplayMode.SCALED:
-            frame = self._resize_frame_to_fit(frame)
+        if mode == DisplayMode.SCALED:
+            frame = self.model.get_current_scaled_frame()
+        else:
+            frame = self.model.get_current_frame()
 
         view_data = ViewData(frame=frame, mode=mode)
 
         self.view.update_display(view_data)
-
-    def _resize_frame_to_fit(self, frame: np.ndarray) -> np.ndarray:
-        """
-        Resizes frame to fit into the scroll area.
-
-        :param frame: Frame to be fitted.
-        :return: Resized frame.
-        :raises ``ZeroDimensionError``: If either width or height of the scroll area is zero.
-        """
-        max_frame_size: tuple[int, int] = self.model.max_frame_size
-
-        if max_frame_size[0] == 0 or max_frame_size[1] == 0:
-            raise ZeroDimensionError()
-
-        image = Image.fromarray(frame)
-        image.thumbnail(max_frame_size)
-        return np.array(image)
+        self.view.pin_frames(self.model.get_pinned_frames())
 
     def _start_loading(self) -> None:
         """
@@ -265,6 +280,46 @@ class Presenter:
                     f"These files will be removed from the list!"
         )
 
+    def _correct_frame_count(self, file_path: str, total_frames: int) -> None:
+        """
+        Handle correction of a provisional frame count by displaying the current frame again, with the corrected
+        frame count in its text information.
+
+        :param file_path: Path of the corrected source.
+        :param total_frames: Corrected total number of frames.
+        """
+
+        logger.info(f"Corrected frame count of {file_path} to {total_frames + 1}")
+        self.update_display()
+
+    def _show_ready_frame(self, src_idx: int, frame_idx: int) -> None:
+        """
+        Handle a frame decoded during sampling by displaying it, if it is the current frame.
+
+        :param src_idx: Index of the source of the decoded frame.
+        :param frame_idx: Index of the decoded frame.
+        """
+
+        if (src_idx, frame_idx) == self.model.get_focus():
+            self.update_display()
+
+    def _show_refined_frame(self, src_idx: int, frame_idx: int) -> None:
+        """
+        Handle a preview frame replaced by its exact frame. The current frame is displayed again, while a refined frame
+        of another source at the current frame index only renews the pinned frames, so that the view never switches
+        to a stale preview.
+
+        :param src_idx: Index of the source of the refined frame.
+        :param frame_idx: Index of the refined frame.
+        """
+
+        curr_src_idx, curr_frame_idx = self.model.get_focus()
+
+        if (src_idx, frame_idx) == (curr_src_idx, curr_frame_idx):
+            self.update_display()
+        elif frame_idx == curr_frame_idx:
+            self.view.pin_frames(self.model.get_pinned_frames())
+
     def _save_frames(self, formatted_date: str) -> None:
         """
         Handles saving frames to current directory.
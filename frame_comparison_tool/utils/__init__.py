@@ -1,4 +1,4 @@
-from frame_comparison_tool.utils.cv2_utilities import Align, put_bordered_text
+from frame_comparison_tool.utils.cv2_utilities import Align, put_bordered_text, put_text_sprite, resize_to_fit
 from frame_comparison_tool.utils.direction import Direction
 from frame_comparison_tool.utils.frame_type import FrameType
 from frame_comparison_tool.utils.frame_loader import FrameLoader
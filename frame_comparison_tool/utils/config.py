@@ -1,3 +1,25 @@
 import os
 
-MAX_FRAMES_TO_SEARCH: int = int(os.getenv("MAX_FRAMES_TO_SEARCH", "1000"))
+MAX_FRAMES_TO_SEARCH: int = int(os.getenv("MAX_FRAMES_TO_SEARCH", "1500"))
+BUILD_FRAME_INDEX: bool = os.getenv("BUILD_FRAME_INDEX", "1") == "1"
+PROBE_CACHE_ENABLED: bool = os.getenv("PROBE_CACHE_ENABLED", "1") == "1"
+PROBE_CACHE_DIR: str = os.getenv("PROBE_CACHE_DIR", "")
+PROBE_CACHE_HASH_BYTES: int = int(os.getenv("PROBE_CACHE_HASH_BYTES", str(1024 * 1024)))
+FRAME_COUNT_REFINE_MARGIN: int = int(os.getenv("FRAME_COUNT_REFINE_MARGIN", "250"))
+SAMPLING_WORKERS: int = int(os.getenv("SAMPLING_WORKERS", str(min(8, os.cpu_count() or 1))))
+CAPTURES_PER_SOURCE: int = int(os.getenv("CAPTURES_PER_SOURCE", "0"))
+DECODE_BACKEND: str = os.getenv("DECODE_BACKEND", "Thread")
+PRIORITY_NEIGHBOURS: int = int(os.getenv("PRIORITY_NEIGHBOURS", "1"))
+PREFETCH_DEPTH: int = int(os.getenv("PREFETCH_DEPTH", "2"))
+FRAME_STORE_BUDGET_MB: int = int(os.getenv("FRAME_STORE_BUDGET_MB", "2048"))
+FRAME_STORE_SPILL_DIR: str = os.getenv("FRAME_STORE_SPILL_DIR", "")
+FRAME_FORMAT: str = os.getenv("FRAME_FORMAT", "BGR")
+COMPRESSED_TIER: bool = os.getenv("COMPRESSED_TIER", "0") == "1"
+FRAME_CODEC: str = os.getenv("FRAME_CODEC", "")
+SCALED_CACHE_MB: int = int(os.getenv("SCALED_CACHE_MB", "256"))
+SCALED_CACHE_LEVELS: int = int(os.getenv("SCALED_CACHE_LEVELS", "3"))
+PINNED_NEIGHBOURS: int = int(os.getenv("PINNED_NEIGHBOURS", "0"))
+FRAME_MEMO_BUDGET_MB: int = int(os.getenv("FRAME_MEMO_BUDGET_MB", "256"))
+REDRAW_COLLAPSED_POSITIONS: bool = os.getenv("REDRAW_COLLAPSED_POSITIONS", "0") == "1"
+REVERSE_SCAN_BLOCK: int = int(os.getenv("REVERSE_SCAN_BLOCK", "8"))
+PREVIEW_SAMPLING: bool = os.getenv("PREVIEW_SAMPLING", "0") == "1"
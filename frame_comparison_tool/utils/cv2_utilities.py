@@ -1,7 +1,11 @@
+from functools import lru_cache
+
 import cv2
+import numpy as np
 
 from frame_comparison_tool.utils.align import Align
 from frame_comparison_tool.utils.exceptions import InvalidAlignmentError
+from frame_comparison_tool.utils.frame_format import FrameFormat
 
 _FONT_FACE = 2
 _FONT_SCALE = 0.85
@@ -10,6 +14,7 @@ _THICKNESS = 3
 _BORDER_COLOR = (0, 0, 0)
 _BORDER_THICKNESS = 2
 _ALIGN = Align.LEFT
+_SPRITE_CACHE_SIZE = 256
 
 
 def get_text_size(text: str,
@@ -89,3 +94,174 @@ def put_bordered_text(img: cv2.typing.MatLike,
                           color=color, thickness=thickness - border_thickness)
 
     return img
+
+
+@lru_cache(maxsize=_SPRITE_CACHE_SIZE)
+def render_text_sprite(text: str,
+                       align: Align = _ALIGN,
+                       font_face: int = _FONT_FACE,
+                       font_scale: float = _FONT_SCALE,
+                       color: tuple[int, int, int] = _COLOR,
+                       thickness: int = _THICKNESS,
+                       border_color: tuple[int, int, int] = _BORDER_COLOR,
+                       border_thickness: int = _BORDER_THICKNESS) -> tuple[np.ndarray, tuple[int, int]]:
+    """
+    Renders bordered text into a sprite with an alpha channel, cached per distinct text and font parameters.
+
+    The text is drawn with ``put_bordered_text`` once over black and once over white. The difference between the two
+    gives the coverage of every pixel, so blending the sprite reproduces the drawn text, including its smoothed edges.
+    Colors of the sprite are premultiplied by its alpha channel.
+
+    :param text: The text to display, supports multi-line (separated by '\n').
+    :param align: Horizontal text alignment (left, center, or right).
+    :param font_face: Font type.
+    :param font_scale: Font scale factor for text size.
+    :param color: Color of the text.
+    :param thickness: Thickness of the text.
+    :param border_color: Color of the text border.
+    :param border_thickness: Thickness of the text border.
+    :return: Tuple containing the read-only premultiplied sprite and the point (x, y) of the sprite
+             corresponding to the text origin.
+    """
+    sizes = [get_text_size(text=line, font_face=font_face, font_scale=font_scale, thickness=thickness)
+             for line in text.splitlines()]
+    width = max((line_width for line_width, _ in sizes), default=0)
+    height = sum(line_height for _, line_height in sizes)
+
+    # Strokes can extend past the measured text box, the sprite is cropped to the drawn pixels afterward.
+    padding = max((line_height for _, line_height in sizes), default=0)
+
+    if align == Align.LEFT:
+        anchor = (padding, padding)
+    elif align == Align.CENTER:
+        anchor = (padding + int(width / 2), padding)
+    elif align == Align.RIGHT:
+        anchor = (padding + width, padding)
+    else:
+        raise InvalidAlignmentError(align)
+
+    shape = (height + 2 * padding, width + 2 * padding, 3)
+    over_black, over_white = (
+        put_bordered_text(img=np.full(shape, background, dtype=np.uint8), text=text, origin=anchor, align=align,
+                          font_face=font_face, font_scale=font_scale, color=color, thickness=thickness,
+                          border_color=border_color, border_thickness=border_thickness)
+        for background in (0, 255)
+    )
+    alpha = 255 - (over_white.astype(np.int16) - over_black).max(axis=2)
+    sprite = np.dstack((over_black, alpha.astype(np.uint8)))
+
+    rows, columns = np.nonzero(alpha)
+
+    if rows.size:
+        top, left = rows.min(), columns.min()
+        sprite = sprite[top:rows.max() + 1, left:columns.max() + 1].copy()
+        anchor = (anchor[0] - int(left), anchor[1] - int(top))
+
+    sprite.flags.writeable = False
+
+    return sprite, anchor
+
+
+def blend_sprite(img: np.ndarray, sprite: np.ndarray, anchor: tuple[int, int], origin: tuple[int, int]) -> np.ndarray:
+    """
+    Alpha-blends a premultiplied sprite into the image, in place. Only the region covered by the sprite is touched.
+
+    :param img: Image with 3 channels, in the same channel order as the sprite.
+    :param sprite: Premultiplied sprite, the last channel holding the alpha.
+    :param anchor: Point (x, y) of the sprite placed at the origin.
+    :param origin: Point (x, y) of the image.
+    :return: Modified image.
+    """
+    left, top = origin[0] - anchor[0], origin[1] - anchor[1]
+    x0, y0 = max(0, left), max(0, top)
+    x1, y1 = min(img.shape[1], left + sprite.shape[1]), min(img.shape[0], top + sprite.shape[0])
+
+    if x0 >= x1 or y0 >= y1:
+        return img
+
+    region = img[y0:y1, x0:x1]
+    patch = sprite[y0 - top:y1 - top, x0 - left:x1 - left]
+    alpha = patch[..., 3:].astype(np.uint16)
+
+    region[:] = np.minimum((region * (255 - alpha) + 127) // 255 + patch[..., :3], 255).astype(np.uint8)
+
+    return img
+
+
+def put_text_sprite(img: np.ndarray, text: str, origin: tuple[int, int], align: Align = _ALIGN) -> np.ndarray:
+    """
+    Renders bordered text onto the image like ``put_bordered_text``, but blends a cached sprite instead of drawing.
+
+    :param img: The image on which to render the text.
+    :param text: The text to display, supports multi-line (separated by '\n').
+    :param origin: The starting point (x, y) of the text.
+    :param align: Horizontal text alignment (left, center, or right).
+    :return: Modified image with rendered text.
+    """
+    sprite, anchor = render_text_sprite(text=text, align=align)
+
+    return blend_sprite(img=img, sprite=sprite, anchor=anchor, origin=origin)
+
+
+def supports_frame_format(frame_format: FrameFormat, width: int, height: int) -> bool:
+    """
+    Checks whether frames of a given resolution can be stored in a frame format.
+
+    :param frame_format: Frame format.
+    :param width: Frame width.
+    :param height: Frame height.
+    :return: ``True`` if the format can hold the frames, ``False`` otherwise.
+    """
+    if frame_format == FrameFormat.YUV420:
+        # Chroma planes are subsampled by two in both directions.
+        return width % 2 == 0 and height % 2 == 0
+
+    return True
+
+
+def encode_frame(img: cv2.typing.MatLike, frame_format: FrameFormat) -> np.ndarray:
+    """
+    Converts a decoded BGR frame to the layout it is stored in.
+
+    :param img: BGR frame.
+    :param frame_format: Frame format to convert to.
+    :return: Frame in the given format, the frame itself if it is stored as BGR.
+    """
+    if frame_format == FrameFormat.YUV420:
+        return cv2.cvtColor(src=img, code=cv2.COLOR_BGR2YUV_I420)
+
+    return img
+
+
+def decode_frame(frame: np.ndarray, frame_format: FrameFormat) -> np.ndarray:
+    """
+    Converts a stored frame to BGR.
+
+    :param frame: Frame in the given format.
+    :param frame_format: Format of the frame.
+    :return: BGR frame, the frame itself if it is already stored as BGR.
+    """
+    if frame_format == FrameFormat.YUV420:
+        return cv2.cvtColor(src=frame, code=cv2.COLOR_YUV2BGR_I420)
+
+    return frame
+
+
+def resize_to_fit(img: np.ndarray, max_size: tuple[int, int]) -> np.ndarray:
+    """
+    Downscales an image to fit into a bounding box, preserving its aspect ratio.
+    Images are never enlarged.
+
+    :param img: Image to be fitted.
+    :param max_size: Maximal width and height.
+    :return: Resized image, the image itself if it already fits.
+    """
+    height, width = img.shape[:2]
+    scale = min(max_size[0] / width, max_size[1] / height)
+
+    if scale >= 1:
+        return img
+
+    size = (max(1, round(width * scale)), max(1, round(height * scale)))
+
+    return cv2.resize(src=img, dsize=size, interpolation=cv2.INTER_AREA)
@@ -0,0 +1,16 @@
+from enum import Enum
+
+
+class DecodeBackend(Enum):
+    """
+    Enumeration representing where ``FrameLoader`` decoding work is executed.
+    """
+
+    THREAD = 'Thread'
+    """
+    Decode in the application process, on a thread pool.
+    """
+    PROCESS = 'Process'
+    """
+    Decode in child processes, frames are transferred through shared memory.
+    """
@@ -97,6 +97,21 @@ class FramePositionError(Exception):
         super().__init__(self.message)
 
 
+class TaskCancelledError(Exception):
+    """
+    Raised when a running task is cancelled because a newer task superseded it.
+    """
+
+    def __init__(self, message="Task cancelled") -> None:
+        """
+        Initialize a ``TaskCancelledError`` instance.
+
+        :param message: Error message to display.
+        """
+        self.message = message
+        super().__init__(self.message)
+
+
 class InvalidAlignmentError(ValueError):
     """
     Raised when an invalid ``Align`` option is supplied.
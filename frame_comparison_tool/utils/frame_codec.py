@@ -0,0 +1,16 @@
+from enum import Enum
+
+
+class FrameCodec(Enum):
+    """
+    Enumeration representing the lossless codec used by the compressed in-memory frame tier.
+    """
+
+    LZ4 = 'LZ4'
+    """
+    LZ4 over the raw frame bytes, requires the optional ``lz4`` package.
+    """
+    PNG = 'PNG'
+    """
+    PNG with the fastest compression level, encoded with OpenCV.
+    """
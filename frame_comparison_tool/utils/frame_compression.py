@@ -0,0 +1,104 @@
+from dataclasses import dataclass
+
+import cv2
+import numpy as np
+from loguru import logger
+
+from frame_comparison_tool.utils.frame_codec import FrameCodec
+
+try:
+    import lz4.frame
+except ImportError:
+    lz4 = None
+
+
+@dataclass(frozen=True)
+class CompressedFrame:
+    """
+    Class containing a losslessly compressed frame.
+    """
+
+    payload: bytes
+    """
+    Compressed frame bytes.
+    """
+    shape: tuple[int, ...]
+    """
+    Frame shape.
+    """
+    dtype: np.dtype
+    """
+    Frame data type.
+    """
+    codec: FrameCodec
+    """
+    Codec the frame was compressed with.
+    """
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Gets the size of the compressed frame.
+
+        :return: Number of compressed bytes.
+        """
+        return len(self.payload)
+
+    @property
+    def raw_nbytes(self) -> int:
+        """
+        Gets the size of the frame before compression.
+
+        :return: Number of uncompressed bytes.
+        """
+        return int(np.prod(self.shape)) * self.dtype.itemsize
+
+
+def default_frame_codec(name: str = '') -> FrameCodec:
+    """
+    Selects the codec of the compressed frame tier.
+
+    :param name: Name of the requested codec, an empty string selects LZ4 if it is installed and PNG otherwise.
+    :return: Selected codec, PNG if LZ4 was requested but is not installed.
+    """
+    codec = FrameCodec(name) if name else FrameCodec.LZ4
+
+    if codec == FrameCodec.LZ4 and lz4 is None:
+        if name:
+            logger.warning("The lz4 package is not installed, compressing frames with PNG instead")
+
+        return FrameCodec.PNG
+
+    return codec
+
+
+def compress_frame(frame: np.ndarray, codec: FrameCodec) -> CompressedFrame:
+    """
+    Compresses a frame losslessly.
+
+    :param frame: Frame to be compressed, either interleaved with 3 channels or a single plane.
+    :param codec: Codec to compress with.
+    :return: Compressed frame.
+    """
+    if codec == FrameCodec.LZ4:
+        payload = lz4.frame.compress(np.ascontiguousarray(frame).tobytes())
+    else:
+        _, encoded = cv2.imencode('.png', frame, [cv2.IMWRITE_PNG_COMPRESSION, 1])
+        payload = encoded.tobytes()
+
+    return CompressedFrame(payload=payload, shape=frame.shape, dtype=frame.dtype, codec=codec)
+
+
+def decompress_frame(compressed: CompressedFrame) -> np.ndarray:
+    """
+    Restores a compressed frame.
+
+    :param compressed: Compressed frame.
+    :return: Frame identical to the one that was compressed.
+    """
+    if compressed.codec == FrameCodec.LZ4:
+        buffer = lz4.frame.decompress(compressed.payload, return_bytearray=True)
+        return np.frombuffer(buffer, dtype=compressed.dtype).reshape(compressed.shape)
+
+    encoded = np.frombuffer(compressed.payload, dtype=np.uint8)
+    return cv2.imdecode(encoded, cv2.IMREAD_UNCHANGED).reshape(compressed.shape)
@@ -1,7 +1,5 @@
 from dataclasses import dataclass
 
-import numpy as np
-
 from frame_comparison_tool.utils import FrameType
 
 
@@ -19,11 +17,16 @@ class FrameData:
     """
     Real frame position. The first position from the `original_frame_position` that matched the `frame_type`.
     """
-    frame: np.ndarray
+    frame_key: int
     """
-    Frame to be displayed.
+    Key of the frame to be displayed in the ``FrameStore`` of the loader.
     """
     frame_type: FrameType
     """
     Frame type.
     """
+    preview: bool = False
+    """
+    Whether the frame is a keyframe close to the sampled position, displayed until the frame matching the `frame_type`
+    is decoded. The `real_frame_position` is the position of the keyframe.
+    """
@@ -0,0 +1,16 @@
+from enum import Enum
+
+
+class FrameFormat(Enum):
+    """
+    Enumeration representing the pixel layout decoded frames are stored in.
+    """
+
+    BGR = 'BGR'
+    """
+    Interleaved BGR as produced by the decoder, 3 bytes per pixel. Stored and displayed without conversion.
+    """
+    YUV420 = 'YUV420'
+    """
+    Planar YUV 4:2:0 (I420), 1.5 bytes per pixel. Converted to BGR only when a frame is displayed or saved.
+    """
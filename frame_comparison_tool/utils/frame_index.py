@@ -0,0 +1,173 @@
+import threading
+from bisect import bisect_left, bisect_right
+from typing import Optional
+
+import cv2
+
+from frame_comparison_tool.utils.direction import Direction
+from frame_comparison_tool.utils.exceptions import TaskCancelledError
+from frame_comparison_tool.utils.frame_type import FrameType
+
+
+class FrameIndex:
+    """
+    Index of frame types and keyframes of a single video file.
+
+    The index is built once by a streaming scan over the whole file and afterwards allows finding the closest frame
+    of a certain type with a binary search, without decoding any frames.
+
+    Keyframes are the I-frames of the video. ``CAP_PROP_FRAME_TYPE`` only reports the picture type, so an I-frame that
+    is not a random access point, e.g. in an open group of pictures, counts as a keyframe too.
+    """
+
+    def __init__(self, frame_types: list[FrameType]):
+        """
+        Initializes a ``FrameIndex`` instance.
+
+        :param frame_types: Frame type of every frame in the video, indexed by frame position.
+        """
+        self._frame_types: list[FrameType] = frame_types
+        """Frame type of every frame, indexed by frame position."""
+        self._positions: dict[FrameType, list[int]] = {}
+        """Sorted frame positions grouped by frame type."""
+
+        for frame_position, frame_type in enumerate(frame_types):
+            self._positions.setdefault(frame_type, []).append(frame_position)
+
+    @classmethod
+    def build(cls, video_capture: cv2.VideoCapture, cancel_event: Optional[threading.Event] = None) -> 'FrameIndex':
+        """
+        Builds the index by grabbing every frame of the video from the start, without retrieving the pixel data.
+
+        :param video_capture: Opened ``VideoCapture`` object, its position is moved to the end of the video.
+        :param cancel_event: Optional event, checked before grabbing each frame.
+        :return: ``FrameIndex`` of the video.
+        :raises ``TaskCancelledError``: If the cancel event is set.
+        """
+        frame_types: list[FrameType] = []
+
+        video_capture.set(cv2.CAP_PROP_POS_FRAMES, 0)
+
+        while video_capture.grab():
+            frame_types.append(to_frame_type(video_capture.get(cv2.CAP_PROP_FRAME_TYPE)))
+
+            if cancel_event is not None and cancel_event.is_set():
+                raise TaskCancelledError()
+
+        return cls(frame_types=frame_types)
+
+    @classmethod
+    def from_string(cls, frame_types: str) -> 'FrameIndex':
+        """
+        Creates the index from its string representation.
+
+        :param frame_types: String containing one ``CAP_PROP_FRAME_TYPE`` character per frame.
+        :return: ``FrameIndex`` described by the string.
+        """
+        return cls(frame_types=[to_frame_type(ord(char)) for char in frame_types])
+
+    def to_string(self) -> str:
+        """
+        Serializes the index to a compact string, one ``CAP_PROP_FRAME_TYPE`` character per frame.
+
+        :return: String representation of the index.
+        """
+        return ''.join(chr(frame_type.values[1]) for frame_type in self._frame_types)
+
+    def __len__(self) -> int:
+        """
+        Gets the number of indexed frames.
+
+        :return: Number of frames in the video.
+        """
+        return len(self._frame_types)
+
+    @property
+    def keyframes(self) -> list[int]:
+        """
+        Gets the positions of all keyframes, i.e. I-frames.
+
+        :return: Sorted list of keyframe positions.
+        """
+        return self._positions.get(FrameType.I_TYPE, [])
+
+    def frame_type(self, frame_position: int) -> FrameType:
+        """
+        Gets the type of the frame at a given position.
+
+        :param frame_position: Position of the frame.
+        :return: Frame type.
+        """
+        return self._frame_types[frame_position]
+
+    def is_keyframe(self, frame_position: int) -> bool:
+        """
+        Checks whether the frame at a given position is a keyframe, i.e. an I-frame.
+
+        :param frame_position: Position of the frame.
+        :return: ``True`` if the frame is a keyframe, ``False`` otherwise.
+        """
+        return self._frame_types[frame_position] == FrameType.I_TYPE
+
+    def previous_keyframe(self, frame_position: int) -> Optional[int]:
+        """
+        Gets the position of the closest keyframe at or before a given position.
+
+        :param frame_position: Position of the frame.
+        :return: Position of the keyframe, ``None`` if there is no keyframe before the given position.
+        """
+        keyframes = self.keyframes
+        idx = bisect_right(keyframes, frame_position)
+
+        return keyframes[idx - 1] if idx > 0 else None
+
+    def nearest_keyframe(self, frame_position: int) -> Optional[int]:
+        """
+        Gets the position of the keyframe closest to a given position in either direction, the earlier one on a tie.
+
+        :param frame_position: Position of the frame.
+        :return: Position of the keyframe, ``None`` if the video has no keyframe.
+        """
+        keyframes = self.keyframes
+        idx = bisect_right(keyframes, frame_position)
+        candidates = keyframes[max(0, idx - 1):idx + 1]
+
+        return min(candidates, key=lambda keyframe: abs(keyframe - frame_position), default=None)
+
+    def find_closest(self, frame_position: int, direction: Direction, frame_type: FrameType,
+                     max_distance: int) -> Optional[int]:
+        """
+        Finds the closest frame of a specific type, starting from a given position (inclusive).
+
+        :param frame_position: Starting frame position.
+        :param direction: Search direction.
+        :param frame_type: Desired frame type.
+        :param max_distance: Maximal distance between the starting position and the found frame, exclusive forward and
+                             inclusive backward, like the search windows of the scans in ``FrameLoader``.
+        :return: Position of the found frame, ``None`` if no frame matched within the distance.
+        """
+        positions = self._positions.get(frame_type, [])
+
+        if direction == Direction.FORWARD:
+            idx = bisect_left(positions, frame_position)
+            if idx < len(positions) and positions[idx] - frame_position < max_distance:
+                return positions[idx]
+        else:
+            idx = bisect_right(positions, frame_position)
+            if idx > 0 and frame_position - positions[idx - 1] <= max_distance:
+                return positions[idx - 1]
+
+        return None
+
+
+def to_frame_type(value: float) -> FrameType:
+    """
+    Converts a ``CAP_PROP_FRAME_TYPE`` value to a ``FrameType``.
+
+    :param value: Value returned by the ``VideoCapture`` object.
+    :return: Matching frame type, ``FrameType.UNKNOWN`` for unsupported values.
+    """
+    try:
+        return FrameType(int(value))
+    except ValueError:
+        return FrameType.UNKNOWN
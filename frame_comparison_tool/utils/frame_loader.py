@@ -1,14 +1,29 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, Future
+from dataclasses import replace
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Callable, Iterator
 
 import cv2
 import numpy as np
+from loguru import logger
 
-from frame_comparison_tool.utils import put_bordered_text, Align, FrameType, Direction
+from frame_comparison_tool.utils import put_text_sprite, Align, FrameType, Direction
+from frame_comparison_tool.utils.cv2_utilities import encode_frame, decode_frame, supports_frame_format
 from frame_comparison_tool.utils.exceptions import NoMatchingFrameTypeError, ImageReadError, VideoCaptureFailed, \
-    FramePositionError, InvalidDirectionError
+    FramePositionError, InvalidDirectionError, TaskCancelledError
 from frame_comparison_tool.utils.frame_data import FrameData
-from frame_comparison_tool.utils.config import MAX_FRAMES_TO_SEARCH
+from frame_comparison_tool.utils.frame_index import FrameIndex
+from frame_comparison_tool.utils.frame_memo import FrameMemo
+from frame_comparison_tool.utils.frame_prefetcher import FramePrefetcher
+from frame_comparison_tool.utils.frame_store import FrameStore
+from frame_comparison_tool.utils.probe_cache import ProbeCache, ProbeResult
+from frame_comparison_tool.utils.process_decoder import ProcessDecoder
+from frame_comparison_tool.utils.seek_action import SeekAction
+from frame_comparison_tool.utils.seek_planner import SeekCosts, SeekPlan, plan_seeks
+from frame_comparison_tool.utils.config import MAX_FRAMES_TO_SEARCH, BUILD_FRAME_INDEX, REVERSE_SCAN_BLOCK
+from frame_comparison_tool.utils.frame_format import FrameFormat
 
 
 class FrameLoader:
@@ -24,23 +39,120 @@ class FrameLoader:
     The loader maintains the internal state of loaded frames and their metadata.
     """
 
-    def __init__(self, file_path: Path):
+    def __init__(self, file_path: Path, probe_cache: Optional[ProbeCache] = None,
+                 frame_store: Optional[FrameStore] = None, frame_format: FrameFormat = FrameFormat.BGR,
+                 frame_memo: Optional[FrameMemo] = None):
         """
         Initializes a ``FrameLoader`` instance with a video file.
 
         :param file_path: Path to the video file to be loaded.
+        :param probe_cache: Optional cache of probe results, used to skip probing of previously opened files.
+        :param frame_store: Optional store of decoded frames, shared between loaders. Defaults to a store without
+                            a memory budget.
+        :param frame_format: Layout the decoded frames are stored in. Frames are stored as BGR if the resolution
+                             of the video is not supported by the format.
+        :param frame_memo: Optional memo of frame search results, shared between loaders. Must remember frames of
+                           `frame_store`. Defaults to a memo of this loader alone.
         """
         self._file_path: Path = file_path
         self._video_capture: cv2.VideoCapture = cv2.VideoCapture(filename=str(self._file_path.absolute()))
-        self.frame_data: list[FrameData] = []
-        self._total_frames: int = self._get_frame_count()
+        self._video_captures: list[cv2.VideoCapture] = []
+        """Additional ``VideoCapture`` objects used for sharded sampling, opened on demand."""
+        self.frame_data: list[Optional[FrameData]] = []
+        """Sampled frames, ``None`` for frames that were not decoded yet."""
+        self.frame_store: FrameStore = frame_store or FrameStore(budget_bytes=0)
+        """Store holding the decoded frames referenced by `frame_data`."""
+        self.frame_memo: FrameMemo = frame_memo or FrameMemo(frame_store=self.frame_store)
+        """Memo of frame search results, serving previously used configurations without decoding."""
+        self.frame_index: Optional[FrameIndex] = None
+        """Frame type index, built in the background on first use if enabled."""
+        self._index_executor: Optional[ThreadPoolExecutor] = None
+        """Single background thread building the frame type index, started on first use."""
+        self._index_build: Optional[Future] = None
+        """Background build of the frame type index."""
+        self._index_cancel_event = threading.Event()
+        """Event cancelling the background build of the frame type index."""
+        self._index_lock = threading.Lock()
+        self.prefetcher: FramePrefetcher = FramePrefetcher(frame_loader=self)
+        """Background prefetcher of the frames reached by offsets."""
+        self.seek_costs: SeekCosts = SeekCosts()
+        """Measured costs of seeking and grabbing, used to plan sampling."""
+        self.seek_plans: list[SeekPlan] = []
+        """Seek plans executed by the last sampling, one per shard."""
+        self._probe_cache: Optional[ProbeCache] = probe_cache
+        self._probe_result: ProbeResult = self._probe()
+        self._total_frames: int = self._probe_result.total_frames
+        self._frame_count_correction: Optional[int] = None
+        """Corrected total number of frames, ``None`` if it was not corrected since it was last reported."""
+        self.frame_format: FrameFormat = (
+            frame_format if supports_frame_format(frame_format, *self.resolution) else FrameFormat.BGR
+        )
+        """Layout the decoded frames are stored in."""
 
-    def _get_frame_count(self) -> int:
+    def _probe(self) -> ProbeResult:
         """
-        Returns the true total number of frames in the video file.
+        Probes the video file properties, using the probe cache if possible.
+
+        :return: Probe result of the video file.
+        """
+        if self._probe_cache is not None:
+            probe_result = self._probe_cache.load(self._file_path)
+
+            if probe_result is not None:
+                if probe_result.frame_types:
+                    self.frame_index = FrameIndex.from_string(probe_result.frame_types)
+
+                return probe_result
+
+        total_frames, frame_count_exact = self._get_frame_count()
+        probe_result = ProbeResult(total_frames=total_frames,
+                                   width=int(self._video_capture.get(cv2.CAP_PROP_FRAME_WIDTH)),
+                                   height=int(self._video_capture.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+                                   fps=self._video_capture.get(cv2.CAP_PROP_FPS),
+                                   frame_count_exact=frame_count_exact)
+        self._store_probe_result(probe_result)
+
+        return probe_result
+
+    def _store_probe_result(self, probe_result: ProbeResult) -> None:
+        """
+        Updates the probe result and stores it to the probe cache.
+
+        :param probe_result: New probe result.
+        """
+        self._probe_result = probe_result
+
+        if self._probe_cache is not None and self._video_capture.isOpened():
+            self._probe_cache.store(self._file_path, probe_result)
+
+    def _get_frame_count(self) -> tuple[int, bool]:
+        """
+        Returns the number of frames reported by the container, confirmed with a single seek near the end.
+
+        :return: Tuple containing the position of the last frame and ``True`` if the position was confirmed.
         """
 
-        r_frame_idx = int(self._video_capture.get(cv2.CAP_PROP_FRAME_COUNT)) - 1
+        last_frame_idx = int(self._video_capture.get(cv2.CAP_PROP_FRAME_COUNT)) - 1
+
+        if last_frame_idx < 0:
+            return 0, True
+
+        try:
+            self._set_frame_position(last_frame_idx)
+            self._get_frame()
+            return last_frame_idx, True
+        except (FramePositionError, ImageReadError, VideoCaptureFailed):
+            return last_frame_idx, False
+
+    def _search_frame_count(self, last_frame_idx: int) -> int:
+        """
+        Returns the true total number of frames in the video file, using a binary search over frame positions.
+
+        :param last_frame_idx: Upper bound of the last frame position.
+        :return: Position of the last readable frame.
+        """
+
+        r_frame_idx = last_frame_idx
         l_frame_idx = 0
 
         last_valid_index = 0
@@ -60,6 +172,43 @@ class FrameLoader:
 
         return last_valid_index
 
+    def refine_frame_count(self) -> int:
+        """
+        Replaces the provisional frame count with the true one. Does nothing if the count is already exact.
+        The count is searched for with a few seeks, without waiting for the frame type index, whose build corrects
+        the count again once it is done.
+
+        :return: Position of the last readable frame.
+        """
+
+        if not self.frame_count_exact and self.frame_index is None:
+            self._set_total_frames(self._search_frame_count(last_frame_idx=self._total_frames))
+            self._store_probe_result(replace(self._probe_result,
+                                             total_frames=self._total_frames,
+                                             frame_count_exact=True))
+
+        return self._total_frames
+
+    def _set_total_frames(self, total_frames: int) -> None:
+        """
+        Sets the exact total number of frames, recording a correction if it differs from the current one.
+
+        :param total_frames: Position of the last readable frame.
+        """
+        if total_frames != self._total_frames:
+            self._total_frames = total_frames
+            self._frame_count_correction = total_frames
+
+    def pop_frame_count_correction(self) -> Optional[int]:
+        """
+        Gets and clears the correction of the total number of frames made since the last call.
+
+        :return: Corrected position of the last readable frame, ``None`` if the total number of frames did not change.
+        """
+        correction, self._frame_count_correction = self._frame_count_correction, None
+
+        return correction
+
     @property
     def file_name(self) -> str:
         """
@@ -69,6 +218,15 @@ class FrameLoader:
         """
         return self._file_path.name
 
+    @property
+    def file_path(self) -> Path:
+        """
+        Gets the path of the loaded video file.
+
+        :return: Path to the selected video.
+        """
+        return self._file_path
+
     @property
     def total_frames(self) -> int:
         """
@@ -78,16 +236,146 @@ class FrameLoader:
         """
         return self._total_frames
 
-    def _get_frame(self) -> Optional[cv2.typing.MatLike]:
+    @total_frames.setter
+    def total_frames(self, total_frames: int) -> None:
+        """
+        Sets the total number of frames known to another loader of the video, e.g. the one of the application process
+        for a loader of a child process. No correction is recorded.
+
+        :param total_frames: Position of the last frame.
+        """
+        self._total_frames = total_frames
+
+    @property
+    def frame_count_exact(self) -> bool:
+        """
+        Checks whether the total number of frames is exact or provisional (reported by the container).
+
+        :return: ``True`` if the total number of frames was confirmed, ``False`` otherwise.
+        """
+        return self._probe_result.frame_count_exact
+
+    @property
+    def resolution(self) -> tuple[int, int]:
+        """
+        Gets the resolution of the loaded video.
+
+        :return: Tuple containing the frame width and height.
+        """
+        return self._probe_result.width, self._probe_result.height
+
+    @property
+    def fps(self) -> float:
+        """
+        Gets the frame rate of the loaded video.
+
+        :return: Frames per second.
+        """
+        return self._probe_result.fps
+
+    def build_frame_index(self, cancel_event: Optional[threading.Event] = None) -> FrameIndex:
+        """
+        Builds the frame type index with a single streaming scan over the video and corrects the total frame count.
+        The scan uses its own ``VideoCapture`` object, so frames can be decoded while the index is built.
+
+        :param cancel_event: Optional event, the scan stops once it is set.
+        :return: Built ``FrameIndex``.
+        :raises ``VideoCaptureFailed``: If the video file cannot be opened.
+        :raises ``TaskCancelledError``: If the cancel event is set.
+        """
+        video_capture = cv2.VideoCapture(filename=str(self._file_path.absolute()))
+
+        try:
+            if not video_capture.isOpened():
+                raise VideoCaptureFailed()
+
+            frame_index = FrameIndex.build(video_capture, cancel_event=cancel_event)
+        finally:
+            video_capture.release()
+
+        if len(frame_index) > 0:
+            self._set_total_frames(len(frame_index) - 1)
+
+        self.frame_index = frame_index
+        self._store_probe_result(replace(self._probe_result,
+                                         total_frames=self._total_frames,
+                                         frame_count_exact=True,
+                                         frame_types=frame_index.to_string()))
+
+        return frame_index
+
+    def _build_frame_index_in_background(self) -> None:
+        """
+        Builds the frame type index, logging failures instead of raising them. Runs on the background thread.
+        """
+        try:
+            self.build_frame_index(cancel_event=self._index_cancel_event)
+            logger.debug(f"Built the frame type index of {self.file_name}")
+        except TaskCancelledError:
+            pass
+        except (VideoCaptureFailed, cv2.error) as e:
+            logger.warning(f"Could not build the frame type index of {self.file_name}: {e}")
+
+    def ensure_frame_index(self, wait: bool = False) -> Optional[FrameIndex]:
+        """
+        Gets the frame type index, starting to build it in the background if it is enabled and was not started yet.
+        Until the index is built, frames are found by decoding them.
+
+        :param wait: Whether to wait until the index is built.
+        :return: ``FrameIndex`` of the video, ``None`` if it is disabled, not built yet, or could not be built.
+        """
+        if not BUILD_FRAME_INDEX or self.frame_index is not None:
+            return self.frame_index
+
+        with self._index_lock:
+            if self._index_build is None:
+                self._index_executor = ThreadPoolExecutor(max_workers=1)
+                self._index_build = self._index_executor.submit(self._build_frame_index_in_background)
+
+        if wait:
+            self._index_build.result()
+
+        return self.frame_index
+
+    def close(self) -> None:
+        """
+        Stops the background work of the loader, the build of the frame type index and prefetching, and releases
+        all ``VideoCapture`` objects. The loader cannot decode frames afterward.
+        """
+        self._index_cancel_event.set()
+        self.prefetcher.shutdown()
+
+        if self._index_executor is not None:
+            self._index_executor.shutdown(wait=True)
+
+        for video_capture in [self._video_capture, *self._video_captures]:
+            video_capture.release()
+
+        self._video_captures.clear()
+
+    def discard_frames(self) -> None:
+        """
+        Removes all sampled frames, releasing their references in the frame store.
+        """
+        frame_data, self.frame_data = self.frame_data, []
+
+        for previous_frame_data in frame_data:
+            if previous_frame_data is not None:
+                self.frame_store.discard(previous_frame_data.frame_key)
+
+    def _get_frame(self, video_capture: Optional[cv2.VideoCapture] = None) -> Optional[cv2.typing.MatLike]:
         """
         Reads the current frame from the ``VideoCapture`` object.
 
+        :param video_capture: ``VideoCapture`` object to read from, defaults to the main one.
         :return: Video frame if available, ``None`` otherwise.
         :raises ``ImageReadError``: If frame reading fails.
         :raises ``VideoCaptureFailed``: If the ``VideoCapture`` object is not open.
         """
-        if self._video_capture.isOpened():
-            success, image = self._video_capture.read()
+        video_capture = video_capture or self._video_capture
+
+        if video_capture.isOpened():
+            success, image = video_capture.read()
             if success:
                 return image
             else:
@@ -95,156 +383,957 @@ class FrameLoader:
         else:
             raise VideoCaptureFailed()
 
-    def _set_frame_position(self, frame_position: int) -> None:
+    def _grab_frame(self, video_capture: Optional[cv2.VideoCapture] = None) -> FrameType:
+        """
+        Decodes the next frame without converting its pixel data, which can be retrieved with ``_retrieve_frame``.
+
+        :param video_capture: ``VideoCapture`` object to decode with, defaults to the main one.
+        :return: Frame type of the decoded frame.
+        :raises ``ImageReadError``: If frame decoding fails.
+        :raises ``VideoCaptureFailed``: If the ``VideoCapture`` object is not open.
+        """
+        video_capture = video_capture or self._video_capture
+
+        if not video_capture.isOpened():
+            raise VideoCaptureFailed()
+
+        if not video_capture.grab():
+            raise ImageReadError(source=self._file_path)
+
+        return self._get_frame_type(video_capture=video_capture)
+
+    def _retrieve_frame(self, video_capture: Optional[cv2.VideoCapture] = None) -> cv2.typing.MatLike:
+        """
+        Converts the pixel data of the frame decoded by the last ``_grab_frame``.
+
+        :param video_capture: ``VideoCapture`` object to retrieve from, defaults to the main one.
+        :return: Video frame.
+        :raises ``ImageReadError``: If frame retrieval fails.
+        """
+        success, image = (video_capture or self._video_capture).retrieve()
+
+        if not success:
+            raise ImageReadError(source=self._file_path)
+
+        return image
+
+    def _set_frame_position(self, frame_position: int, video_capture: Optional[cv2.VideoCapture] = None) -> None:
         """
         Sets the ``VideoCapture`` object to a specific frame position.
 
         :param frame_position: Position of the frame to be set.
+        :param video_capture: ``VideoCapture`` object to seek, defaults to the main one.
         :raises ``FramePositionError``: If the frame position if invalid.
         """
-        if self._video_capture.isOpened():
-            self._video_capture.set(cv2.CAP_PROP_POS_FRAMES, frame_position)
+        video_capture = video_capture or self._video_capture
+
+        if video_capture.isOpened():
+            video_capture.set(cv2.CAP_PROP_POS_FRAMES, frame_position)
         else:
             raise FramePositionError(frame_position)
 
-    def _get_frame_type(self) -> FrameType:
+    def _get_frame_type(self, video_capture: Optional[cv2.VideoCapture] = None) -> FrameType:
         """
-        Retrieves the frame type. Should only be used after the frame position is set in the ``VideoCapture`` object.
+        Retrieves the frame type of the last decoded frame. Right after a seek, the type of the frame before the new
+        position is reported, so the type must be read after the frame is decoded.
 
+        :param video_capture: ``VideoCapture`` object to query, defaults to the main one.
         :return: Frame type of current video frame.
         """
-        frame_type = int(self._video_capture.get(cv2.CAP_PROP_FRAME_TYPE))
+        video_capture = video_capture or self._video_capture
+        frame_type = int(video_capture.get(cv2.CAP_PROP_FRAME_TYPE))
         return FrameType(frame_type)
 
-    def _get_composited_image(self, frame_position: int, image: np.ndarray, frame_type: FrameType) -> np.ndarray:
+    def _get_composited_image(self, frame_position: int, image: np.ndarray, frame_type: FrameType,
+                              preview: bool = False) -> np.ndarray:
         """
-        Gets the frame with added text information.
+        Adds text information to the frame, blending cached text sprites into the image in place.
 
         :param frame_position: Position of current frame.
-        :param image: Original frame image.
+        :param image: Frame image, modified in place.
         :param frame_type: Type of the current frame.
-        :return: New image with text overlay added.
+        :param preview: Whether the frame is a preview keyframe, which is marked in the text.
+        :return: Image with text overlay added.
         """
         source = self.file_name
+        frame_type_name = f'{FrameType.I_TYPE.name} (PREVIEW)' if preview else frame_type.name
 
-        frame = put_bordered_text(img=image, text=f'SOURCE: {source}', origin=(0, 0))
-        frame = put_bordered_text(img=frame,
-                                  text=f'FRAME TYPE: {frame_type.name}\nFRAME: {frame_position}/{self.total_frames}',
-                                  origin=(frame.shape[1], 0), align=Align.RIGHT)
+        frame = put_text_sprite(img=image, text=f'SOURCE: {source}', origin=(0, 0))
+        frame = put_text_sprite(img=frame,
+                                text=f'FRAME TYPE: {frame_type_name}\nFRAME: {frame_position}/{self.total_frames}',
+                                origin=(frame.shape[1], 0), align=Align.RIGHT)
         return frame
 
-    def _find_closest_frame(self, frame_position: int, direction: Direction, frame_type: FrameType) \
-            -> tuple[int, np.ndarray]:
+    def _find_closest_frame(self, frame_position: int, direction: Direction, frame_type: FrameType,
+                            video_capture: Optional[cv2.VideoCapture] = None,
+                            seek: bool = True) -> tuple[int, np.ndarray]:
         """
         Returns closest frame of specific frame type, starting from given position.
+        Candidates are only grabbed to read their frame type, the pixel data of the found frame alone is retrieved.
+        Backward searches without the frame type index are done with a reverse scan, see ``_find_previous_frame``.
 
         :param frame_position: Starting frame position to search from.
         :param frame_type: Desired frame type.
+        :param video_capture: ``VideoCapture`` object to decode with, defaults to the main one.
+        :param seek: Whether to seek to the first decoded position. If ``False``, the ``VideoCapture`` object must be
+                     at that position already. Ignored by backward searches.
         :return: Tuple containing the position of the found frame and the frame itself.
         :raises ``NoMatchingFrameTypeError``: If no frame of matching type was found.
         """
-        self._set_frame_position(frame_position)
+        if self.frame_index is not None:
+            return self._find_indexed_frame(frame_position=frame_position, direction=direction,
+                                            frame_type=frame_type, video_capture=video_capture, seek=seek)
+
+        if direction == Direction.BACKWARD:
+            return self._find_previous_frame(frame_position=frame_position, frame_type=frame_type,
+                                             video_capture=video_capture)
+
+        if seek:
+            self._set_frame_position(frame_position, video_capture=video_capture)
 
         min_frames_delta: int = frame_position - MAX_FRAMES_TO_SEARCH
         max_frames_delta: int = frame_position + MAX_FRAMES_TO_SEARCH
 
-        while max(0, min_frames_delta) <= frame_position < min(self.total_frames, max_frames_delta):
-            curr_frame_type = self._get_frame_type()
-            curr_frame = self._get_frame()
-
-            if curr_frame_type == frame_type:
-                return frame_position, curr_frame
+        while max(0, min_frames_delta) <= frame_position < max_frames_delta and frame_position <= self.total_frames:
+            if self._grab_frame(video_capture=video_capture) == frame_type:
+                return frame_position, self._retrieve_frame(video_capture=video_capture)
             else:
                 frame_position += direction
 
-            if direction == Direction.BACKWARD and frame_position >= 0:
-                self._set_frame_position(frame_position)
+        raise NoMatchingFrameTypeError(frame_type.value)
+
+    def _find_previous_frame(self, frame_position: int, frame_type: FrameType,
+                             video_capture: Optional[cv2.VideoCapture] = None) -> tuple[int, np.ndarray]:
+        """
+        Returns closest frame of specific frame type at or before the given position, with a reverse scan.
+
+        The search window is scanned in blocks, from its end towards its start. Every block is reached with a single
+        seek and decoded forward with ``grab``, recording the frame types. Only matching frames are retrieved, the last
+        one of the first block containing a match is returned. Blocks start at `REVERSE_SCAN_BLOCK` frames and double
+        in size, so a close match needs a short scan and a distant one only a few seeks, instead of one seek per frame.
+
+        :param frame_position: Starting frame position to search from.
+        :param frame_type: Desired frame type.
+        :param video_capture: ``VideoCapture`` object to decode with, defaults to the main one.
+        :return: Tuple containing the position of the found frame and the frame itself.
+        :raises ``NoMatchingFrameTypeError``: If no frame of matching type was found.
+        :raises ``ImageReadError``: If frame reading fails.
+        """
+        video_capture = video_capture or self._video_capture
+        min_frame_position = max(0, frame_position - MAX_FRAMES_TO_SEARCH)
+        block_end = min(frame_position, self.total_frames)
+        block_size = max(1, REVERSE_SCAN_BLOCK)
+
+        while block_end >= min_frame_position:
+            block_start = max(min_frame_position, block_end - block_size + 1)
+            found: Optional[tuple[int, np.ndarray]] = None
+
+            self._set_frame_position(block_start, video_capture=video_capture)
+
+            for position in range(block_start, block_end + 1):
+                if self._grab_frame(video_capture=video_capture) == frame_type:
+                    found = position, self._retrieve_frame(video_capture=video_capture)
+
+            if found is not None:
+                return found
+
+            block_end = block_start - 1
+            block_size *= 2
 
         raise NoMatchingFrameTypeError(frame_type.value)
 
-    def offset(self, frame_idx: int, direction: Direction) -> None:
+    def _find_indexed_frame(self, frame_position: int, direction: Direction, frame_type: FrameType,
+                            video_capture: Optional[cv2.VideoCapture] = None,
+                            seek: bool = True) -> tuple[int, np.ndarray]:
+        """
+        Returns closest frame of specific frame type using the frame type index, with a single seek and decode.
+
+        :param frame_position: Starting frame position to search from.
+        :param direction: Search direction.
+        :param frame_type: Desired frame type.
+        :param video_capture: ``VideoCapture`` object to decode with, defaults to the main one.
+        :param seek: Whether to seek to the found frame. If ``False``, the ``VideoCapture`` object must be at or
+                     before its position and grabs forward to it.
+        :return: Tuple containing the position of the found frame and the frame itself.
+        :raises ``NoMatchingFrameTypeError``: If no frame of matching type was found.
+        :raises ``ImageReadError``: If frame reading fails.
+        """
+        found_position = self.frame_index.find_closest(frame_position=frame_position,
+                                                       direction=direction,
+                                                       frame_type=frame_type,
+                                                       max_distance=MAX_FRAMES_TO_SEARCH)
+
+        if found_position is None:
+            raise NoMatchingFrameTypeError(frame_type.value)
+
+        if seek:
+            self._set_frame_position(found_position, video_capture=video_capture)
+        else:
+            # The decoding may have been planned before the index was built, at the starting position.
+            for _ in range(found_position - int((video_capture or self._video_capture).get(cv2.CAP_PROP_POS_FRAMES))):
+                self._grab_frame(video_capture=video_capture)
+
+        return found_position, self._get_frame(video_capture=video_capture)
+
+    def get_frame(self, frame_idx: int, overlay: bool = True) -> Optional[np.ndarray]:
+        """
+        Gets a sampled frame from the frame store, converted to BGR.
+
+        :param frame_idx: Index of the frame.
+        :param overlay: Whether to add the text information to the frame. The stored frame is never modified.
+        :return: BGR frame at the given index, ``None`` if it was not decoded yet. Without the overlay, the stored
+                 frame itself may be returned and must not be modified.
+        """
+        for _ in range(2):
+            if (frame_data := self.frame_data[frame_idx]) is None:
+                return None
+
+            try:
+                stored_frame = self.frame_store.get(frame_data.frame_key)
+            except KeyError:
+                # The frame was replaced concurrently, its successor is already set.
+                continue
+
+            frame = decode_frame(stored_frame, self.frame_format)
+
+            if overlay:
+                frame = self._get_composited_image(frame_position=frame_data.real_frame_position,
+                                                   image=frame.copy() if frame is stored_frame else frame,
+                                                   frame_type=frame_data.frame_type,
+                                                   preview=frame_data.preview)
+
+            return frame
+
+        return None
+
+    def _set_frame_data(self, frame_idx: int, frame_data: Optional[FrameData]) -> None:
+        """
+        Replaces the frame data at an index, removing the replaced frame from the frame store.
+
+        :param frame_idx: Index of the frame.
+        :param frame_data: New frame data.
+        """
+        previous_frame_data = self.frame_data[frame_idx]
+        self.frame_data[frame_idx] = frame_data
+
+        if previous_frame_data is not None and (frame_data is None
+                                                or frame_data.frame_key != previous_frame_data.frame_key):
+            self.frame_store.discard(previous_frame_data.frame_key)
+
+    def offset(self, frame_idx: int, direction: Direction, steps: int = 1) -> None:
         """
         Retrieves a new frame based on the current frame position, direction, and desired frame type.
 
-        :param frame_idx: Current frame index.
+        :param frame_idx: Current frame index. Nothing is offset if the frame was not sampled yet or is a preview
+                          frame of ``preview_frames``.
         :param direction: Enum representing the moving direction.
+        :param steps: Number of matching frames to move by. Only the final frame is decoded if the frame type index
+                      is available. The frame is taken from the prefetcher if all steps were prefetched.
         :return: A tuple containing the new frame's position and the frame itself.
         :raises ``InvalidOffsetError``: If the passed direction is zero.
         """
 
-        starting_position: int = self.frame_data[frame_idx].real_frame_position + direction
-        frame_type: FrameType = self.frame_data[frame_idx].frame_type
+        if direction != Direction.FORWARD and direction != Direction.BACKWARD:
+            raise InvalidDirectionError(direction)
 
-        if direction == Direction.FORWARD or direction == Direction.BACKWARD:
-            try:
-                real_frame_position, frame = self._get_next_frame(frame_position=starting_position,
-                                                                  direction=direction,
-                                                                  frame_type=frame_type)
-            except NoMatchingFrameTypeError:
-                real_frame_position = self.frame_data[frame_idx].real_frame_position
-                frame = self.frame_data[frame_idx].frame
+        if not 0 <= frame_idx < len(self.frame_data) or self.frame_data[frame_idx] is None:
+            return
+
+        previous_frame_data: FrameData = self.frame_data[frame_idx]
+
+        if previous_frame_data.preview:
+            # A preview left by a failed or cancelled sampling, the frame it stands for was never found.
+            return
+
+        known_frame_data, starting_position, target_position = self._find_known_offset(
+            frame_idx=frame_idx, frame_data=previous_frame_data, direction=direction, steps=steps)
+
+        if known_frame_data is not None:
+            self._set_frame_data(frame_idx, known_frame_data)
+            return
+
+        real_frame_position: int = previous_frame_data.real_frame_position
+        frame: Optional[np.ndarray] = None
+        frame_type: FrameType = previous_frame_data.frame_type
+
+        if target_position is not None:
+            real_frame_position, frame = self._get_next_frame(frame_position=target_position, direction=direction,
+                                                              frame_type=frame_type)
+        else:
+            for _ in range(steps):
+                step_position = real_frame_position + direction
+
+                try:
+                    real_frame_position, frame = self._get_next_frame(frame_position=step_position,
+                                                                      direction=direction,
+                                                                      frame_type=frame_type)
+                except NoMatchingFrameTypeError:
+                    break
+
+                # Only the start of the last step that found a frame is remembered with it, like with the index.
+                starting_position = step_position
+
+        if frame is not None:
+            frame_data = self._store_frame(original_frame_position=starting_position,
+                                           real_frame_position=real_frame_position, frame=frame,
+                                           frame_type=frame_type, direction=direction)
         else:
+            frame_data = FrameData(original_frame_position=starting_position,
+                                   real_frame_position=real_frame_position,
+                                   frame_key=previous_frame_data.frame_key,
+                                   frame_type=frame_type)
+
+        if steps == 1 and self.prefetcher.depth > 0:
+            self.prefetcher.remember(frame_idx=frame_idx, previous=previous_frame_data,
+                                     previous_frame=self.frame_store.peek(previous_frame_data.frame_key),
+                                     current=frame_data, direction=direction)
+
+        self._set_frame_data(frame_idx, frame_data)
+
+    def _find_offset_target(self, frame_data: FrameData, direction: Direction,
+                            steps: int) -> tuple[int, Optional[int]]:
+        """
+        Finds the frame an offset moves to with the frame type index, without decoding anything.
+        Stepping stops at the first step without a matching frame.
+
+        :param frame_data: Frame data before the offset.
+        :param direction: Offset direction.
+        :param steps: Number of matching frames to move by.
+        :return: Tuple containing the frame position the last step started from and the real frame position reached,
+                 ``None`` if not even the first step found a matching frame.
+        """
+        real_frame_position = frame_data.real_frame_position
+        starting_position = real_frame_position + direction
+        target_position: Optional[int] = None
+
+        for _ in range(steps):
+            found_position = self.frame_index.find_closest(frame_position=real_frame_position + direction,
+                                                           direction=direction,
+                                                           frame_type=frame_data.frame_type,
+                                                           max_distance=MAX_FRAMES_TO_SEARCH)
+            if found_position is None:
+                break
+
+            starting_position = real_frame_position + direction
+            real_frame_position = target_position = found_position
+
+        return starting_position, target_position
+
+    def _find_known_offset(self, frame_idx: int, frame_data: FrameData, direction: Direction,
+                           steps: int) -> tuple[Optional[FrameData], int, Optional[int]]:
+        """
+        Finds the frame an offset moves to without decoding it, if possible.
+        The frame is taken from the frame memo, from the prefetcher, or, with the frame type index, from the frame
+        store if it is stored already. An offset without a matching frame keeps the frame.
+
+        :param frame_idx: Index of the frame.
+        :param frame_data: Frame data before the offset.
+        :param direction: Offset direction.
+        :param steps: Number of matching frames to move by.
+        :return: Tuple containing the frame data after the offset, ``None`` if the frame has to be decoded, the frame
+                 position the last step started from, and the real frame position to decode, ``None`` if it is only
+                 known after decoding, i.e. without the frame type index.
+        """
+        frame_type = frame_data.frame_type
+
+        if (memoized := self.frame_memo.follow(file_path=self._file_path,
+                                               frame_position=frame_data.real_frame_position,
+                                               frame_type=frame_type, direction=direction, steps=steps)) is not None:
+            starting_position, real_frame_position, frame_key = memoized
+
+            return FrameData(original_frame_position=starting_position, real_frame_position=real_frame_position,
+                             frame_key=frame_key, frame_type=frame_type), starting_position, real_frame_position
+
+        if (prefetched := self.prefetcher.lookup(frame_idx=frame_idx, frame_data=frame_data,
+                                                 direction=direction, steps=steps)) is not None:
+            stored_frame_data = self._store_frame(original_frame_position=prefetched.original_frame_position,
+                                                  real_frame_position=prefetched.real_frame_position,
+                                                  frame=prefetched.frame, frame_type=frame_type, direction=direction)
+
+            return stored_frame_data, prefetched.original_frame_position, prefetched.real_frame_position
+
+        if self.ensure_frame_index() is None:
+            return None, frame_data.real_frame_position + direction, None
+
+        starting_position, target_position = self._find_offset_target(frame_data=frame_data, direction=direction,
+                                                                      steps=steps)
+
+        if target_position is None:
+            return replace(frame_data, original_frame_position=starting_position), starting_position, None
+
+        return self._known_frame(original_frame_position=starting_position, real_frame_position=target_position,
+                                 frame_type=frame_type, direction=direction), starting_position, target_position
+
+    def _known_frame(self, original_frame_position: int, real_frame_position: Optional[int], frame_type: FrameType,
+                     direction: Direction) -> Optional[FrameData]:
+        """
+        Gets a frame without decoding it, if the search is remembered by the frame memo or its real frame is stored
+        already, e.g. sampled at another index.
+
+        :param original_frame_position: Frame position the search starts from.
+        :param real_frame_position: Real frame position the search ends at, ``None`` if it is not known.
+        :param frame_type: Desired frame type.
+        :param direction: Search direction.
+        :return: Frame data holding a new reference to the stored frame, ``None`` if the frame has to be decoded.
+        """
+        if (memoized := self.frame_memo.lookup(file_path=self._file_path, frame_position=original_frame_position,
+                                               frame_type=frame_type, direction=direction)) is not None:
+            real_frame_position, frame_key = memoized
+        elif real_frame_position is None or (frame_key := self.frame_store.lookup(
+                self._content_key(real_frame_position))) is None:
+            return None
+
+        return FrameData(original_frame_position=original_frame_position, real_frame_position=real_frame_position,
+                         frame_key=frame_key, frame_type=frame_type)
+
+    def offset_all(self, direction: Direction, steps: int = 1) -> None:
+        """
+        Offsets all decoded frames, with the same resulting frames as calling ``offset`` for each of them.
+
+        With the frame type index, all target positions are found first. Targets remembered by `frame_memo`,
+        prefetched, or already stored are taken without decoding. The remaining ones are decoded once each, in
+        position order, following a single seek plan. The new frame data replace the previous ones at once, after
+        all frames are decoded, and nothing is replaced if decoding fails.
+        Without the index, target positions are only known after decoding, so frames are offset one by one.
+        Preview frames are not offset, like in ``offset``.
+
+        :param direction: Enum representing the moving direction.
+        :param steps: Number of matching frames to move by.
+        :raises ``InvalidDirectionError``: If the passed direction is zero.
+        :raises ``ImageReadError``: If frame reading fails.
+        """
+        if direction != Direction.FORWARD and direction != Direction.BACKWARD:
             raise InvalidDirectionError(direction)
 
-        frame_data = FrameData(original_frame_position=starting_position,
-                               real_frame_position=real_frame_position,
-                               frame=frame,
-                               frame_type=frame_type)
+        if self.ensure_frame_index() is None:
+            for frame_idx, frame_data in enumerate(self.frame_data):
+                if frame_data is not None:
+                    self.offset(frame_idx=frame_idx, direction=direction, steps=steps)
 
-        self.frame_data[frame_idx] = frame_data
+            return
+
+        updates: dict[int, FrameData] = {}
+        # Frame indices and starting frame positions waiting for the frame of each frame type and target position.
+        pending: dict[tuple[FrameType, int], list[tuple[int, int]]] = {}
+
+        for frame_idx, previous_frame_data in enumerate(self.frame_data):
+            if previous_frame_data is None or previous_frame_data.preview:
+                continue
+
+            known_frame_data, starting_position, target_position = self._find_known_offset(
+                frame_idx=frame_idx, frame_data=previous_frame_data, direction=direction, steps=steps)
+
+            if known_frame_data is not None:
+                updates[frame_idx] = known_frame_data
+            else:
+                pending.setdefault((previous_frame_data.frame_type, target_position), []).append(
+                    (frame_idx, starting_position))
+
+        try:
+            for frame_type in dict.fromkeys(frame_type for frame_type, _ in pending):
+                targets = [(waiting[0][0], waiting[0][1], target_position)
+                           for (target_type, target_position), waiting in sorted(pending.items(),
+                                                                                 key=lambda item: item[0][1])
+                           if target_type == frame_type]
+
+                for _, _, real_frame_position, frame in self._decode_targets(targets=targets, frame_type=frame_type):
+                    for frame_idx, starting_position in pending[(frame_type, real_frame_position)]:
+                        updates[frame_idx] = self._store_frame(original_frame_position=starting_position,
+                                                               real_frame_position=real_frame_position, frame=frame,
+                                                               frame_type=frame_type, direction=direction)
+        except BaseException:
+            for frame_idx, frame_data in updates.items():
+                if frame_data.frame_key != self.frame_data[frame_idx].frame_key:
+                    self.frame_store.discard(frame_data.frame_key)
+
+            raise
 
-    def _get_next_frame(self, frame_position: int, direction: Direction, frame_type: FrameType) \
-            -> tuple[int, np.ndarray]:
+        self._replace_frame_data(updates)
+
+    def _replace_frame_data(self, updates: dict[int, FrameData]) -> None:
+        """
+        Replaces the frame data at several indices at once, removing the replaced frames from the frame store.
+
+        :param updates: Dictionary mapping frame indices to their new frame data.
+        """
+        previous_frame_data = self.frame_data
+        frame_data = list(previous_frame_data)
+
+        for frame_idx, new_frame_data in updates.items():
+            frame_data[frame_idx] = new_frame_data
+
+        self.frame_data = frame_data
+
+        for frame_idx, new_frame_data in updates.items():
+            previous = previous_frame_data[frame_idx]
+
+            if previous is not None and previous.frame_key != new_frame_data.frame_key:
+                self.frame_store.discard(previous.frame_key)
+
+    def _get_next_frame(self, frame_position: int, direction: Direction, frame_type: FrameType,
+                        video_capture: Optional[cv2.VideoCapture] = None,
+                        seek: bool = True) -> tuple[int, np.ndarray]:
         """
         Retrieves the next frame in the specified search direction that matches the frame type.
-        Adds information text to the found frame.
+        Converts the found frame to the frame format of the loader, without adding any text to it.
 
         :param frame_position: Starting frame position.
         :param direction: Indicates either forward or backward search.
         :param frame_type: Desired frame type.
+        :param video_capture: ``VideoCapture`` object to decode with, defaults to the main one.
+        :param seek: Whether to seek before decoding, see ``_find_closest_frame``.
         :return: Tuple containing the frame position of the new frame and the new frame itself.
         """
 
         new_frame_position, image = self._find_closest_frame(frame_position=frame_position,
                                                              direction=direction,
-                                                             frame_type=frame_type)
-        frame = self._get_composited_image(frame_position=new_frame_position, image=image, frame_type=frame_type)
-        frame = cv2.cvtColor(src=frame, code=cv2.COLOR_BGR2RGB)
+                                                             frame_type=frame_type,
+                                                             video_capture=video_capture,
+                                                             seek=seek)
+        frame = encode_frame(image, self.frame_format)
 
         return new_frame_position, frame
 
-    def sample_frames(self, frame_positions: list[int], frame_type: FrameType) -> None:
+    def _get_video_captures(self, n_captures: int) -> list[cv2.VideoCapture]:
         """
-        Samples frames based on the given starting frame indices and desired frame type.
+        Gets a pool of ``VideoCapture`` objects opened on the video file, opening additional ones if needed.
+
+        :param n_captures: Number of ``VideoCapture`` objects.
+        :return: List of ``VideoCapture`` objects, the main one being the first.
+        """
+        while len(self._video_captures) < n_captures - 1:
+            self._video_captures.append(cv2.VideoCapture(filename=str(self._file_path.absolute())))
+
+        return [self._video_capture, *self._video_captures[:n_captures - 1]]
+
+    def _sample_shard(self, shard: list[tuple[int, int]], frame_type: FrameType,
+                      video_capture: cv2.VideoCapture,
+                      cancel_event: Optional[threading.Event] = None,
+                      on_frame_ready: Optional[Callable[[int], None]] = None) -> None:
+        """
+        Samples frames of one shard of frame positions with a single ``VideoCapture`` object.
+        Every frame is stored as soon as it is decoded.
+
+        :param shard: List of tuples containing a frame index and its starting frame position.
+        :param frame_type: Desired frame type.
+        :param video_capture: ``VideoCapture`` object to decode with.
+        :param cancel_event: Optional event, checked before decoding each frame.
+        :param on_frame_ready: Optional callback, called with the frame index of every stored frame.
+        :raises ``TaskCancelledError``: If the cancel event is set.
+        """
+        for idx, original_frame_position, real_frame_position, frame in self._decode_shard(
+                shard=shard, frame_type=frame_type, video_capture=video_capture, cancel_event=cancel_event):
+            self._set_frame_data(idx, self._store_frame(original_frame_position=original_frame_position,
+                                                        real_frame_position=real_frame_position, frame=frame,
+                                                        frame_type=frame_type, direction=Direction.FORWARD))
+
+            if on_frame_ready is not None:
+                on_frame_ready(idx)
+
+    def _decode_shard(self, shard: list[tuple[int, int]], frame_type: FrameType,
+                      video_capture: Optional[cv2.VideoCapture] = None,
+                      cancel_event: Optional[threading.Event] = None) -> Iterator[tuple[int, int, int, np.ndarray]]:
+        """
+        Decodes the frames of one shard in the given order, following a seek plan, see ``_decode_targets``.
+        Frames are targeted at their real frame position if the frame type index is available, otherwise at their
+        starting frame position.
+
+        :param shard: List of tuples containing a frame index and its starting frame position.
+        :param frame_type: Desired frame type.
+        :param video_capture: ``VideoCapture`` object to decode with, defaults to the main one.
+        :param cancel_event: Optional event, checked before decoding each frame.
+        :return: Iterator of tuples containing the frame index, the starting and the real frame position and the frame.
+        :raises ``TaskCancelledError``: If the cancel event is set.
+        :raises ``ImageReadError``: If frame reading fails.
+        """
+        targets: list[tuple[int, int, int]] = []
+
+        for idx, original_frame_position in shard:
+            target_position = self.frame_index.find_closest(frame_position=original_frame_position,
+                                                            direction=Direction.FORWARD,
+                                                            frame_type=frame_type,
+                                                            max_distance=MAX_FRAMES_TO_SEARCH) \
+                if self.frame_index is not None else None
+            targets.append((idx, original_frame_position,
+                            original_frame_position if target_position is None else target_position))
+
+        yield from self._decode_targets(targets=targets, frame_type=frame_type, video_capture=video_capture,
+                                        cancel_event=cancel_event)
+
+    def _decode_targets(self, targets: list[tuple[int, int, int]], frame_type: FrameType,
+                        video_capture: Optional[cv2.VideoCapture] = None,
+                        cancel_event: Optional[threading.Event] = None) -> Iterator[tuple[int, int, int, np.ndarray]]:
+        """
+        Decodes frames in the given order, following a seek plan.
+
+        The plan decides per frame whether to seek to it or to keep grabbing forward, based on the measured costs
+        in `seek_costs`, which are updated while the plan is executed. The executed plan is added to `seek_plans`
+        along with its actual cost. The frame type is searched forward from every target position. A frame whose
+        target position was passed by the search of the previous frame is the previous frame itself, it is not
+        decoded again.
+
+        :param targets: List of tuples containing a frame index, its starting frame position and its target position.
+        :param frame_type: Desired frame type.
+        :param video_capture: ``VideoCapture`` object to decode with, defaults to the main one.
+        :param cancel_event: Optional event, checked before decoding each frame.
+        :return: Iterator of tuples containing the frame index, the starting and the real frame position and the frame.
+        :raises ``TaskCancelledError``: If the cancel event is set.
+        :raises ``ImageReadError``: If frame reading fails.
+        """
+        if not targets:
+            return
+
+        video_capture = video_capture or self._video_capture
+        plan = plan_seeks(targets=targets, costs=self.seek_costs,
+                          start_position=int(video_capture.get(cv2.CAP_PROP_POS_FRAMES)),
+                          frame_index=self.frame_index)
+        self.seek_plans.append(plan)
+        previous: Optional[tuple[int, int, np.ndarray]] = None
+
+        for step in plan.steps:
+            if cancel_event is not None and cancel_event.is_set():
+                raise TaskCancelledError()
+
+            start = time.perf_counter()
+            position = int(video_capture.get(cv2.CAP_PROP_POS_FRAMES))
+
+            if previous is not None and previous[0] <= step.target_position <= previous[1]:
+                yield step.frame_idx, step.original_frame_position, previous[1], previous[2]
+                continue
+
+            if step.action == SeekAction.GRAB and step.target_position >= position:
+                for _ in range(step.target_position - position):
+                    if not video_capture.grab():
+                        raise ImageReadError(source=self._file_path)
+
+                self.seek_costs.record_grabs(seconds=time.perf_counter() - start,
+                                             n_frames=step.target_position - position)
+            else:
+                if step.action == SeekAction.GRAB:
+                    plan.fallback_seeks += 1
+
+                self._set_frame_position(step.target_position, video_capture=video_capture)
+                self.seek_costs.record_seek(seconds=time.perf_counter() - start)
+
+            plan.actual_seconds += time.perf_counter() - start
+
+            real_frame_position, frame = self._get_next_frame(frame_position=step.target_position,
+                                                              direction=Direction.FORWARD,
+                                                              frame_type=frame_type,
+                                                              video_capture=video_capture,
+                                                              seek=False)
+            previous = (step.original_frame_position, real_frame_position, frame)
+
+            yield step.frame_idx, step.original_frame_position, real_frame_position, frame
+
+        logger.debug(f"Seek plan of {self.file_name}: {plan.n_seeks} seeks, {len(plan.steps) - plan.n_seeks} grab runs"
+                     f"{' (sweep)' if plan.sweep else ''}, {plan.fallback_seeks} fallback seeks, "
+                     f"estimated {1000 * plan.estimated_seconds:.1f} ms, actual {1000 * plan.actual_seconds:.1f} ms")
+
+    def _store_frame(self, original_frame_position: int, real_frame_position: int, frame: np.ndarray,
+                     frame_type: FrameType, direction: Direction) -> FrameData:
+        """
+        Adds a decoded frame to the frame store and remembers the search result in the frame memo.
+        The frame shares the array of an already stored frame of the same real frame position.
+
+        :param original_frame_position: Frame position the search started from.
+        :param real_frame_position: Real frame position that was found.
+        :param frame: Decoded frame.
+        :param frame_type: Frame type searched for.
+        :param direction: Search direction.
+        :return: Frame data referring to the stored frame.
+        """
+        frame_key = self.frame_store.put(frame, content_key=self._content_key(real_frame_position))
+        self.frame_memo.remember(file_path=self._file_path, frame_position=original_frame_position,
+                                 frame_type=frame_type, direction=direction, real_frame_position=real_frame_position,
+                                 frame_key=frame_key, nbytes=frame.nbytes)
+
+        return FrameData(original_frame_position=original_frame_position, real_frame_position=real_frame_position,
+                         frame_key=frame_key, frame_type=frame_type)
+
+    def _content_key(self, real_frame_position: int) -> tuple[Path, int]:
+        """
+        Gets the key identifying a decoded frame of the video in the frame store.
+
+        :param real_frame_position: Real frame position of the frame.
+        :return: Tuple containing the video file path and the real frame position.
+        """
+        return self._file_path, real_frame_position
+
+    def resolve_frame_position(self, frame_position: int, frame_type: FrameType,
+                               direction: Direction = Direction.FORWARD) -> Optional[int]:
+        """
+        Finds the real frame position a search from a frame position ends at, using the frame type index.
+        Nothing is decoded, the index is built first if it is enabled and has not been built yet.
+
+        :param frame_position: Starting frame position.
+        :param frame_type: Desired frame type.
+        :param direction: Search direction.
+        :return: Real frame position, ``None`` if the index is not available or no frame matched.
+        """
+        if self.ensure_frame_index() is None:
+            return None
+
+        return self.frame_index.find_closest(frame_position=frame_position, direction=direction,
+                                             frame_type=frame_type, max_distance=MAX_FRAMES_TO_SEARCH)
+
+    def _restore_known_frames(self, pending: list[tuple[int, int]], frame_type: FrameType,
+                              on_frame_ready: Optional[Callable[[int], None]] = None
+                              ) -> tuple[list[tuple[int, int]], list[tuple[int, int]]]:
+        """
+        Stores the pending frames remembered by the frame memo, or whose real frame is already in the frame store,
+        without decoding them, see ``_known_frame``.
+        Of several pending frames resolving to the same real frame, only the first one is left to be decoded.
+        Real frame positions are only known ahead of decoding if the frame type index is available.
+
+        :param pending: List of tuples containing a frame index and its starting frame position.
+        :param frame_type: Desired frame type.
+        :param on_frame_ready: Optional callback, called with the frame index of every stored frame.
+        :return: Tuple containing the pending frames to decode and the pending frames sharing the real frame
+                 of one of them.
+        """
+        remaining: list[tuple[int, int]] = []
+        collapsed: list[tuple[int, int]] = []
+        decoded_frame_positions: set[int] = set()
+
+        for idx, original_frame_position in pending:
+            real_frame_position = self.resolve_frame_position(frame_position=original_frame_position,
+                                                              frame_type=frame_type)
+
+            if (frame_data := self._known_frame(original_frame_position=original_frame_position,
+                                                real_frame_position=real_frame_position, frame_type=frame_type,
+                                                direction=Direction.FORWARD)) is not None:
+                self._set_frame_data(idx, frame_data)
+
+                if on_frame_ready is not None:
+                    on_frame_ready(idx)
+            elif real_frame_position in decoded_frame_positions:
+                collapsed.append((idx, original_frame_position))
+            else:
+                if real_frame_position is not None:
+                    decoded_frame_positions.add(real_frame_position)
+
+                remaining.append((idx, original_frame_position))
+
+        if n_restored := len(pending) - len(remaining) - len(collapsed):
+            logger.debug(f"{n_restored} of {len(pending)} frames of {self.file_name} restored without decoding, "
+                         f"frame memo hit rate {self.frame_memo.hit_rate:.0%}")
+
+        return remaining, collapsed
+
+    def pending_frames(self, frame_positions: list[int], frame_type: FrameType) -> list[tuple[int, int]]:
+        """
+        Gets the frames ``sample_frames`` would decode. Frames already decoded from the same starting frame position
+        and of the same frame type are kept, even if their index changed. Preview frames are still pending.
 
         :param frame_positions: List of starting frame positions.
         :param frame_type: Desired frame type.
+        :return: List of tuples containing a frame index and its starting frame position.
         """
-        buffer: list[tuple[int, FrameData]] = []
+        decoded_frame_positions = {frame_data.original_frame_position for frame_data in self.frame_data
+                                   if frame_data is not None and not frame_data.preview
+                                   and frame_data.frame_type == frame_type}
+        pending: list[tuple[int, int]] = []
 
         for idx, original_frame_position in enumerate(frame_positions):
-            if (self.frame_data
-                    and idx < len(self.frame_data)
-                    and self.frame_data[idx].original_frame_position == original_frame_position
-                    and self.frame_data[idx].frame_type == frame_type):
+            if original_frame_position in decoded_frame_positions:
+                # A decoded frame is kept only for the first index of a repeated position.
+                decoded_frame_positions.remove(original_frame_position)
+            else:
+                pending.append((idx, original_frame_position))
+
+        return pending
+
+    def _align_frame_data(self, frame_positions: list[int], frame_type: FrameType) -> None:
+        """
+        Moves decoded frames to the indices of their starting frame positions in the new list of positions.
+        Frames whose position is no longer sampled, or which are of another frame type, are removed.
+
+        :param frame_positions: List of starting frame positions.
+        :param frame_type: Desired frame type.
+        """
+        decoded: dict[int, FrameData] = {}
+
+        for frame_data in self.frame_data:
+            if frame_data is None:
                 continue
 
-            real_frame_position, frame = self._get_next_frame(frame_position=original_frame_position,
-                                                              direction=Direction(1),
+            if frame_data.frame_type == frame_type and frame_data.original_frame_position not in decoded:
+                decoded[frame_data.original_frame_position] = frame_data
+            else:
+                self.frame_store.discard(frame_data.frame_key)
+
+        self.frame_data = [decoded.pop(frame_position, None) for frame_position in frame_positions]
+
+        for frame_data in decoded.values():
+            self.frame_store.discard(frame_data.frame_key)
+
+    def preview_frames(self, frame_positions: list[int], frame_type: FrameType,
+                       cancel_event: Optional[threading.Event] = None,
+                       on_frame_ready: Optional[Callable[[int], None]] = None) -> None:
+        """
+        Fills the frames ``sample_frames`` would decode with the keyframes closest to their real frame positions.
+
+        A keyframe is read right after seeking to it, without searching forward for the frame type, so the previews
+        are available before the exact frames, the sooner the longer the groups of pictures are.
+        Preview frames are marked in `frame_data` and replaced by the next ``sample_frames`` call. Offsets skip them,
+        so previews left by a failed or cancelled sampling are never taken for the frames they stand for.
+        Frames remembered by `frame_memo` or already in the frame store, and frames whose real frame is the keyframe
+        itself, are stored as exact frames.
+        Does nothing if the frame type index is not available, keyframes are not known without it.
+
+        :param frame_positions: List of starting frame positions.
+        :param frame_type: Desired frame type.
+        :param cancel_event: Optional event, checked before decoding each keyframe.
+        :param on_frame_ready: Optional callback, called with the frame index of every stored frame.
+        :raises ``TaskCancelledError``: If the cancel event is set.
+        :raises ``ImageReadError``: If frame reading fails.
+        """
+        if self.ensure_frame_index() is None:
+            return
+
+        self._align_frame_data(frame_positions=frame_positions, frame_type=frame_type)
+
+        pending, collapsed = self._restore_known_frames(
+            pending=self.pending_frames(frame_positions=frame_positions, frame_type=frame_type),
+            frame_type=frame_type,
+            on_frame_ready=on_frame_ready
+        )
+
+        # Frames previewed by every keyframe, with their real frame positions.
+        previews: dict[int, list[tuple[int, int, Optional[int]]]] = {}
+
+        for idx, original_frame_position in sorted(pending + collapsed):
+            real_frame_position = self.resolve_frame_position(frame_position=original_frame_position,
                                                               frame_type=frame_type)
-            frame_data = FrameData(original_frame_position=original_frame_position,
-                                   real_frame_position=real_frame_position,
-                                   frame=frame,
-                                   frame_type=frame_type)
+            keyframe_position = real_frame_position \
+                if real_frame_position is not None and self.frame_index.is_keyframe(real_frame_position) \
+                else self.frame_index.nearest_keyframe(original_frame_position if real_frame_position is None
+                                                       else real_frame_position)
+
+            if keyframe_position is not None:
+                previews.setdefault(keyframe_position, []).append((idx, original_frame_position, real_frame_position))
 
-            buffer.append((idx, frame_data))
+        targets = [(frame_indices[0][0], keyframe_position, keyframe_position)
+                   for keyframe_position, frame_indices in sorted(previews.items())]
 
-        if self.frame_data:
-            for idx, data in buffer:
-                # noinspection PyTypeChecker
-                if idx < len(self.frame_data):
-                    self.frame_data[idx] = data  # type: ignore
+        for _, keyframe_position, _, frame in self._decode_targets(targets=targets, frame_type=FrameType.I_TYPE,
+                                                                   cancel_event=cancel_event):
+            for idx, original_frame_position, real_frame_position in previews[keyframe_position]:
+                if real_frame_position == keyframe_position:
+                    frame_data = self._store_frame(original_frame_position=original_frame_position,
+                                                   real_frame_position=real_frame_position, frame=frame,
+                                                   frame_type=frame_type, direction=Direction.FORWARD)
                 else:
-                    self.frame_data.append(data)
+                    frame_data = FrameData(original_frame_position=original_frame_position,
+                                           real_frame_position=keyframe_position,
+                                           frame_key=self.frame_store.put(
+                                               frame, content_key=self._content_key(keyframe_position)),
+                                           frame_type=frame_type,
+                                           preview=True)
+
+                self._set_frame_data(idx, frame_data)
+
+                if on_frame_ready is not None:
+                    on_frame_ready(idx)
+
+    def sample_frames(self, frame_positions: list[int], frame_type: FrameType, n_captures: int = 1,
+                      process_decoder: Optional[ProcessDecoder] = None,
+                      cancel_event: Optional[threading.Event] = None,
+                      priority: Optional[list[int]] = None,
+                      on_frame_ready: Optional[Callable[[int], None]] = None) -> None:
+        """
+        Samples frames based on the given starting frame indices and desired frame type.
+
+        Frames are stored in `frame_data` as soon as they are decoded, slots of frames that were not decoded yet
+        are ``None``. Frames already decoded from a sampled position are kept and moved to its index, preview frames
+        of ``preview_frames`` are kept until they are replaced by their exact frames.
+        Frames remembered by `frame_memo` are stored without decoding.
+        Frames resolving to a real frame position that is stored already, or that another index decodes, share its
+        frame instead of decoding it again.
+        Frame indices listed in `priority` are decoded first, in the given order.
+        If more than one ``VideoCapture`` object is requested, the remaining sorted frame positions are split into
+        contiguous shards which are decoded concurrently, each with its own ``VideoCapture`` object.
+        Every shard seeks only where grabbing forward to the next frame is estimated to be slower, see `seek_plans`.
+        The frame type index is built in the background, frames are searched by decoding them until it is ready.
+
+        :param frame_positions: List of starting frame positions.
+        :param frame_type: Desired frame type.
+        :param n_captures: Maximal number of ``VideoCapture`` objects decoding concurrently.
+        :param process_decoder: Optional ``ProcessDecoder``, decodes the shards in child processes if supplied.
+        :param cancel_event: Optional event, sampling stops once it is set. Frames decoded until then are kept.
+        :param priority: Optional list of frame indices to decode before all others.
+        :param on_frame_ready: Optional callback, called with the frame index of every stored frame.
+        :raises ``TaskCancelledError``: If the cancel event is set.
+        """
+        self.ensure_frame_index()
+        self.seek_plans = []
+        self._align_frame_data(frame_positions=frame_positions, frame_type=frame_type)
+
+        # Of frames sharing a real frame, a prioritized one is decoded, the others are restored after decoding.
+        priority_ranks = {idx: rank for rank, idx in enumerate(dict.fromkeys(priority or []))}
+        pending, collapsed = self._restore_known_frames(
+            pending=sorted(self.pending_frames(frame_positions=frame_positions, frame_type=frame_type),
+                           key=lambda item: priority_ranks.get(item[0], len(priority_ranks))),
+            frame_type=frame_type,
+            on_frame_ready=on_frame_ready
+        )
+        pending.sort()
+
+        if priority:
+            pending_positions = dict(pending)
+            prioritized = [(idx, pending_positions[idx]) for idx in dict.fromkeys(priority) if idx in pending_positions]
+
+            self._sample_shard(shard=prioritized, frame_type=frame_type, video_capture=self._video_capture,
+                               cancel_event=cancel_event, on_frame_ready=on_frame_ready)
+
+            prioritized_indices = {idx for idx, _ in prioritized}
+            pending = [(idx, position) for idx, position in pending if idx not in prioritized_indices]
+
+        n_shards = max(1, min(n_captures, len(pending)))
+        shard_size = max(1, -(-len(pending) // n_shards))
+        shards = [pending[i:i + shard_size] for i in range(0, len(pending), shard_size)]
+
+        if process_decoder is not None:
+            if cancel_event is not None and cancel_event.is_set():
+                raise TaskCancelledError()
+
+            buffer: list[tuple[int, int, np.ndarray]] = process_decoder.sample_shards(
+                file_path=self._file_path,
+                shards=shards,
+                frame_type=frame_type,
+                total_frames=self.total_frames,
+                frame_types=self.frame_index.to_string() if self.frame_index is not None else None,
+                frame_format=self.frame_format,
+                resolution=self.resolution
+            )
+
+            original_frame_positions: dict[int, int] = dict(pending)
+
+            for idx, real_frame_position, frame in buffer:
+                self._set_frame_data(idx, self._store_frame(original_frame_position=original_frame_positions[idx],
+                                                            real_frame_position=real_frame_position, frame=frame,
+                                                            frame_type=frame_type, direction=Direction.FORWARD))
+
+                if on_frame_ready is not None:
+                    on_frame_ready(idx)
+
+        elif n_shards > 1:
+            with ThreadPoolExecutor(max_workers=len(shards)) as executor:
+                futures = [
+                    executor.submit(self._sample_shard, shard=shard, frame_type=frame_type, video_capture=capture,
+                                    cancel_event=cancel_event, on_frame_ready=on_frame_ready)
+                    for shard, capture in zip(shards, self._get_video_captures(len(shards)))
+                ]
+
+            for future in futures:
+                future.result()
         else:
-            self.frame_data.extend(data[1] for data in buffer)
+            self._sample_shard(shard=pending, frame_type=frame_type, video_capture=self._video_capture,
+                               cancel_event=cancel_event, on_frame_ready=on_frame_ready)
+
+        if collapsed:
+            undecoded, _ = self._restore_known_frames(pending=collapsed, frame_type=frame_type,
+                                                      on_frame_ready=on_frame_ready)
+            self._sample_shard(shard=undecoded, frame_type=frame_type, video_capture=self._video_capture,
+                               cancel_event=cancel_event, on_frame_ready=on_frame_ready)
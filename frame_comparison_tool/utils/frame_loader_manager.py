@@ -1,15 +1,28 @@
-import random
-from bisect import bisect_right
+import threading
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, Future
 from pathlib import Path
 from sys import maxsize
-from typing import Optional
+from typing import Optional, Callable, Hashable
 
+import cv2
 import numpy as np
-from PIL import Image
 
-from frame_comparison_tool.utils import FrameLoader, FrameType, Direction
+from frame_comparison_tool.utils import FrameLoader, FrameType, Direction, resize_to_fit
+from frame_comparison_tool.utils.config import PROBE_CACHE_ENABLED, FRAME_COUNT_REFINE_MARGIN, SAMPLING_WORKERS, \
+    CAPTURES_PER_SOURCE, DECODE_BACKEND, PRIORITY_NEIGHBOURS, FRAME_FORMAT, COMPRESSED_TIER, FRAME_CODEC, \
+    REDRAW_COLLAPSED_POSITIONS, PREVIEW_SAMPLING
+from frame_comparison_tool.utils.decode_backend import DecodeBackend
 from frame_comparison_tool.utils.exceptions import ImageReadError, MultipleSourcesImageReadError, VideoCaptureFailed
+from frame_comparison_tool.utils.frame_compression import default_frame_codec
+from frame_comparison_tool.utils.frame_data import FrameData
+from frame_comparison_tool.utils.frame_format import FrameFormat
+from frame_comparison_tool.utils.frame_memo import FrameMemo
+from frame_comparison_tool.utils.frame_sampler import generate_frame_positions
+from frame_comparison_tool.utils.frame_store import FrameStore
+from frame_comparison_tool.utils.probe_cache import ProbeCache
+from frame_comparison_tool.utils.process_decoder import ProcessDecoder
+from frame_comparison_tool.utils.scaled_frame_cache import ScaledFrameCache, ScaledFrameKey
 
 
 class FrameLoaderManager:
@@ -20,7 +33,10 @@ class FrameLoaderManager:
     including frame sampling, position tracking, and error handling across all sources.
     """
 
-    def __init__(self, n_samples: int, seed: int, frame_type: FrameType):
+    def __init__(self, n_samples: int, seed: int, frame_type: FrameType, max_workers: int = SAMPLING_WORKERS,
+                 captures_per_source: int = CAPTURES_PER_SOURCE,
+                 decode_backend: DecodeBackend = DecodeBackend(DECODE_BACKEND),
+                 frame_format: FrameFormat = FrameFormat(FRAME_FORMAT)):
         self.sources: OrderedDict[Path, FrameLoader] = OrderedDict({})
         """Dictionary mapping file path to ``FrameLoader`` object."""
         self.n_samples: int = n_samples
@@ -31,10 +47,51 @@ class FrameLoaderManager:
         """List of frame indices, range (0, `total_frames - 1`)."""
         self.frame_type: FrameType = frame_type
         """Current frame type."""
+        self.probe_cache: Optional[ProbeCache] = ProbeCache() if PROBE_CACHE_ENABLED else None
+        """On-disk cache of video file probe results."""
+        self.max_workers: int = max(1, max_workers)
+        """Maximal number of sources sampled concurrently, sources are sampled sequentially if set to 1."""
+        self.captures_per_source: int = captures_per_source
+        """Number of ``VideoCapture`` objects decoding each source, shares `max_workers` between sources if 0."""
+        self.process_decoder: Optional[ProcessDecoder] = (
+            ProcessDecoder(max_workers=self.max_workers) if decode_backend == DecodeBackend.PROCESS else None
+        )
+        """Child process pool used for decoding, ``None`` if frames are decoded in this process."""
+        self.frame_store: FrameStore = FrameStore(codec=default_frame_codec(FRAME_CODEC) if COMPRESSED_TIER else None)
+        """Memory-budgeted store of the decoded frames of all sources."""
+        self.frame_memo: FrameMemo = FrameMemo(frame_store=self.frame_store)
+        """Memo of frame search results of all sources, sharing a single memory budget."""
+        self.frame_format: FrameFormat = frame_format
+        """Layout the decoded frames are stored in, converted to BGR when they are displayed or saved."""
+        self.show_overlay: bool = True
+        """Whether the text information is added to displayed and saved frames."""
+        self.display_size: Optional[tuple[int, int]] = None
+        """Maximal width and height of frames displayed in the scaled mode, ``None`` until it is known."""
+        self.scaled_frame_cache: ScaledFrameCache = ScaledFrameCache()
+        """Frames fitted to the display sizes, so that they are not scaled again on every display."""
+        self.redraw_collapsed_positions: bool = REDRAW_COLLAPSED_POSITIONS
+        """Whether generated positions resolving to the same frames of all sources as another position are redrawn."""
+        self.preview_sampling: bool = PREVIEW_SAMPLING
+        """Whether keyframes close to the sampled frames are shown before the frames themselves are decoded."""
+
+    def close(self) -> None:
+        """
+        Releases resources held by the manager, stopping the decoding child processes if there are any.
+        """
+        for frame_loader in self.sources.values():
+            frame_loader.close()
+
+        if self.process_decoder is not None:
+            self.process_decoder.shutdown()
+
+        self.frame_memo.clear()
+        self.frame_store.close()
+        self.scaled_frame_cache.clear()
 
     def save_frames(self, formatted_date: str) -> None:
         """
         Iterates through all sources and saves frames to the current working directory.
+        Text information is only added to the saved frames if `show_overlay` is set.
 
         :param formatted_date: Formatted date to be used as directory name.
         """
@@ -45,10 +102,12 @@ class FrameLoaderManager:
             frames_dir.mkdir(exist_ok=True)
 
             for src_idx, frame_loader in enumerate(self.sources.values()):
-                for frame_idx, frame in enumerate(f.frame for f in frame_loader.frame_data):
+                for frame_idx in range(len(frame_loader.frame_data)):
+                    if (frame := frame_loader.get_frame(frame_idx, overlay=self.show_overlay)) is None:
+                        continue
+
                     image_path = frames_dir / f"{src_idx + 1}_{frame_idx + 1}.png"
-                    image = Image.fromarray(frame)
-                    image.save(image_path)
+                    cv2.imwrite(str(image_path), frame)
 
     def update_n_samples(self, n_samples: int) -> None:
         """
@@ -70,6 +129,9 @@ class FrameLoaderManager:
         """
         Adds new video source.
 
+        Only a cheap probe is done, so the total number of frames of a new source can be provisional.
+        It is corrected later, once sampling needs the last frames of the video.
+
         :param file_paths: List of video file paths to be added.
         :return: List of tuples containing a video file path and its success status.
         """
@@ -80,7 +142,9 @@ class FrameLoaderManager:
             for file_path in file_paths:
                 if file_path not in self.sources.keys():
                     status = True
-                    frame_loader = FrameLoader(file_path=Path(file_path))
+                    frame_loader = FrameLoader(file_path=Path(file_path), probe_cache=self.probe_cache,
+                                               frame_store=self.frame_store, frame_format=self.frame_format,
+                                               frame_memo=self.frame_memo)
 
                     if frame_loader.total_frames == 0:
                         status = False
@@ -93,13 +157,18 @@ class FrameLoaderManager:
 
     def delete_source(self, file_path: Path) -> int:
         """
-        Removes a video file.
+        Removes a video file, releasing its frames in `frame_store`, `frame_memo` and `scaled_frame_cache`.
+        Must not run while frames are sampled or offset, see ``Worker.paused``.
 
         :param file_path: Path of the video to be deleted.
         :return: Index of removed source.
         """
         src_idx = list(self.sources.keys()).index(file_path)
-        del self.sources[file_path]
+        frame_loader = self.sources.pop(file_path)
+        frame_loader.close()
+        frame_loader.discard_frames()
+        self.frame_memo.clear(file_path=frame_loader.file_path)
+        self.scaled_frame_cache.discard_source(file_path)
 
         return src_idx
 
@@ -115,6 +184,7 @@ class FrameLoaderManager:
     def get_frame(self, src_idx: int, frame_idx: int) -> Optional[np.ndarray]:
         """
         Retrieves a specific frame from a specific source.
+        Frames spilled to disk are transparently read back, `frame_store` counts the hits and misses.
 
         :param src_idx: Index of the source.
         :param frame_idx: Index of the frame.
@@ -124,48 +194,147 @@ class FrameLoaderManager:
             source = self.get_source(src_idx)
 
             if 0 <= frame_idx < len(source.frame_data):
-                return source.frame_data[frame_idx].frame
+                return source.get_frame(frame_idx, overlay=self.show_overlay)
             else:
                 return None
         else:
             return None
 
-    def expand_frames(self, n_samples: int) -> None:
+    def get_scaled_frame(self, src_idx: int, frame_idx: int) -> Optional[np.ndarray]:
         """
-        Expand the number of sampled frames while maintaining existing frame positions.
+        Retrieves a specific frame from a specific source, fitted to `display_size`.
+        The frame is served from `scaled_frame_cache` if it was already scaled, otherwise it is scaled and cached.
 
-        :param n_samples: New number of sampled frames.
+        :param src_idx: Index of the source.
+        :param frame_idx: Index of the frame.
+        :return: Scaled frame or ``None`` if indices are invalid, the frame was not decoded yet, or `display_size`
+                 is not known yet, i.e. not set or either of its dimensions is zero.
         """
+        if not 0 <= src_idx < len(self.sources):
+            return None
+
+        source = self.get_source(src_idx)
+
+        if not 0 <= frame_idx < len(source.frame_data) or (frame_data := source.frame_data[frame_idx]) is None:
+            return None
+
+        display_size = self.display_size
+
+        if display_size is None or display_size[0] == 0 or display_size[1] == 0:
+            return None
+
+        key = self._scaled_frame_key(source=source, frame_idx=frame_idx, frame_data=frame_data)
+
+        if (frame := self.scaled_frame_cache.get(key, display_size)) is not None:
+            return frame
+
+        if (frame := source.get_frame(frame_idx, overlay=self.show_overlay)) is None:
+            return None
+
+        frame = resize_to_fit(frame, display_size)
+        self.scaled_frame_cache.put(key, display_size, frame)
+
+        return frame
 
-        if n_samples > self.n_samples and self.frame_positions:
-            self._generate_random_frame_positions(min_frame_pos=min(self.frame_positions),
-                                                  max_frame_pos=max(self.frame_positions),
-                                                  n_samples=n_samples)
+    def peek_scaled_frames(self, frame_indices: list[int]) -> list[np.ndarray]:
+        """
+        Retrieves the frames of all sources at the given indices that are already fitted to `display_size`.
+        Frames that were not scaled yet are skipped, nothing is scaled.
 
-    def offset_frame(self, direction: Direction, src_idx: int, frame_idx: int) -> None:
+        :param frame_indices: Indices of the frames.
+        :return: List of scaled frames.
+        """
+        display_size = self.display_size
+
+        if display_size is None:
+            return []
+
+        frames: list[np.ndarray] = []
+
+        for source in list(self.sources.values()):
+            for frame_idx in frame_indices:
+                if not 0 <= frame_idx < len(source.frame_data) or (frame_data := source.frame_data[frame_idx]) is None:
+                    continue
+
+                key = self._scaled_frame_key(source=source, frame_idx=frame_idx, frame_data=frame_data)
+
+                if (frame := self.scaled_frame_cache.peek(key, display_size)) is not None:
+                    frames.append(frame)
+
+        return frames
+
+    def _scaled_frame_key(self, source: FrameLoader, frame_idx: int, frame_data: FrameData) -> ScaledFrameKey:
+        """
+        Gets the key of a frame in `scaled_frame_cache`.
+
+        :param source: ``FrameLoader`` of the frame.
+        :param frame_idx: Index of the frame.
+        :param frame_data: Current frame data at the index.
+        :return: Key of the frame as currently displayed.
+        """
+        return source.file_path, frame_idx, frame_data.real_frame_position, self.show_overlay
+
+    def scale_frames(self, focus: tuple[int, int], neighbours: bool = True) -> None:
+        """
+        Fits the focused frame of every source to `display_size` ahead of its display, starting with the focused
+        source. Does nothing if `display_size` is not known yet.
+
+        :param focus: Tuple containing the source index and frame index currently displayed.
+        :param neighbours: Whether the neighbouring frames of the focused frame are scaled as well.
+        """
+        if self.display_size is None or self.display_size[0] == 0 or self.display_size[1] == 0 or not self.sources:
+            return
+
+        focus_src_idx, focus_frame_idx = focus
+        n_sources = len(self.sources)
+        src_indices = sorted(range(n_sources), key=lambda src_idx: min((src_idx - focus_src_idx) % n_sources,
+                                                                        (focus_src_idx - src_idx) % n_sources))
+        frame_indices = self._priority_frame_indices(focus_frame_idx) if neighbours else [focus_frame_idx]
+
+        for frame_idx in frame_indices:
+            for src_idx in src_indices:
+                try:
+                    self.get_scaled_frame(src_idx=src_idx, frame_idx=frame_idx)
+                except IndexError:
+                    # A source was deleted concurrently.
+                    return
+
+    def offset_frame(self, direction: Direction, src_idx: int, frame_idx: int, steps: int = 1) -> None:
         """
         Offset a frame in a specified direction.
+        Afterward, the neighbouring frames of the same type are prefetched in the background.
 
         :param direction: Direction to move the frame.
         :param src_idx: Index of the source video.
         :param frame_idx: Index of the frame to offset.
+        :param steps: Number of matching frames to move by.
         """
 
         source = self.get_source(src_idx=src_idx)
-        source.offset(frame_idx=frame_idx, direction=direction)
+        source.offset(frame_idx=frame_idx, direction=direction, steps=steps)
+
+        if (frame_idx < len(source.frame_data) and (frame_data := source.frame_data[frame_idx]) is not None
+                and not frame_data.preview):
+            source.prefetcher.schedule(frame_idx=frame_idx, frame_data=frame_data)
 
-    def offset_all_frames(self, direction: Direction, src_idx: int) -> None:
+    def cancel_prefetch(self) -> None:
         """
-        Offset all frames of a source in a specified direction.
+        Cancels prefetching of all sources and discards the prefetched frames.
+        """
+
+        for frame_loader in self.sources.values():
+            frame_loader.prefetcher.cancel()
+
+    def offset_all_frames(self, direction: Direction, src_idx: int, steps: int = 1) -> None:
+        """
+        Offset all frames of a source in a specified direction, in a single pass over the source.
 
         :param direction: Direction to move all frames.
         :param src_idx: Index of the source video.
+        :param steps: Number of matching frames to move by.
         """
 
-        source = self.get_source(src_idx=src_idx)
-
-        for frame_idx, _ in enumerate(source.frame_data):
-            source.offset(frame_idx=frame_idx, direction=direction)
+        self.get_source(src_idx=src_idx).offset_all(direction=direction, steps=steps)
 
     def clear_frame_positions(self) -> None:
         """
@@ -174,58 +343,255 @@ class FrameLoaderManager:
         if self.frame_positions:
             self.frame_positions.clear()
 
-    def sample_all_frames(self) -> None:
+    def sample_all_frames(self, cancel_event: Optional[threading.Event] = None,
+                          focus: Optional[tuple[int, int]] = None,
+                          on_frame_ready: Optional[Callable[[int, int], None]] = None) -> None:
         """
         Sample frames from all sources.
+
+        :param cancel_event: Optional event, sampling is cancelled once it is set.
+        :param focus: Optional tuple containing the source index and frame index currently displayed.
+                      The focused frame and its neighbours are decoded first, starting with the focused source.
+        :param on_frame_ready: Optional callback, called with the source index and frame index of every decoded frame.
         """
         if self.sources:
-            self._sample_frames(list(self.sources.values()))
+            self._sample_frames(list(self.sources.values()), cancel_event=cancel_event, focus=focus,
+                                on_frame_ready=on_frame_ready)
 
-    def _generate_random_frame_positions(self, min_frame_pos: int, max_frame_pos: int, n_samples: int) -> list[int]:
+    def preview_all_frames(self, cancel_event: Optional[threading.Event] = None,
+                           on_frame_ready: Optional[Callable[[int, int], None]] = None) -> None:
         """
-        Generate sorted random frame positions within a range.
+        Fills the frames of all sources that are not decoded yet with keyframes close to them, see
+        ``FrameLoader.preview_frames``. Sources without a frame type index are not previewed.
+        Read errors are ignored, they are reported by the sampling that replaces the previews.
 
-        :param min_frame_pos: Minimum frame position (inclusive).
-        :param max_frame_pos: Maximum frame position (inclusive).
-        :param n_samples: Number of positions to generate.
-        :return: Sorted list of randomly generated frame positions.
+        :param cancel_event: Optional event, previewing is cancelled once it is set.
+        :param on_frame_ready: Optional callback, called with the source index and frame index of every stored frame.
+        :raises ``TaskCancelledError``: If previewing was cancelled.
         """
-        random.seed(self.seed)
-        frame_positions = sorted([random.randint(min_frame_pos, max_frame_pos) for _ in range(n_samples)])
+        if not self.sources:
+            return
 
-        return frame_positions
+        frame_loaders = list(self.sources.values())
+        self.cancel_prefetch()
+        self._adjust_frame_positions(frame_loaders)
+
+        def preview(src_idx: int) -> None:
+            try:
+                frame_loaders[src_idx].preview_frames(
+                    frame_positions=self.frame_positions,
+                    frame_type=self.frame_type,
+                    cancel_event=cancel_event,
+                    on_frame_ready=(lambda frame_idx: on_frame_ready(src_idx, frame_idx))
+                    if on_frame_ready is not None else None
+                )
+            except (ImageReadError, VideoCaptureFailed):
+                pass
+
+        if self.max_workers > 1 and len(frame_loaders) > 1:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(frame_loaders))) as executor:
+                futures: list[Future] = [executor.submit(preview, src_idx) for src_idx in range(len(frame_loaders))]
+
+            for future in futures:
+                future.result()
+        else:
+            for src_idx in range(len(frame_loaders)):
+                preview(src_idx)
+
+    def update_frame_tiers(self, frame_idx: int) -> None:
+        """
+        Moves the frames of all sources to the compressed tier, except for the current frame and its neighbours,
+        which are restored. Does nothing if the compressed tier is disabled.
 
-    def _sample_frames(self, frame_loaders: list[FrameLoader]) -> None:
+        :param frame_idx: Index of the current frame.
+        """
+        if self.frame_store.codec is None:
+            return
+
+        hot_frame_indices = set(self._priority_frame_indices(frame_idx))
+
+        for frame_loader in list(self.sources.values()):
+            for idx, frame_data in enumerate(frame_loader.frame_data):
+                if frame_data is None:
+                    continue
+
+                if idx in hot_frame_indices:
+                    self.frame_store.decompress(frame_data.frame_key)
+                else:
+                    self.frame_store.compress(frame_data.frame_key)
+
+    def _priority_frame_indices(self, frame_idx: int) -> list[int]:
+        """
+        Gets the frame indices to decode first, the focused frame followed by its neighbours in navigation order.
+
+        :param frame_idx: Index of the focused frame.
+        :return: List of frame indices, ordered by decreasing priority.
+        """
+        n_frames = len(self.frame_positions)
+
+        if n_frames == 0:
+            return []
+
+        frame_indices = [frame_idx % n_frames]
+
+        for distance in range(1, PRIORITY_NEIGHBOURS + 1):
+            frame_indices.extend([(frame_idx + distance) % n_frames, (frame_idx - distance) % n_frames])
+
+        return list(dict.fromkeys(frame_indices))
+
+    def _adjust_frame_positions(self, frame_loaders: list[FrameLoader]) -> None:
+        """
+        Adjusts frame positions based on the minimum total frames across all loaders.
+
+        Positions are generated if there are none. Otherwise, positions within the shortest video are kept,
+        so that already decoded frames stay valid, and the positions past its end are replaced by new positions
+        of the sampler, spread over the whole shortened range.
+
+        If `redraw_collapsed_positions` is set, a generated position whose search ends at the same frames of all
+        sources as another position is redrawn. This needs the frame type index of every source.
+
+        :param frame_loaders: List of frame loaders.
+        """
+        if (min_total_frames := min([frame_loader.total_frames for frame_loader in frame_loaders])) < max(
+                self.frame_positions, default=maxsize):
+            self.frame_positions = generate_frame_positions(seed=self.seed,
+                                                            n_samples=len(self.frame_positions) or self.n_samples,
+                                                            min_frame_pos=0,
+                                                            max_frame_pos=min_total_frames,
+                                                            resolve=self._frame_resolver(frame_loaders),
+                                                            kept_frame_positions=self.frame_positions)
+
+    def _frame_resolver(self, frame_loaders: list[FrameLoader]) -> Optional[Callable[[int], Hashable]]:
+        """
+        Gets a function mapping a frame position to the real frame positions a search from it ends at in every source.
+
+        :param frame_loaders: List of frame loaders.
+        :return: Function returning a tuple of real frame positions, one per source, or the frame position itself if
+                 it matches no frame in some source. ``None`` if collapsed positions are not redrawn, or if any
+                 source has no frame type index.
+        """
+        if not self.redraw_collapsed_positions or any(frame_loader.ensure_frame_index() is None
+                                                      for frame_loader in frame_loaders):
+            return None
+
+        def resolve(frame_position: int) -> Hashable:
+            real_frame_positions = tuple(frame_loader.resolve_frame_position(frame_position=frame_position,
+                                                                             frame_type=self.frame_type)
+                                         for frame_loader in frame_loaders)
+
+            # A position matching no frame in some source is never considered collapsed, integers differ from tuples.
+            return frame_position if None in real_frame_positions else real_frame_positions
+
+        return resolve
+
+    def _refine_frame_counts(self, frame_loaders: list[FrameLoader]) -> bool:
+        """
+        Refines provisional frame counts of loaders whose last frames are needed by the current frame positions.
+
+        :param frame_loaders: List of frame loaders.
+        :return: ``True`` if any frame count was corrected, ``False`` otherwise.
+        """
+        max_frame_position = max(self.frame_positions, default=0)
+        corrected = False
+
+        for frame_loader in frame_loaders:
+            if (not frame_loader.frame_count_exact
+                    and max_frame_position > frame_loader.total_frames - FRAME_COUNT_REFINE_MARGIN):
+                provisional_total_frames = frame_loader.total_frames
+
+                if frame_loader.refine_frame_count() != provisional_total_frames:
+                    corrected = True
+
+        return corrected
+
+    def pop_frame_count_corrections(self) -> list[tuple[Path, int]]:
+        """
+        Gets and clears the frame count corrections of all sources made since the last call, whether they were
+        refined during sampling or counted by the frame type index. Scaled frames of the corrected sources are
+        discarded, because their text information shows the previous frame count.
+
+        :return: List of tuples containing a video file path and its corrected total frames.
+        """
+        corrections: list[tuple[Path, int]] = []
+
+        for file_path, frame_loader in list(self.sources.items()):
+            if (total_frames := frame_loader.pop_frame_count_correction()) is not None:
+                self.scaled_frame_cache.discard_source(file_path)
+                corrections.append((file_path, total_frames))
+
+        return corrections
+
+    def _sample_frames(self, frame_loaders: list[FrameLoader], cancel_event: Optional[threading.Event] = None,
+                       focus: Optional[tuple[int, int]] = None,
+                       on_frame_ready: Optional[Callable[[int, int], None]] = None) -> None:
         """
         Adjusts frame positions based on the minimum total frames across all loaders
         and samples frames of the specified type from each loader.
 
+        Provisional frame counts are refined first if the frame positions reach the last frames of a video.
+        Sources are sampled concurrently on a thread pool, each loader owns its own ``VideoCapture`` object.
+        If a focus is given, sources are started in order of their distance to the focused source,
+        and each of them decodes the focused frame and its neighbours before the remaining frames.
+
         :param frame_loaders: List of frame loaders.
+        :param cancel_event: Optional event, sampling is cancelled once it is set.
+        :param focus: Optional tuple containing the source index and frame index currently displayed.
+        :param on_frame_ready: Optional callback, called with the source index and frame index of every decoded frame.
         :raises ``MultipleSourcesImageReadError``:  If frame reading fails for any loader.
+        :raises ``TaskCancelledError``: If sampling was cancelled.
         """
-        if (min_total_frames := min([frame_loader.total_frames for frame_loader in frame_loaders])) < max(
-                self.frame_positions, default=maxsize):
-            idx = bisect_right(self.frame_positions, min_total_frames)
-            new_frame_positions = self._generate_random_frame_positions(
-                min_frame_pos=(
-                        self.frame_positions[idx - 1 if idx > 0 else idx] + 1
-                ) if self.frame_positions else 0,
-                max_frame_pos=min_total_frames,
-                n_samples=self.n_samples - idx
-            )
-            self.frame_positions = self.frame_positions[:idx]
-            self.frame_positions.extend(new_frame_positions)
+        self.cancel_prefetch()
+        self._adjust_frame_positions(frame_loaders)
 
+        if self._refine_frame_counts(frame_loaders):
+            self._adjust_frame_positions(frame_loaders)
+
+        # Captures are shared only by the sources with frames to decode, e.g. a newly added source gets all of them.
+        n_busy_loaders = sum(1 for frame_loader in frame_loaders
+                             if frame_loader.pending_frames(frame_positions=self.frame_positions,
+                                                            frame_type=self.frame_type))
+        n_captures = self.captures_per_source or max(1, self.max_workers // max(1, n_busy_loaders))
         errors: list[ImageReadError or VideoCaptureFailed] = []
 
-        for frame_loader in frame_loaders:
-            try:
-                frame_loader.sample_frames(
-                    frame_positions=self.frame_positions,
-                    frame_type=self.frame_type
-                )
-            except (ImageReadError, VideoCaptureFailed) as e:
-                errors.append(e)
+        src_indices = list(range(len(frame_loaders)))
+        priority: Optional[list[int]] = None
+
+        if focus is not None:
+            focus_src_idx, focus_frame_idx = focus
+            src_indices.sort(key=lambda src_idx: min((src_idx - focus_src_idx) % len(frame_loaders),
+                                                     (focus_src_idx - src_idx) % len(frame_loaders)))
+            priority = self._priority_frame_indices(focus_frame_idx)
+
+        def sample_kwargs(src_idx: int) -> dict:
+            return {
+                'frame_positions': self.frame_positions,
+                'frame_type': self.frame_type,
+                'n_captures': n_captures,
+                'process_decoder': self.process_decoder,
+                'cancel_event': cancel_event,
+                'priority': priority,
+                'on_frame_ready': (lambda frame_idx: on_frame_ready(src_idx, frame_idx))
+                if on_frame_ready is not None else None
+            }
+
+        if self.max_workers > 1 and len(frame_loaders) > 1:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(frame_loaders))) as executor:
+                futures: list[Future] = [
+                    executor.submit(frame_loaders[src_idx].sample_frames, **sample_kwargs(src_idx))
+                    for src_idx in src_indices
+                ]
+
+            for future in futures:
+                try:
+                    future.result()
+                except (ImageReadError, VideoCaptureFailed) as e:
+                    errors.append(e)
+        else:
+            for src_idx in src_indices:
+                try:
+                    frame_loaders[src_idx].sample_frames(**sample_kwargs(src_idx))
+                except (ImageReadError, VideoCaptureFailed) as e:
+                    errors.append(e)
 
         if errors:
             raise MultipleSourcesImageReadError(errors=errors)
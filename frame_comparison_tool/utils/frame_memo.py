@@ -0,0 +1,175 @@
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+from frame_comparison_tool.utils.config import FRAME_MEMO_BUDGET_MB
+from frame_comparison_tool.utils.direction import Direction
+from frame_comparison_tool.utils.frame_store import FrameStore
+from frame_comparison_tool.utils.frame_type import FrameType
+
+FrameMemoKey = tuple[Path, int, FrameType, Direction]
+"""Video file, frame position a search started from, desired frame type and search direction."""
+
+
+class FrameMemo:
+    """
+    Memory-budgeted memo of frame search results, shared by the loaders of all videos.
+
+    Maps the video file, the frame position a search started from, the frame type and the search direction to the real
+    frame position that was found and the key of its frame in the ``FrameStore``. Every remembered frame holds
+    a reference in the store, so that it outlives the sample it was decoded for. Returning to a previously used frame
+    type, seed or offset is then served without searching or decoding.
+
+    The least recently used results of any video are forgotten once their distinct frames exceed the budget, so the
+    budget holds for all videos together.
+    """
+
+    def __init__(self, frame_store: FrameStore, budget_bytes: int = FRAME_MEMO_BUDGET_MB * 1024 * 1024):
+        """
+        Initializes a ``FrameMemo`` instance.
+
+        :param frame_store: Store holding the remembered frames.
+        :param budget_bytes: Maximal number of bytes of remembered frames, nothing is remembered if set to 0.
+        """
+        self.frame_store: FrameStore = frame_store
+        """Store holding the remembered frames."""
+        self.budget_bytes: int = budget_bytes
+        """Maximal number of bytes of remembered frames."""
+        self.hits: int = 0
+        """Number of lookups served from the memo."""
+        self.misses: int = 0
+        """Number of lookups that were not remembered."""
+        self._results: OrderedDict[FrameMemoKey, tuple[int, int]] = OrderedDict()
+        """Real frame positions and frame keys, ordered from least to most recently used."""
+        self._frame_results: dict[int, int] = {}
+        """Number of results referring to every remembered frame key."""
+        self._frame_bytes: dict[int, int] = {}
+        """Size of every remembered frame."""
+        self._bytes: int = 0
+        self._lock = threading.Lock()
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Gets the share of lookups served from the memo.
+
+        :return: Hit rate between 0 and 1, 0 if nothing was looked up yet.
+        """
+        lookups = self.hits + self.misses
+
+        return self.hits / lookups if lookups else 0.0
+
+    def lookup(self, file_path: Path, frame_position: int, frame_type: FrameType,
+               direction: Direction) -> Optional[tuple[int, int]]:
+        """
+        Gets a remembered search result and marks it as most recently used.
+
+        :param file_path: Path to the video file.
+        :param frame_position: Frame position the search starts from.
+        :param frame_type: Desired frame type.
+        :param direction: Search direction.
+        :return: Tuple containing the real frame position and the frame key, ``None`` if it is not remembered.
+                 The key holds a new reference, owned by the caller.
+        """
+        with self._lock:
+            if (result := self._results.get((file_path, frame_position, frame_type, direction))) is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._results.move_to_end((file_path, frame_position, frame_type, direction))
+            self.frame_store.retain(result[1])
+
+            return result
+
+    def follow(self, file_path: Path, frame_position: int, frame_type: FrameType, direction: Direction,
+               steps: int) -> Optional[tuple[int, int, int]]:
+        """
+        Gets the result of an offset by several matching frames, if every step is remembered.
+        The whole offset counts as a single lookup.
+
+        :param file_path: Path to the video file.
+        :param frame_position: Real frame position the offset starts from.
+        :param frame_type: Desired frame type.
+        :param direction: Offset direction.
+        :param steps: Number of matching frames to move by.
+        :return: Tuple containing the frame position the last step started from, the real frame position and
+                 the frame key, ``None`` if any step is not remembered. The key holds a new reference, owned by the
+                 caller.
+        """
+        with self._lock:
+            result: Optional[tuple[int, int, int]] = None
+
+            for _ in range(steps):
+                starting_position = frame_position + direction
+
+                if (step := self._results.get((file_path, starting_position, frame_type, direction))) is None:
+                    self.misses += 1
+                    return None
+
+                frame_position = step[0]
+                result = (starting_position, *step)
+
+            if result is not None:
+                self.hits += 1
+                self.frame_store.retain(result[2])
+
+            return result
+
+    def remember(self, file_path: Path, frame_position: int, frame_type: FrameType, direction: Direction,
+                 real_frame_position: int, frame_key: int, nbytes: int) -> None:
+        """
+        Remembers a search result, taking a reference to its frame. Replaces a previous result of the same search.
+
+        :param file_path: Path to the video file.
+        :param frame_position: Frame position the search started from.
+        :param frame_type: Desired frame type.
+        :param direction: Search direction.
+        :param real_frame_position: Real frame position that was found.
+        :param frame_key: Key of the frame in the store.
+        :param nbytes: Size of the frame.
+        """
+        if nbytes > self.budget_bytes:
+            return
+
+        key = (file_path, frame_position, frame_type, direction)
+
+        with self._lock:
+            if (previous := self._results.pop(key, None)) is not None:
+                self._forget(previous[1])
+
+            self.frame_store.retain(frame_key)
+            self._results[key] = (real_frame_position, frame_key)
+
+            if (frame_results := self._frame_results.get(frame_key, 0)) == 0:
+                self._frame_bytes[frame_key] = nbytes
+                self._bytes += nbytes
+
+            self._frame_results[frame_key] = frame_results + 1
+
+            while self._bytes > self.budget_bytes:
+                self._forget(self._results.popitem(last=False)[1][1])
+
+    def clear(self, file_path: Optional[Path] = None) -> None:
+        """
+        Forgets the results of a video, or all results, releasing their frames.
+
+        :param file_path: Optional path to the video file, results of all videos are forgotten if not given.
+        """
+        with self._lock:
+            for key in [key for key in self._results if file_path is None or key[0] == file_path]:
+                self._forget(self._results.pop(key)[1])
+
+    def _forget(self, frame_key: int) -> None:
+        """
+        Releases the frame of a forgotten result. Must be called with the lock held.
+
+        :param frame_key: Key of the frame.
+        """
+        self.frame_store.discard(frame_key)
+
+        if (frame_results := self._frame_results.pop(frame_key)) > 1:
+            self._frame_results[frame_key] = frame_results - 1
+        else:
+            self._bytes -= self._frame_bytes.pop(frame_key)
@@ -0,0 +1,245 @@
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Optional, TYPE_CHECKING
+
+import cv2
+import numpy as np
+from loguru import logger
+
+from frame_comparison_tool.utils.config import PREFETCH_DEPTH
+from frame_comparison_tool.utils.direction import Direction
+from frame_comparison_tool.utils.exceptions import NoMatchingFrameTypeError, ImageReadError, VideoCaptureFailed, \
+    FramePositionError
+from frame_comparison_tool.utils.frame_data import FrameData
+from frame_comparison_tool.utils.frame_type import FrameType
+
+if TYPE_CHECKING:
+    from frame_comparison_tool.utils.frame_loader import FrameLoader
+
+
+@dataclass(frozen=True)
+class PrefetchedFrame:
+    """
+    Class containing a prefetched frame and its positions.
+    """
+
+    original_frame_position: int
+    """
+    Position the search for the frame started from.
+    """
+    real_frame_position: int
+    """
+    Position of the frame.
+    """
+    frame: np.ndarray
+    """
+    Decoded frame.
+    """
+
+
+class FramePrefetcher:
+    """
+    Speculatively decodes the frames an offset of the current sample would move to.
+
+    After an offset is served, the next `depth` matching frames in both directions are decoded in the background
+    with a dedicated ``VideoCapture`` object and kept in a small ring, so that repeated offsets of the same sample
+    are served from memory. The ring belongs to a single sample, prefetching another sample discards it.
+    """
+
+    def __init__(self, frame_loader: 'FrameLoader', depth: int = PREFETCH_DEPTH):
+        """
+        Initializes a ``FramePrefetcher`` instance.
+
+        :param frame_loader: ``FrameLoader`` whose frames are prefetched.
+        :param depth: Number of matching frames prefetched in each direction, prefetching is disabled if set to 0.
+        """
+        self._frame_loader: 'FrameLoader' = frame_loader
+        self.depth: int = max(0, depth)
+        """Number of matching frames prefetched in each direction."""
+        self._ring: OrderedDict[tuple[int, Direction, FrameType], PrefetchedFrame] = OrderedDict()
+        """Prefetched frames keyed by the real frame position they are reached from, direction and frame type."""
+        self._frame_idx: Optional[int] = None
+        """Index of the sample the ring belongs to."""
+        self._lock = threading.Lock()
+        self._cancel_event = threading.Event()
+        """Event cancelling the running prefetch."""
+        self._executor: Optional[ThreadPoolExecutor] = None
+        """Single background thread, started on first use."""
+        self._video_capture: Optional[cv2.VideoCapture] = None
+        """``VideoCapture`` object used only by the background thread, opened on first use."""
+
+    @property
+    def capacity(self) -> int:
+        """
+        Gets the maximal number of frames kept in the ring.
+
+        :return: Ring capacity, the prefetched frames in both directions and the hop back to the previous frame.
+        """
+        return 2 * self.depth + 2
+
+    def lookup(self, frame_idx: int, frame_data: FrameData, direction: Direction,
+               steps: int) -> Optional[PrefetchedFrame]:
+        """
+        Gets the frame an offset would move to, if all of its steps were prefetched.
+
+        :param frame_idx: Index of the sample.
+        :param frame_data: Current frame data of the sample.
+        :param direction: Offset direction.
+        :param steps: Number of matching frames to move by.
+        :return: Prefetched frame reached by the offset, ``None`` if it was not prefetched.
+        """
+        with self._lock:
+            if frame_idx != self._frame_idx:
+                return None
+
+            result: Optional[PrefetchedFrame] = None
+            real_frame_position = frame_data.real_frame_position
+
+            for _ in range(steps):
+                result = self._ring.get((real_frame_position, direction, frame_data.frame_type))
+
+                if result is None:
+                    return None
+
+                real_frame_position = result.real_frame_position
+
+            return result
+
+    def remember(self, frame_idx: int, previous: FrameData, previous_frame: np.ndarray, current: FrameData,
+                 direction: Direction) -> None:
+        """
+        Stores the frame left by a single step offset, so that stepping back is served from memory.
+
+        :param frame_idx: Index of the sample.
+        :param previous: Frame data before the offset.
+        :param previous_frame: Frame before the offset.
+        :param current: Frame data after the offset.
+        :param direction: Offset direction.
+        """
+        if self.depth == 0 or previous.real_frame_position == current.real_frame_position:
+            return
+
+        back = Direction(-direction)
+
+        with self._lock:
+            if frame_idx == self._frame_idx:
+                self._store((current.real_frame_position, back, current.frame_type),
+                            PrefetchedFrame(original_frame_position=current.real_frame_position + back,
+                                            real_frame_position=previous.real_frame_position,
+                                            frame=previous_frame))
+
+    def schedule(self, frame_idx: int, frame_data: FrameData) -> None:
+        """
+        Starts prefetching around the current frame of a sample in the background.
+        The running prefetch is cancelled, and the ring is discarded if it belongs to another sample.
+
+        :param frame_idx: Index of the sample.
+        :param frame_data: Current frame data of the sample.
+        """
+        if self.depth == 0:
+            return
+
+        self._cancel_event.set()
+
+        with self._lock:
+            if frame_idx != self._frame_idx:
+                self._ring.clear()
+                self._frame_idx = frame_idx
+
+        self._cancel_event = threading.Event()
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1)
+
+        self._executor.submit(self._prefetch, frame_idx, frame_data, self._cancel_event)
+
+    def cancel(self) -> None:
+        """
+        Cancels the running prefetch and discards the ring.
+        """
+        self._cancel_event.set()
+
+        with self._lock:
+            self._ring.clear()
+            self._frame_idx = None
+
+    def shutdown(self) -> None:
+        """
+        Cancels the running prefetch and stops the background thread.
+        """
+        self.cancel()
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+        if self._video_capture is not None:
+            self._video_capture.release()
+            self._video_capture = None
+
+    def _store(self, key: tuple[int, Direction, FrameType], prefetched: PrefetchedFrame) -> None:
+        """
+        Stores a frame in the ring, evicting the oldest one if the ring is full. Must be called with the lock held.
+
+        :param key: Real frame position the frame is reached from, direction and frame type.
+        :param prefetched: Prefetched frame to store.
+        """
+        self._ring[key] = prefetched
+        self._ring.move_to_end(key)
+
+        while len(self._ring) > self.capacity:
+            self._ring.popitem(last=False)
+
+    def _prefetch(self, frame_idx: int, frame_data: FrameData, cancel_event: threading.Event) -> None:
+        """
+        Decodes the next matching frames in both directions, nearest first. Runs on the background thread.
+
+        :param frame_idx: Index of the sample.
+        :param frame_data: Current frame data of the sample.
+        :param cancel_event: Event cancelling this prefetch.
+        """
+        if self._video_capture is None:
+            self._video_capture = cv2.VideoCapture(filename=str(self._frame_loader.file_path.absolute()))
+
+        positions: dict[Direction, Optional[int]] = {Direction.FORWARD: frame_data.real_frame_position,
+                                                     Direction.BACKWARD: frame_data.real_frame_position}
+
+        for _ in range(self.depth):
+            for direction, real_frame_position in positions.items():
+                if real_frame_position is None or cancel_event.is_set():
+                    continue
+
+                key = (real_frame_position, direction, frame_data.frame_type)
+
+                with self._lock:
+                    prefetched = self._ring.get(key)
+
+                if prefetched is None:
+                    try:
+                        new_frame_position, frame = self._frame_loader._get_next_frame(
+                            frame_position=real_frame_position + direction,
+                            direction=direction,
+                            frame_type=frame_data.frame_type,
+                            video_capture=self._video_capture
+                        )
+                    except NoMatchingFrameTypeError:
+                        positions[direction] = None
+                        continue
+                    except (ImageReadError, VideoCaptureFailed, FramePositionError) as e:
+                        logger.debug(f"Prefetching from {self._frame_loader.file_name} stopped: {e}")
+                        positions[direction] = None
+                        continue
+
+                    prefetched = PrefetchedFrame(original_frame_position=real_frame_position + direction,
+                                                 real_frame_position=new_frame_position,
+                                                 frame=frame)
+
+                    with self._lock:
+                        if cancel_event.is_set() or frame_idx != self._frame_idx:
+                            return
+
+                        self._store(key, prefetched)
+
+                positions[direction] = prefetched.real_frame_position
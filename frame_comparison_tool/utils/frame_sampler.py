@@ -0,0 +1,86 @@
+import random
+from itertools import count
+from typing import Optional, Callable, Hashable
+
+
+def _van_der_corput(index: int) -> float:
+    """
+    Computes an element of the base 2 van der Corput sequence, by mirroring the binary digits of the index
+    around the binary point.
+
+    :param index: Index of the element.
+    :return: Element of the sequence, within [0, 1).
+    """
+    value, denominator = 0.0, 1.0
+
+    while index:
+        denominator *= 2
+        index, remainder = divmod(index, 2)
+        value += remainder / denominator
+
+    return value
+
+
+def generate_frame_positions(seed: int, n_samples: int, min_frame_pos: int, max_frame_pos: int,
+                             resolve: Optional[Callable[[int], Hashable]] = None,
+                             kept_frame_positions: Optional[list[int]] = None) -> list[int]:
+    """
+    Generates evenly spread, distinct frame positions within a range.
+
+    Positions are taken from a van der Corput sequence shifted by a random offset derived from the seed.
+    The positions generated for `n_samples` are always a subset of those generated for more samples,
+    so changing the number of samples keeps all positions the smaller count shares with the larger one.
+
+    If `resolve` is given, a position resolving to the same frame as an already chosen one is redrawn, i.e. replaced
+    by the next position of the sequence. Such positions are only used once the range holds no other.
+
+    If `kept_frame_positions` are given, those within the range are used first and the sequence only fills in the
+    remaining positions, spread over the whole range.
+
+    If the range holds fewer frames than requested, every frame of the range is used and the remaining positions
+    repeat them.
+
+    :param seed: Random seed.
+    :param n_samples: Number of positions to generate.
+    :param min_frame_pos: Minimum frame position (inclusive).
+    :param max_frame_pos: Maximum frame position (inclusive).
+    :param resolve: Optional function mapping a frame position to the frame a search from it ends at.
+    :param kept_frame_positions: Optional frame positions to keep, e.g. the ones whose frames are decoded already.
+    :return: Sorted list of frame positions.
+    """
+    n_frames = max_frame_pos - min_frame_pos + 1
+
+    if n_samples <= 0 or n_frames <= 0:
+        return []
+
+    shift = random.Random(seed).random()
+    n_distinct = min(n_samples, n_frames)
+    frame_positions: dict[int, None] = dict.fromkeys(frame_position for frame_position in kept_frame_positions or []
+                                                     if min_frame_pos <= frame_position <= max_frame_pos)
+    collapsed_frame_positions: dict[int, None] = {}
+    resolved_frames: set[Hashable] = {resolve(frame_position) for frame_position in frame_positions} \
+        if resolve is not None else set()
+    # Enough elements of the sequence to hit every position of the range.
+    max_index = 2 << n_frames.bit_length()
+
+    for index in count():
+        if len(frame_positions) == n_distinct or index == max_index:
+            break
+
+        frame_position = min(min_frame_pos + int(((_van_der_corput(index) + shift) % 1.0) * n_frames), max_frame_pos)
+
+        if frame_position in frame_positions or frame_position in collapsed_frame_positions:
+            continue
+
+        if resolve is not None:
+            if (resolved_frame := resolve(frame_position)) in resolved_frames:
+                collapsed_frame_positions[frame_position] = None
+                continue
+
+            resolved_frames.add(resolved_frame)
+
+        frame_positions[frame_position] = None
+
+    distinct_frame_positions = [*frame_positions, *collapsed_frame_positions][:n_distinct]
+
+    return sorted(distinct_frame_positions[i % n_distinct] for i in range(n_samples))
@@ -0,0 +1,398 @@
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from itertools import count
+from pathlib import Path
+from typing import Optional, BinaryIO, Hashable
+
+import numpy as np
+
+from frame_comparison_tool.utils.config import FRAME_STORE_BUDGET_MB, FRAME_STORE_SPILL_DIR
+from frame_comparison_tool.utils.frame_codec import FrameCodec
+from frame_comparison_tool.utils.frame_compression import CompressedFrame, compress_frame, decompress_frame
+
+
+@dataclass(frozen=True)
+class _SpillSlot:
+    """
+    Location of a spilled frame inside the scratch file.
+    """
+
+    offset: int
+    """
+    Byte offset of the frame in the scratch file.
+    """
+    shape: tuple[int, ...]
+    """
+    Frame shape.
+    """
+    dtype: np.dtype
+    """
+    Frame data type.
+    """
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Gets the size of the slot.
+
+        :return: Number of bytes occupied by the frame.
+        """
+        return int(np.prod(self.shape)) * self.dtype.itemsize
+
+
+class FrameStore:
+    """
+    Memory-budgeted store of decoded frames.
+
+    Every frame is reference counted, ``put`` creates the first reference, ``retain`` adds one and ``discard``
+    releases one. A frame is removed once its last reference is released.
+
+    Frames can be stored under a content key, e.g. their source and real frame position. Storing another frame under
+    the content key of a stored frame only adds a reference to the stored frame, so identical frames share one array.
+
+    Frames are kept in memory until their total size exceeds the budget. The least recently used frames are then
+    spilled to a scratch file and dropped from memory. Reading a spilled frame maps it from the scratch file and
+    brings it back into memory. Frames are never decoded again.
+
+    If a codec is set, frames kept in memory can additionally be moved to a compressed tier. A compressed frame is
+    restored on its next read.
+    """
+
+    def __init__(self, budget_bytes: int = FRAME_STORE_BUDGET_MB * 1024 * 1024, spill_dir: Optional[Path] = None,
+                 codec: Optional[FrameCodec] = None):
+        """
+        Initializes a ``FrameStore`` instance.
+
+        :param budget_bytes: Maximal number of bytes of frames kept in memory, the budget is unlimited if set to 0.
+        :param spill_dir: Directory of the scratch file, defaults to the temporary directory.
+        :param codec: Optional codec of the compressed tier, frames are never compressed if not set.
+        """
+        self.budget_bytes: int = budget_bytes
+        """Maximal number of bytes of frames kept in memory, unlimited if 0."""
+        self.spill_dir: Optional[Path] = spill_dir or (Path(FRAME_STORE_SPILL_DIR) if FRAME_STORE_SPILL_DIR else None)
+        """Directory of the scratch file."""
+        self.hits: int = 0
+        """Number of reads served from memory."""
+        self.misses: int = 0
+        """Number of reads served from the scratch file."""
+        self.codec: Optional[FrameCodec] = codec
+        """Codec of the compressed tier."""
+        self.decompressions: int = 0
+        """Number of frames restored from the compressed tier."""
+        self.decompress_seconds: float = 0.0
+        """Total time spent restoring frames from the compressed tier."""
+        self._resident: OrderedDict[int, np.ndarray | CompressedFrame] = OrderedDict()
+        """Frames kept in memory, ordered from least to most recently used."""
+        self._resident_bytes: int = 0
+        self._compressed_bytes: int = 0
+        self._compressed_raw_bytes: int = 0
+        self._spilled: dict[int, _SpillSlot] = {}
+        """Scratch file slots of spilled frames."""
+        self._free_slots: dict[int, list[_SpillSlot]] = {}
+        """Scratch file slots of discarded frames, grouped by size."""
+        self._references: dict[int, int] = {}
+        """Number of references to every stored frame."""
+        self._content_keys: dict[Hashable, int] = {}
+        """Keys of the frames stored under a content key."""
+        self._key_contents: dict[int, Hashable] = {}
+        """Content keys of the frames stored under one."""
+        self.deduplicated: int = 0
+        """Number of frames that were not stored, because a frame with the same content key was stored already."""
+        self._scratch_file: Optional[BinaryIO] = None
+        """Scratch file, created on the first spill."""
+        self._scratch_size: int = 0
+        self._keys = count()
+        self._lock = threading.RLock()
+
+    @property
+    def resident_bytes(self) -> int:
+        """
+        Gets the number of bytes of frames kept in memory.
+
+        :return: Number of bytes.
+        """
+        return self._resident_bytes
+
+    @property
+    def spilled_frames(self) -> int:
+        """
+        Gets the number of frames stored in the scratch file.
+
+        :return: Number of spilled frames.
+        """
+        return len(self._spilled)
+
+    @property
+    def compression_ratio(self) -> float:
+        """
+        Gets the compression ratio of the frames in the compressed tier.
+
+        :return: Ratio of uncompressed to compressed bytes, 1 if no frame is compressed.
+        """
+        return self._compressed_raw_bytes / self._compressed_bytes if self._compressed_bytes else 1.0
+
+    @property
+    def mean_decompress_latency(self) -> float:
+        """
+        Gets the mean time needed to restore a frame from the compressed tier.
+
+        :return: Mean latency in seconds, 0 if no frame was restored yet.
+        """
+        return self.decompress_seconds / self.decompressions if self.decompressions else 0.0
+
+    def put(self, frame: np.ndarray, content_key: Optional[Hashable] = None) -> int:
+        """
+        Adds a frame to the store. If a frame with the same content key is stored already, a reference to it is
+        added instead.
+
+        :param frame: Frame to be stored, must not be modified afterward.
+        :param content_key: Optional key identifying the content of the frame.
+        :return: Key of the stored frame, holding one reference.
+        """
+        with self._lock:
+            if content_key is not None and (key := self._content_keys.get(content_key)) is not None:
+                self._references[key] += 1
+                self.deduplicated += 1
+                return key
+
+            key = next(self._keys)
+            self._references[key] = 1
+            self._add_resident(key, frame)
+
+            if content_key is not None:
+                self._content_keys[content_key] = key
+                self._key_contents[key] = content_key
+
+            return key
+
+    def lookup(self, content_key: Hashable) -> Optional[int]:
+        """
+        Finds a frame by its content key and adds a reference to it.
+
+        :param content_key: Key identifying the content of the frame.
+        :return: Key of the stored frame, holding a new reference owned by the caller. ``None`` if no frame is stored
+                 under the content key.
+        """
+        with self._lock:
+            if (key := self._content_keys.get(content_key)) is not None:
+                self._references[key] += 1
+
+            return key
+
+    def get(self, key: int) -> np.ndarray:
+        """
+        Gets a frame and marks it as most recently used. A spilled frame is read back into memory.
+
+        :param key: Key of the frame.
+        :return: Stored frame.
+        :raises ``KeyError``: If there is no frame with the given key.
+        """
+        with self._lock:
+            if (frame := self._resident.get(key)) is not None:
+                self.hits += 1
+                self._resident.move_to_end(key)
+
+                if isinstance(frame, CompressedFrame):
+                    frame = self._restore(key, frame)
+
+                return frame
+
+            self.misses += 1
+
+            # The scratch file slot is kept, so the frame is not written again once it is evicted.
+            frame = np.array(self._map(self._spilled[key]))
+            self._add_resident(key, frame)
+
+            return frame
+
+    def peek(self, key: int) -> np.ndarray:
+        """
+        Gets a frame without changing its recency or the hit and miss counts.
+
+        :param key: Key of the frame.
+        :return: Stored frame, a copy read from the scratch file if it was spilled. Its scratch file slot may be reused
+                 once the frame is discarded, so the mapped frame itself is never returned.
+        :raises ``KeyError``: If there is no frame with the given key.
+        """
+        with self._lock:
+            if (frame := self._resident.get(key)) is not None:
+                return decompress_frame(frame) if isinstance(frame, CompressedFrame) else frame
+
+            return np.array(self._map(self._spilled[key]))
+
+    def compress(self, key: int) -> None:
+        """
+        Moves a frame kept in memory to the compressed tier, without changing its recency.
+        Does nothing if no codec is set, or if the frame is spilled or already compressed.
+
+        :param key: Key of the frame.
+        """
+        with self._lock:
+            if self.codec is None or not isinstance(frame := self._resident.get(key), np.ndarray):
+                return
+
+            compressed = compress_frame(frame, self.codec)
+            self._resident[key] = compressed
+            self._resident_bytes += compressed.nbytes - frame.nbytes
+            self._compressed_bytes += compressed.nbytes
+            self._compressed_raw_bytes += compressed.raw_nbytes
+
+    def decompress(self, key: int) -> None:
+        """
+        Restores a frame from the compressed tier ahead of its next read, without changing its recency.
+        Does nothing if the frame is not compressed.
+
+        :param key: Key of the frame.
+        """
+        with self._lock:
+            if isinstance(compressed := self._resident.get(key), CompressedFrame):
+                self._restore(key, compressed)
+
+    def retain(self, key: int) -> None:
+        """
+        Adds a reference to a frame, so that it is kept until the reference is released with ``discard``.
+
+        :param key: Key of the frame.
+        :raises ``KeyError``: If there is no frame with the given key.
+        """
+        with self._lock:
+            self._references[key] += 1
+
+    def discard(self, key: int) -> None:
+        """
+        Releases a reference to a frame and removes the frame from the store once no reference is left.
+        Does nothing if there is no frame with the given key.
+
+        :param key: Key of the frame.
+        """
+        with self._lock:
+            if (references := self._references.pop(key, 0)) > 1:
+                self._references[key] = references - 1
+                return
+
+            if (content_key := self._key_contents.pop(key, None)) is not None:
+                del self._content_keys[content_key]
+
+            if (frame := self._resident.pop(key, None)) is not None:
+                self._resident_bytes -= frame.nbytes
+
+                if isinstance(frame, CompressedFrame):
+                    self._uncount_compressed(frame)
+
+            if (slot := self._spilled.pop(key, None)) is not None:
+                self._free_slots.setdefault(slot.nbytes, []).append(slot)
+
+    def close(self) -> None:
+        """
+        Removes all frames and deletes the scratch file.
+        """
+        with self._lock:
+            self._resident.clear()
+            self._resident_bytes = 0
+            self._compressed_bytes = 0
+            self._compressed_raw_bytes = 0
+            self._spilled.clear()
+            self._free_slots.clear()
+            self._references.clear()
+            self._content_keys.clear()
+            self._key_contents.clear()
+
+            if self._scratch_file is not None:
+                self._scratch_file.close()
+                self._scratch_file = None
+                self._scratch_size = 0
+
+    def _add_resident(self, key: int, frame: np.ndarray) -> None:
+        """
+        Keeps a frame in memory and evicts the least recently used frames if the budget is exceeded.
+        Must be called with the lock held.
+
+        :param key: Key of the frame.
+        :param frame: Frame to be kept.
+        """
+        self._resident[key] = frame
+        self._resident_bytes += frame.nbytes
+        self._evict()
+
+    def _evict(self) -> None:
+        """
+        Spills the least recently used frames until the frames kept in memory fit into the budget.
+        Must be called with the lock held.
+        """
+        # The most recently used frame is never evicted, even if it alone exceeds the budget.
+        while self.budget_bytes and self._resident_bytes > self.budget_bytes and len(self._resident) > 1:
+            evicted_key, evicted_frame = self._resident.popitem(last=False)
+            self._resident_bytes -= evicted_frame.nbytes
+
+            if isinstance(evicted_frame, CompressedFrame):
+                self._uncount_compressed(evicted_frame)
+
+                if evicted_key not in self._spilled:
+                    evicted_frame = decompress_frame(evicted_frame)
+
+            if evicted_key not in self._spilled:
+                self._spilled[evicted_key] = self._spill(evicted_frame)
+
+    def _restore(self, key: int, compressed: CompressedFrame) -> np.ndarray:
+        """
+        Replaces a compressed frame with its restored frame, in place. Must be called with the lock held.
+
+        :param key: Key of the frame.
+        :param compressed: Compressed frame stored under the key.
+        :return: Restored frame.
+        """
+        start = time.perf_counter()
+        frame = decompress_frame(compressed)
+        self.decompress_seconds += time.perf_counter() - start
+        self.decompressions += 1
+
+        self._resident[key] = frame
+        self._resident_bytes += frame.nbytes - compressed.nbytes
+        self._uncount_compressed(compressed)
+        self._evict()
+
+        return frame
+
+    def _uncount_compressed(self, compressed: CompressedFrame) -> None:
+        """
+        Removes a frame leaving the compressed tier from the compression statistics. Must be called with the lock held.
+
+        :param compressed: Compressed frame.
+        """
+        self._compressed_bytes -= compressed.nbytes
+        self._compressed_raw_bytes -= compressed.raw_nbytes
+
+    def _spill(self, frame: np.ndarray) -> _SpillSlot:
+        """
+        Writes a frame to the scratch file, reusing a free slot of the same size if there is one.
+        Must be called with the lock held.
+
+        :param frame: Frame to be written.
+        :return: Scratch file slot of the frame.
+        """
+        if self._scratch_file is None:
+            self._scratch_file = tempfile.TemporaryFile(prefix='frame-store-', dir=self.spill_dir)
+
+        if free_slots := self._free_slots.get(frame.nbytes):
+            offset = free_slots.pop().offset
+        else:
+            offset = self._scratch_size
+            self._scratch_size += frame.nbytes
+
+        self._scratch_file.seek(offset)
+        self._scratch_file.write(np.ascontiguousarray(frame).tobytes())
+        self._scratch_file.flush()
+
+        return _SpillSlot(offset=offset, shape=frame.shape, dtype=frame.dtype)
+
+    def _map(self, slot: _SpillSlot) -> np.ndarray:
+        """
+        Maps a spilled frame from the scratch file, without reading it.
+
+        :param slot: Scratch file slot of the frame.
+        :return: Read-only frame backed by the scratch file.
+        """
+        return np.memmap(self._scratch_file, dtype=slot.dtype, mode='r', offset=slot.offset, shape=slot.shape)
@@ -0,0 +1,148 @@
+import hashlib
+import json
+import os
+import sys
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Optional
+
+from loguru import logger
+
+from frame_comparison_tool.utils.config import PROBE_CACHE_DIR, PROBE_CACHE_HASH_BYTES
+
+_CACHE_VERSION = 1
+
+
+@dataclass(frozen=True)
+class ProbeResult:
+    """
+    Class containing the probed properties of a video file.
+    """
+
+    total_frames: int
+    """
+    Position of the last readable frame.
+    """
+    width: int
+    """
+    Frame width.
+    """
+    height: int
+    """
+    Frame height.
+    """
+    fps: float
+    """
+    Frames per second.
+    """
+    frame_count_exact: bool = False
+    """
+    Whether `total_frames` was confirmed or only reported by the container.
+    """
+    frame_types: Optional[str] = None
+    """
+    Serialized ``FrameIndex``, ``None`` if the index was not built.
+    """
+
+
+class ProbeCache:
+    """
+    On-disk cache of ``ProbeResult`` objects.
+
+    Every video file gets its own entry, keyed by its absolute path. An entry is only valid while the file identity
+    (size, modification time and a hash of the first bytes) matches the one stored alongside the result.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        """
+        Initializes a ``ProbeCache`` instance.
+
+        :param cache_dir: Directory containing the cache entries, defaults to the user cache directory.
+        """
+        self.cache_dir: Path = cache_dir or default_cache_dir()
+        """Directory containing the cache entries."""
+
+    def _entry_path(self, file_path: Path) -> Path:
+        """
+        Gets the path of the cache entry belonging to a video file.
+
+        :param file_path: Path to the video file.
+        :return: Path to the cache entry.
+        """
+        key = hashlib.sha1(str(file_path.absolute()).encode()).hexdigest()
+        return self.cache_dir / f"{key}.json"
+
+    @staticmethod
+    def _file_identity(file_path: Path) -> dict[str, int | str]:
+        """
+        Gets the identity of a video file.
+
+        :param file_path: Path to the video file.
+        :return: Dictionary containing the file size, modification time and hash of the first bytes.
+        """
+        stat = file_path.stat()
+
+        with open(file_path, 'rb') as file:
+            content_hash = hashlib.sha1(file.read(PROBE_CACHE_HASH_BYTES)).hexdigest()
+
+        return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'hash': content_hash}
+
+    def load(self, file_path: Path) -> Optional[ProbeResult]:
+        """
+        Loads the cached probe result of a video file.
+
+        :param file_path: Path to the video file.
+        :return: Cached ``ProbeResult``, ``None`` if there is no valid entry.
+        """
+        entry_path = self._entry_path(file_path)
+
+        try:
+            if not entry_path.exists():
+                return None
+
+            entry = json.loads(entry_path.read_text())
+
+            if entry.get('version') != _CACHE_VERSION or entry.get('identity') != self._file_identity(file_path):
+                return None
+
+            return ProbeResult(**entry['result'])
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Could not load probe cache entry for {file_path}: {e}")
+            return None
+
+    def store(self, file_path: Path, result: ProbeResult) -> None:
+        """
+        Stores the probe result of a video file.
+
+        :param file_path: Path to the video file.
+        :param result: Probe result to be stored.
+        """
+        entry_path = self._entry_path(file_path)
+        entry = {'version': _CACHE_VERSION, 'identity': self._file_identity(file_path), 'result': asdict(result)}
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = entry_path.with_suffix('.tmp')
+            tmp_path.write_text(json.dumps(entry))
+            tmp_path.replace(entry_path)
+        except OSError as e:
+            logger.warning(f"Could not store probe cache entry for {file_path}: {e}")
+
+
+def default_cache_dir() -> Path:
+    """
+    Gets the platform specific cache directory of the application.
+
+    :return: Path to the cache directory.
+    """
+    if PROBE_CACHE_DIR:
+        return Path(PROBE_CACHE_DIR)
+
+    if sys.platform == 'win32':
+        base_dir = Path(os.getenv('LOCALAPPDATA', Path.home() / 'AppData' / 'Local'))
+    elif sys.platform == 'darwin':
+        base_dir = Path.home() / 'Library' / 'Caches'
+    else:
+        base_dir = Path(os.getenv('XDG_CACHE_HOME', Path.home() / '.cache'))
+
+    return base_dir / 'frame-comparison-tool' / 'probe'
@@ -0,0 +1,211 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, Future
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from frame_comparison_tool.utils.cv2_utilities import encode_frame
+from frame_comparison_tool.utils.exceptions import ImageReadError, VideoCaptureFailed, NoMatchingFrameTypeError
+from frame_comparison_tool.utils.frame_format import FrameFormat
+from frame_comparison_tool.utils.frame_type import FrameType
+
+_child_frame_loaders: dict[Path, 'FrameLoader'] = {}
+"""Frame loaders opened inside a child process, reused between calls."""
+
+
+def _decode_shard(file_path: Path, shard: list[tuple[int, int]], frame_type: FrameType, total_frames: int,
+                  frame_types: Optional[str], frame_format: FrameFormat, block_names: list[str]) \
+        -> tuple[list[tuple[int, int, Optional[np.ndarray], tuple[int, ...], str]], Optional[str]]:
+    """
+    Decodes one shard of frame positions inside a child process and writes every frame into a shared memory block
+    created by the parent process, the n-th decoded frame into the n-th block.
+
+    The child only attaches to the blocks, the parent keeps them open, so they outlive the child's handles on every
+    platform. A frame larger than its block is returned in the result instead.
+    Decoding stops at the first error. Exceptions are reported by name, because they cannot be pickled faithfully.
+
+    :param file_path: Path to the video file.
+    :param shard: List of tuples containing a frame index and its starting frame position.
+    :param frame_type: Desired frame type.
+    :param total_frames: Total number of frames known to the parent ``FrameLoader``.
+    :param frame_types: Serialized ``FrameIndex`` of the parent ``FrameLoader``, ``None`` if it was not built.
+    :param frame_format: Frame format of the parent ``FrameLoader``.
+    :param block_names: Names of the shared memory blocks, one per frame of the shard.
+    :return: Tuple containing a list of decoded frames and the name of the raised exception, ``None`` on success.
+             Each decoded frame is described by its frame index, real frame position, the frame itself if it did not
+             fit into its block, frame shape and frame data type.
+    """
+    from frame_comparison_tool.utils.frame_index import FrameIndex
+    from frame_comparison_tool.utils.frame_loader import FrameLoader
+
+    if (frame_loader := _child_frame_loaders.get(file_path)) is None:
+        frame_loader = FrameLoader(file_path=file_path)
+        _child_frame_loaders[file_path] = frame_loader
+
+    frame_loader.total_frames = total_frames
+    frame_loader.frame_format = frame_format
+
+    if frame_types is not None and frame_loader.frame_index is None:
+        frame_loader.frame_index = FrameIndex.from_string(frame_types)
+
+    results: list[tuple[int, int, Optional[np.ndarray], tuple[int, ...], str]] = []
+
+    try:
+        # Seek costs are measured by the loader of the child process and kept between calls.
+        for (idx, _, real_frame_position, frame), name in zip(frame_loader._decode_shard(shard=shard,
+                                                                                         frame_type=frame_type),
+                                                              block_names):
+            shared_memory = SharedMemory(name=name)
+
+            try:
+                if frame.nbytes <= shared_memory.size:
+                    np.ndarray(frame.shape, dtype=frame.dtype, buffer=shared_memory.buf)[:] = frame
+                    results.append((idx, real_frame_position, None, frame.shape, frame.dtype.str))
+                else:
+                    results.append((idx, real_frame_position, frame, frame.shape, frame.dtype.str))
+            finally:
+                shared_memory.close()
+    except (ImageReadError, VideoCaptureFailed, NoMatchingFrameTypeError) as e:
+        return results, type(e).__name__
+
+    return results, None
+
+
+def _free_block(shared_memory: SharedMemory) -> None:
+    """
+    Closes and removes a shared memory block.
+
+    :param shared_memory: Shared memory block.
+    """
+    shared_memory.close()
+
+    if os.name == 'posix':
+        shared_memory.unlink()
+
+
+def _read_block(shared_memory: SharedMemory, shape: tuple[int, ...], dtype: str) -> np.ndarray:
+    """
+    Copies a frame written by a child process out of its shared memory block, then closes and removes the block.
+
+    :param shared_memory: Shared memory block.
+    :param shape: Frame shape.
+    :param dtype: Frame data type.
+    :return: Copy of the frame.
+    """
+    try:
+        block_frame = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shared_memory.buf)
+        frame = block_frame.copy()
+        # The block cannot be closed while an array still exports its buffer.
+        del block_frame
+    finally:
+        _free_block(shared_memory)
+
+    return frame
+
+
+class ProcessDecoder:
+    """
+    Decodes frames in a pool of child processes.
+
+    Child processes decode and convert frames, then write them into shared memory blocks created by the application
+    process, so frames are never pickled between processes. The application process copies every frame out of its
+    block and frees the block right away, so no shared memory outlives the call.
+    Blocks are sized for frames of the video resolution, frames of another size are sent back pickled.
+    """
+
+    def __init__(self, max_workers: int):
+        """
+        Initializes a ``ProcessDecoder`` instance.
+
+        :param max_workers: Number of child processes.
+        """
+        self.max_workers: int = max(1, max_workers)
+        """Number of child processes."""
+        self._executor: Optional[ProcessPoolExecutor] = None
+        """Process pool, started on first use."""
+
+    def sample_shards(self, file_path: Path, shards: list[list[tuple[int, int]]], frame_type: FrameType,
+                      total_frames: int, frame_types: Optional[str], frame_format: FrameFormat,
+                      resolution: tuple[int, int]) -> list[tuple[int, int, np.ndarray]]:
+        """
+        Samples frames of all shards concurrently, one shard per child process task.
+
+        :param file_path: Path to the video file.
+        :param shards: List of shards, each containing tuples of a frame index and its starting frame position.
+        :param frame_type: Desired frame type.
+        :param total_frames: Total number of frames of the video.
+        :param frame_types: Serialized ``FrameIndex``, ``None`` if it was not built.
+        :param frame_format: Format the frames are converted to.
+        :param resolution: Width and height of the video, used to size the shared memory blocks.
+        :return: List of tuples containing a frame index, the real frame position and the frame.
+        :raises ``ImageReadError``: If frame reading fails.
+        :raises ``VideoCaptureFailed``: If the ``VideoCapture`` object is not open.
+        :raises ``NoMatchingFrameTypeError``: If no frame of matching type was found.
+        """
+        if self._executor is None:
+            # Child processes must share the resource tracker of this process, otherwise blocks the children
+            # attach to would still be reported as leaked by their own trackers after being unlinked here.
+            resource_tracker.ensure_running()
+            # Forked children could inherit locks held by background threads of this process, e.g. while a frame type
+            # index is built, and deadlock on them.
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers,
+                                                 mp_context=multiprocessing.get_context('spawn'))
+
+        width, height = resolution
+        frame_nbytes = encode_frame(np.empty((height, width, 3), dtype=np.uint8), frame_format).nbytes
+        blocks: list[list[SharedMemory]] = [[SharedMemory(create=True, size=max(1, frame_nbytes)) for _ in shard]
+                                           for shard in shards]
+
+        futures: list[Future] = [
+            self._executor.submit(_decode_shard, file_path, shard, frame_type, total_frames, frame_types,
+                                  frame_format, [shared_memory.name for shared_memory in shard_blocks])
+            for shard, shard_blocks in zip(shards, blocks)
+        ]
+
+        buffer: list[tuple[int, int, np.ndarray]] = []
+        error: Optional[str] = None
+        failure: Optional[Exception] = None
+
+        # All futures are awaited, even after an error, so that no block is freed while a child still writes to it.
+        for future, shard_blocks in zip(futures, blocks):
+            try:
+                results, shard_error = future.result()
+            except Exception as e:
+                results, shard_error = [], None
+                failure = failure or e
+
+            error = error or shard_error
+
+            for shared_memory, (idx, real_frame_position, frame, shape, dtype) in zip(shard_blocks, results):
+                if frame is None:
+                    frame = _read_block(shared_memory=shared_memory, shape=shape, dtype=dtype)
+                else:
+                    _free_block(shared_memory)
+
+                buffer.append((idx, real_frame_position, frame))
+
+            for shared_memory in shard_blocks[len(results):]:
+                _free_block(shared_memory)
+
+        if failure is not None:
+            raise failure
+        elif error == ImageReadError.__name__:
+            raise ImageReadError(source=file_path)
+        elif error == VideoCaptureFailed.__name__:
+            raise VideoCaptureFailed()
+        elif error == NoMatchingFrameTypeError.__name__:
+            raise NoMatchingFrameTypeError(frame_type.value)
+
+        return buffer
+
+    def shutdown(self) -> None:
+        """
+        Stops all child processes.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
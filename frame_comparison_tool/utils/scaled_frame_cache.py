@@ -0,0 +1,124 @@
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from frame_comparison_tool.utils.config import SCALED_CACHE_MB, SCALED_CACHE_LEVELS
+
+ScaledFrameKey = tuple[Path, int, int, bool]
+"""Source path, frame index, real frame position and whether the overlay was added."""
+
+
+class ScaledFrameCache:
+    """
+    Memory-budgeted cache of frames fitted to display sizes.
+
+    Every frame keeps a small pyramid of scaled versions, one per display size, so that switching between recently
+    used window sizes does not scale the frame again. Frames are keyed by their real frame position, so an offset
+    frame never reuses the scaled versions of the frame it replaced. The least recently used frames are dropped once
+    the budget is exceeded.
+    """
+
+    def __init__(self, budget_bytes: int = SCALED_CACHE_MB * 1024 * 1024, levels: int = SCALED_CACHE_LEVELS):
+        """
+        Initializes a ``ScaledFrameCache`` instance.
+
+        :param budget_bytes: Maximal number of bytes of scaled frames kept, caching is disabled if set to 0.
+        :param levels: Maximal number of display sizes kept per frame.
+        """
+        self.budget_bytes: int = budget_bytes
+        """Maximal number of bytes of scaled frames kept."""
+        self.levels: int = max(1, levels)
+        """Maximal number of display sizes kept per frame."""
+        self.hits: int = 0
+        """Number of lookups served from the cache."""
+        self.misses: int = 0
+        """Number of lookups of frames that were not scaled yet."""
+        self._pyramids: OrderedDict[ScaledFrameKey, OrderedDict[tuple[int, int], np.ndarray]] = OrderedDict()
+        """Scaled versions of every frame by display size, ordered from least to most recently used."""
+        self._bytes: int = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: ScaledFrameKey, size: tuple[int, int]) -> Optional[np.ndarray]:
+        """
+        Gets a scaled frame and marks it as most recently used.
+
+        :param key: Key of the frame.
+        :param size: Display size the frame was fitted to.
+        :return: Scaled frame, ``None`` if it is not cached.
+        """
+        with self._lock:
+            if (pyramid := self._pyramids.get(key)) is None or (frame := pyramid.get(size)) is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._pyramids.move_to_end(key)
+            pyramid.move_to_end(size)
+
+            return frame
+
+    def peek(self, key: ScaledFrameKey, size: tuple[int, int]) -> Optional[np.ndarray]:
+        """
+        Gets a scaled frame without changing its recency or the hit and miss counts.
+
+        :param key: Key of the frame.
+        :param size: Display size the frame was fitted to.
+        :return: Scaled frame, ``None`` if it is not cached.
+        """
+        with self._lock:
+            return pyramid.get(size) if (pyramid := self._pyramids.get(key)) is not None else None
+
+    def put(self, key: ScaledFrameKey, size: tuple[int, int], frame: np.ndarray) -> None:
+        """
+        Adds a scaled frame, dropping the least recently used display size of the frame and the least recently used
+        frames if the limits are exceeded.
+
+        :param key: Key of the frame.
+        :param size: Display size the frame was fitted to.
+        :param frame: Scaled frame, must not be modified afterward.
+        """
+        if frame.nbytes > self.budget_bytes:
+            return
+
+        with self._lock:
+            pyramid = self._pyramids.setdefault(key, OrderedDict())
+            self._pyramids.move_to_end(key)
+
+            if (replaced := pyramid.pop(size, None)) is not None:
+                self._bytes -= replaced.nbytes
+
+            pyramid[size] = frame
+            self._bytes += frame.nbytes
+
+            while len(pyramid) > self.levels:
+                self._bytes -= pyramid.popitem(last=False)[1].nbytes
+
+            # The frame just added is never dropped, it alone fits into the budget.
+            while self._bytes > self.budget_bytes:
+                oldest_key = next(iter(self._pyramids))
+                oldest_pyramid = self._pyramids[oldest_key]
+                self._bytes -= oldest_pyramid.popitem(last=False)[1].nbytes
+
+                if not oldest_pyramid:
+                    del self._pyramids[oldest_key]
+
+    def discard_source(self, source: Path) -> None:
+        """
+        Removes all scaled frames of a source.
+
+        :param source: Path of the source.
+        """
+        with self._lock:
+            for key in [key for key in self._pyramids if key[0] == source]:
+                self._bytes -= sum(frame.nbytes for frame in self._pyramids.pop(key).values())
+
+    def clear(self) -> None:
+        """
+        Removes all scaled frames.
+        """
+        with self._lock:
+            self._pyramids.clear()
+            self._bytes = 0
@@ -0,0 +1,16 @@
+from enum import Enum
+
+
+class SeekAction(Enum):
+    """
+    Enumeration representing how a ``VideoCapture`` object is moved to the next frame to be decoded.
+    """
+
+    SEEK = 'Seek'
+    """
+    Set the frame position, the decoder restarts from a keyframe before it.
+    """
+    GRAB = 'Grab'
+    """
+    Keep decoding forward with ``grab``, without converting the skipped frames.
+    """
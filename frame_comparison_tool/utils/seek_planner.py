@@ -0,0 +1,167 @@
+import threading
+from dataclasses import dataclass
+from typing import Optional
+
+from frame_comparison_tool.utils.frame_index import FrameIndex
+from frame_comparison_tool.utils.seek_action import SeekAction
+
+
+class SeekCosts:
+    """
+    Measured costs of moving the ``VideoCapture`` objects of one video.
+
+    Costs are exponential moving averages of the measured durations. Rough defaults are used until the first
+    measurements are made.
+    """
+
+    def __init__(self, seek_seconds: float = 0.016, grab_seconds: float = 0.001, smoothing: float = 0.25):
+        """
+        Initializes a ``SeekCosts`` instance.
+
+        :param seek_seconds: Initial estimate of the time needed to set the frame position.
+        :param grab_seconds: Initial estimate of the time needed to grab a single frame.
+        :param smoothing: Weight of a new measurement in the moving averages.
+        """
+        self.seek_seconds: float = seek_seconds
+        """Estimated time needed to set the frame position, including decoding from the preceding keyframe."""
+        self.grab_seconds: float = grab_seconds
+        """Estimated time needed to grab a single frame."""
+        self.smoothing: float = smoothing
+        """Weight of a new measurement in the moving averages."""
+        self._lock = threading.Lock()
+
+    def record_seek(self, seconds: float) -> None:
+        """
+        Updates the seek cost with a measured seek.
+
+        :param seconds: Measured duration of the seek.
+        """
+        with self._lock:
+            self.seek_seconds += self.smoothing * (seconds - self.seek_seconds)
+
+    def record_grabs(self, seconds: float, n_frames: int) -> None:
+        """
+        Updates the grab cost with a measured run of grabs. Does nothing if no frame was grabbed.
+
+        :param seconds: Measured duration of the run.
+        :param n_frames: Number of grabbed frames.
+        """
+        if n_frames <= 0:
+            return
+
+        with self._lock:
+            self.grab_seconds += self.smoothing * (seconds / n_frames - self.grab_seconds)
+
+
+@dataclass(frozen=True)
+class SeekStep:
+    """
+    Class containing a single step of a ``SeekPlan``.
+    """
+
+    frame_idx: int
+    """
+    Index of the frame decoded by the step.
+    """
+    original_frame_position: int
+    """
+    Position the search for the frame starts from.
+    """
+    target_position: int
+    """
+    Position the ``VideoCapture`` object is moved to, the real frame position if the frame type index is available.
+    """
+    action: SeekAction
+    """
+    How the ``VideoCapture`` object is moved to the target position.
+    """
+    estimated_seconds: float
+    """
+    Estimated time needed to move to the target position.
+    """
+
+
+@dataclass
+class SeekPlan:
+    """
+    Class containing the steps decoding one shard of frames, with the estimated and the actual cost of moving between
+    their positions. Decoding the frames themselves is not part of either cost, it does not depend on the plan.
+    """
+
+    steps: list[SeekStep]
+    """
+    Steps in decoding order.
+    """
+    estimated_seconds: float
+    """
+    Estimated time needed to move between the frames.
+    """
+    actual_seconds: float = 0.0
+    """
+    Measured time needed to move between the frames, accumulated while the plan is executed.
+    """
+    fallback_seeks: int = 0
+    """
+    Number of planned grabs executed as seeks, because the search of the previous frame already went past the target.
+    """
+
+    @property
+    def n_seeks(self) -> int:
+        """
+        Gets the number of planned seeks.
+
+        :return: Number of steps seeking to their target position.
+        """
+        return sum(1 for step in self.steps if step.action == SeekAction.SEEK)
+
+    @property
+    def sweep(self) -> bool:
+        """
+        Checks whether the plan decodes all frames in a single forward sweep, seeking at most to the first frame.
+
+        :return: ``True`` if no step after the first one seeks, ``False`` otherwise.
+        """
+        return all(step.action == SeekAction.GRAB for step in self.steps[1:])
+
+
+def plan_seeks(targets: list[tuple[int, int, int]], costs: SeekCosts, start_position: int,
+               frame_index: Optional[FrameIndex] = None) -> SeekPlan:
+    """
+    Plans how to move a ``VideoCapture`` object between the frames of a shard.
+
+    For every target, grabbing forward from the current position is chosen over seeking if it is estimated to be
+    cheaper, or if the target shares its keyframe with a frame at or before the current position, since a seek would
+    decode forward from that keyframe anyway. Every frame is read at its target position, so the position after it
+    does not depend on the chosen action, and choosing the cheaper action per step gives the cheapest plan.
+    Densely sampled frames therefore end up in a single forward sweep.
+
+    :param targets: List of tuples containing a frame index, its starting frame position and its target position,
+                    in decoding order.
+    :param costs: Measured costs of the video.
+    :param start_position: Position of the next frame the ``VideoCapture`` object would decode.
+    :param frame_index: Optional frame type index, used to find the keyframes of the targets.
+    :return: ``SeekPlan`` of the shard.
+    """
+    seek_seconds, grab_seconds = costs.seek_seconds, costs.grab_seconds
+    steps: list[SeekStep] = []
+    position = start_position
+
+    for frame_idx, original_frame_position, target_position in targets:
+        distance = target_position - position
+        keyframe = frame_index.previous_keyframe(target_position) if frame_index is not None else None
+
+        if distance < 0:
+            action = SeekAction.SEEK
+        elif keyframe is not None and keyframe <= position:
+            action = SeekAction.GRAB
+        else:
+            action = SeekAction.GRAB if distance * grab_seconds <= seek_seconds else SeekAction.SEEK
+
+        steps.append(SeekStep(frame_idx=frame_idx,
+                              original_frame_position=original_frame_position,
+                              target_position=target_position,
+                              action=action,
+                              estimated_seconds=distance * grab_seconds if action == SeekAction.GRAB else seek_seconds))
+        position = target_position + 1
+
+    return SeekPlan(steps=steps, estimated_seconds=sum(step.estimated_seconds for step in steps))
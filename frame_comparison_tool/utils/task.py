@@ -22,3 +22,11 @@ class Task(Enum):
     """
     Offset all frames.
     """
+    REFOCUS = "Refocus"
+    """
+    Compress frames away from the current frame and restore the ones around it.
+    """
+    RESCALE = "Rescale"
+    """
+    Fit the frames around the current frame to a new display size.
+    """
@@ -1,13 +1,18 @@
+import threading
+from contextlib import contextmanager
 from queue import Queue
-from typing import override, Optional, Any, Dict
+from typing import override, Optional, Any, Dict, Callable, Iterator
 
 from PySide6.QtCore import QThread, Signal
 
+from frame_comparison_tool.utils.direction import Direction
 from frame_comparison_tool.utils.exceptions import InvalidTaskError, MultipleSourcesImageReadError, \
-    NoMatchingFrameTypeError
+    NoMatchingFrameTypeError, TaskCancelledError
 from frame_comparison_tool.utils.frame_loader_manager import FrameLoaderManager
 from frame_comparison_tool.utils.task import Task
 
+_SAMPLING_TASKS = (Task.SAMPLE, Task.RESAMPLE)
+
 
 class Worker(QThread):
     """A worker thread that manages frame loading tasks in a queue.
@@ -20,6 +25,10 @@ class Worker(QThread):
         on_task_started: Emitted when a task begins processing
         on_task_finished: Emitted when a task completes
         on_task_failed: Emitted when a task fails, includes the problematic file path
+        on_frame_count_corrected: Emitted when a provisional frame count of a source is corrected
+        on_frame_ready: Emitted during sampling for every decoded frame, includes the source and frame index
+        on_frame_refined: Emitted during sampling for every frame decoded after the previews were shown,
+            includes the source and frame index
     """
 
     on_frames_ready: Signal = Signal()
@@ -27,12 +36,18 @@ class Worker(QThread):
     on_task_finished: Signal = Signal()
     on_task_failed: Signal = Signal(str)
     on_task_failed_invalid_sources: Signal = Signal(list)
+    on_frame_count_corrected: Signal = Signal(str, int)
+    on_frame_ready: Signal = Signal(int, int)
+    on_frame_refined: Signal = Signal(int, int)
 
-    def __init__(self, frame_loader_manager: FrameLoaderManager):
+    def __init__(self, frame_loader_manager: FrameLoaderManager,
+                 get_focus: Optional[Callable[[], tuple[int, int]]] = None):
         """
         Initialize the worker thread.
 
         :param frame_loader_manager: ``FrameLoaderManager`` instance handling frame loading.
+        :param get_focus: Optional function returning the source index and frame index currently displayed,
+                          which are decoded first when sampling.
         """
 
         super().__init__()
@@ -40,8 +55,21 @@ class Worker(QThread):
         """Queue containing tuples that consist of a task and additional arguments (if needed)."""
         self.frame_loader_manager: FrameLoaderManager = frame_loader_manager
         """Instance of ``FrameLoaderManager``."""
+        self.get_focus: Optional[Callable[[], tuple[int, int]]] = get_focus
+        """Function returning the source index and frame index currently displayed."""
         self._running = True
         """Flag indicating if the thread is running."""
+        self._sampling = False
+        """Flag indicating if a sampling task is running."""
+        self._cancel_event = threading.Event()
+        """Event cancelling the running sampling task."""
+        self._rescale_event = threading.Event()
+        """Event requesting the displayed frames to be scaled while a sampling task is running."""
+        self._task_lock = threading.Lock()
+        """Lock held while a task runs, so that the sources are not changed by another thread meanwhile."""
+        self._resumed = threading.Event()
+        """Event cleared while another thread stopped the worker to change the sources, see ``paused``."""
+        self._resumed.set()
 
     def stop(self) -> None:
         """
@@ -49,30 +77,224 @@ class Worker(QThread):
         """
 
         self._running = False
+        self._cancel_event.set()
         self.queue.put((None, {}))
         self.wait()
 
+    @contextmanager
+    def paused(self) -> Iterator[None]:
+        """
+        Stop the running task and keep the worker from starting another one, so that the sources can be changed
+        by the calling thread, e.g. deleted.
+
+        A running sampling task is cancelled and queued again, so it resumes with the changed sources once the worker
+        continues. Other tasks are short and are waited for.
+        """
+
+        self._resumed.clear()
+        self._cancel_event.set()
+
+        try:
+            with self._task_lock:
+                yield
+        finally:
+            self._resumed.set()
+
     def add_task(self, task: Task, **kwargs) -> None:
         """
         Add a new task to the queue.
 
+        A running ``SAMPLE`` or ``RESAMPLE`` task is cancelled if a new ``SAMPLE`` or ``RESAMPLE`` task is added,
+        because the new task supersedes it. A ``RESCALE`` task added during sampling is also handled with the next
+        decoded frame, so the display is fitted to its new size without waiting for the sampling to finish.
+
         :param task: ``Task`` enum specifying the type of task that needs to be done.
         :param kwargs: Additional arguments required for a specific task.
         For the ``OFFSET`` task, expected kwargs are `direction`, `src_idx`, and `frame_idx`.
+        For the ``OFFSET_ALL`` task, expected kwargs are `direction` and `src_idx`.
         """
 
+        if task in _SAMPLING_TASKS and self._sampling:
+            self._cancel_event.set()
+
+        if task == Task.RESCALE and self._sampling:
+            self._rescale_event.set()
+
         self.queue.put((task, kwargs))
 
+    def _get_tasks(self) -> list[tuple[Optional[Task], Dict[str, Any]]]:
+        """
+        Wait for a task and take all other queued tasks with it.
+
+        :return: List of queued tasks, in the order they were added.
+        """
+
+        tasks = [self.queue.get()]
+
+        while not self.queue.empty():
+            tasks.append(self.queue.get_nowait())
+
+        return tasks
+
+    @staticmethod
+    def _coalesce_tasks(tasks: list[tuple[Optional[Task], Dict[str, Any]]]) \
+            -> list[tuple[Optional[Task], Dict[str, Any]]]:
+        """
+        Merge queued tasks that can be executed as one. Tasks are only merged with the task right before them,
+        so every offset still runs after the sampling it was requested for.
+
+        - Consecutive ``SAMPLE`` and ``RESAMPLE`` tasks are merged into the last one.
+          It becomes a ``RESAMPLE`` if any of the merged ones was a ``RESAMPLE``.
+        - A ``REFOCUS`` or ``RESCALE`` task is dropped if a newer task of the same type follows it.
+        - Consecutive ``OFFSET`` tasks of the same frame and consecutive ``OFFSET_ALL`` tasks of the same source
+          are merged into a single task with their summed displacement if they move in the same direction.
+          Offsets in opposite directions do not cancel out, because an offset stops at the ends of the video.
+
+        :param tasks: List of queued tasks, in the order they were added.
+        :return: List of tasks to execute.
+        """
+
+        coalesced: list[tuple[Optional[Task], Dict[str, Any]]] = []
+
+        for task, kwargs in tasks:
+            if task in _SAMPLING_TASKS:
+                while coalesced and coalesced[-1][0] in _SAMPLING_TASKS:
+                    if coalesced.pop()[0] == Task.RESAMPLE:
+                        task = Task.RESAMPLE
+
+            elif task in (Task.REFOCUS, Task.RESCALE):
+                coalesced = [(queued_task, queued_kwargs) for queued_task, queued_kwargs in coalesced
+                             if queued_task != task]
+
+            elif task in (Task.OFFSET, Task.OFFSET_ALL):
+                kwargs = {'src_idx': kwargs.get('src_idx'),
+                          'frame_idx': kwargs.get('frame_idx'),
+                          'displacement': kwargs.get('displacement', int(kwargs.get('direction')))}
+
+                if coalesced:
+                    last_task, last_kwargs = coalesced[-1]
+
+                    if (last_task == task
+                            and last_kwargs.get('src_idx') == kwargs.get('src_idx')
+                            and last_kwargs.get('frame_idx') == kwargs.get('frame_idx')
+                            and (last_kwargs['displacement'] > 0) == (kwargs['displacement'] > 0)):
+                        coalesced.pop()
+                        kwargs['displacement'] += last_kwargs['displacement']
+
+            coalesced.append((task, kwargs))
+
+        return coalesced
+
+    def _sample_all_frames(self) -> None:
+        """
+        Sample frames from all sources, reporting errors through signals.
+
+        The sampling can be cancelled by adding a new sampling task. A sampling cancelled by ``paused`` is queued
+        again.
+        The displayed frame is decoded first and every decoded frame is reported through `on_frame_ready`.
+        A rescale requested meanwhile is handled after the next decoded frame, see ``_rescale_during_sampling``.
+
+        If preview sampling is enabled, keyframes close to the sampled frames are decoded and shown first,
+        reported through `on_frame_ready` and followed by ``on_frames_ready``. The exact frames replacing them
+        are then reported through `on_frame_refined`.
+        """
+
+        if self._resumed.is_set():
+            self._cancel_event.clear()
+
+        self._rescale_event.clear()
+        self._sampling = True
+        on_frame_ready = self._rescale_during_sampling(self.on_frame_ready.emit)
+
+        try:
+            if self.frame_loader_manager.preview_sampling:
+                self.frame_loader_manager.preview_all_frames(cancel_event=self._cancel_event,
+                                                             on_frame_ready=on_frame_ready)
+                self._scale_frames(neighbours=False)
+                self.on_frames_ready.emit()
+                on_frame_ready = self._rescale_during_sampling(self.on_frame_refined.emit)
+
+            self.frame_loader_manager.sample_all_frames(
+                cancel_event=self._cancel_event,
+                focus=self.get_focus() if self.get_focus is not None else None,
+                on_frame_ready=on_frame_ready
+            )
+        except MultipleSourcesImageReadError as e:
+            self.on_task_failed_invalid_sources.emit(e.sources)
+        except NoMatchingFrameTypeError as e:
+            self.on_task_failed.emit(e.message)
+        except TaskCancelledError:
+            if not self._resumed.is_set():
+                self.queue.put((Task.SAMPLE, {}))
+        finally:
+            self._sampling = False
+
+    def _rescale_during_sampling(self, on_frame_ready: Callable[[int, int], None]) -> Callable[[int, int], None]:
+        """
+        Wrap a callback reporting decoded frames, so that a rescale requested during sampling is handled right
+        after the next decoded frame. Only the displayed frames are scaled, their neighbours are scaled once
+        the sampling is finished.
+
+        :param on_frame_ready: Callback reporting the source and frame index of a decoded frame.
+        :return: Wrapped callback, called from the sampling threads.
+        """
+
+        def on_frame_ready_and_rescale(src_idx: int, frame_idx: int) -> None:
+            on_frame_ready(src_idx, frame_idx)
+
+            if self._rescale_event.is_set():
+                self._rescale_event.clear()
+                self._scale_frames(neighbours=False)
+                self.on_frames_ready.emit()
+
+        return on_frame_ready_and_rescale
+
+    def _update_frame_tiers(self) -> None:
+        """
+        Compress frames away from the displayed frame and restore the ones around it.
+        """
+
+        if self.get_focus is not None:
+            _, frame_idx = self.get_focus()
+            self.frame_loader_manager.update_frame_tiers(frame_idx=frame_idx)
+
+    def _report_frame_count_corrections(self) -> None:
+        """
+        Report frame counts corrected since the last report, including the ones counted by a frame type index
+        built in the background.
+        """
+
+        for file_path, total_frames in self.frame_loader_manager.pop_frame_count_corrections():
+            self.on_frame_count_corrected.emit(str(file_path), total_frames)
+
+    def _scale_frames(self, neighbours: bool = True) -> None:
+        """
+        Fit the displayed frame of every source to the display size, so that displaying it is a cache lookup.
+
+        :param neighbours: Whether the neighbouring frames are scaled as well.
+        """
+
+        if self.get_focus is not None:
+            self.frame_loader_manager.scale_frames(focus=self.get_focus(), neighbours=neighbours)
+
     @override
     def run(self) -> None:
         """
         Thread execution loop processing tasks from the queue.
 
         This method continuously processes tasks from the queue until stopped.
+        All queued tasks are taken at once and coalesced before execution.
         It handles three types of tasks:
         - RESAMPLE: Clears frame positions and samples all frames
         - SAMPLE: Samples all frames without clearing positions
         - OFFSET: Adjusts frame offset
+        - REFOCUS: Updates the compressed frame tier and scales the frames around the current frame,
+          without emitting any signals
+        - RESCALE: Scales the frames around the current frame to a new display size, only emitting
+          ``on_frames_ready``. A rescale added during sampling is already handled while sampling
+
+        Displayed frames are scaled before ``on_frames_ready`` is emitted, their neighbours afterward.
+        Every task runs with `_task_lock` held, so that ``paused`` can wait for it.
 
         Emits appropriate signals for task status and handles errors that may occur.
 
@@ -80,40 +302,71 @@ class Worker(QThread):
         """
 
         while True:
-            task, kwargs = self.queue.get()
+            tasks = self._get_tasks()
 
             if not self._running:
                 break
 
-            self.on_task_started.emit()
-
-            if task == Task.RESAMPLE:
-                self.frame_loader_manager.clear_frame_positions()
-                try:
-                    self.frame_loader_manager.sample_all_frames()
-                except MultipleSourcesImageReadError as e:
-                    self.on_task_failed_invalid_sources.emit(e.sources)
-                except NoMatchingFrameTypeError as e:
-                    self.on_task_failed.emit(e.message)
-
-            elif task == Task.SAMPLE:
-                try:
-                    self.frame_loader_manager.sample_all_frames()
-                except MultipleSourcesImageReadError as e:
-                    self.on_task_failed_invalid_sources.emit(e.sources)
-                except NoMatchingFrameTypeError as e:
-                    self.on_task_failed.emit(e.message)
-
-            elif task == Task.OFFSET:
-                self.frame_loader_manager.offset_frame(direction=kwargs.get("direction"),
-                                                       src_idx=kwargs.get("src_idx"),
-                                                       frame_idx=kwargs.get("frame_idx"))
-            elif task == Task.OFFSET_ALL:
-                self.frame_loader_manager.offset_all_frames(direction=kwargs.get("direction"),
-                                                            src_idx=kwargs.get("src_idx"))
-
-            else:
-                raise InvalidTaskError(task)
+            for task, kwargs in self._coalesce_tasks(tasks):
+                if not self._running:
+                    return
+
+                self._resumed.wait()
+
+                with self._task_lock:
+                    self._run_task(task, kwargs)
+
+    def _run_task(self, task: Task, kwargs: Dict[str, Any]) -> None:
+        """
+        Execute a single coalesced task, see ``run``.
+
+        :param task: Task to execute.
+        :param kwargs: Additional arguments of the task.
+        :raises ``InvalidTaskError``: If an unsupported task is encountered.
+        """
 
+        if task == Task.REFOCUS:
+            self._report_frame_count_corrections()
+            self._update_frame_tiers()
+            self._scale_frames()
+            return
+
+        if task == Task.RESCALE:
+            self._scale_frames(neighbours=False)
             self.on_frames_ready.emit()
-            self.on_task_finished.emit()
+            self._scale_frames()
+            return
+
+        self.on_task_started.emit()
+
+        if task == Task.RESAMPLE:
+            self.frame_loader_manager.clear_frame_positions()
+            self._sample_all_frames()
+
+        elif task == Task.SAMPLE:
+            self._sample_all_frames()
+
+        elif task == Task.OFFSET:
+            displacement = kwargs.get("displacement")
+            self.frame_loader_manager.offset_frame(direction=Direction(1 if displacement > 0 else -1),
+                                                   src_idx=kwargs.get("src_idx"),
+                                                   frame_idx=kwargs.get("frame_idx"),
+                                                   steps=abs(displacement))
+        elif task == Task.OFFSET_ALL:
+            displacement = kwargs.get("displacement")
+            self.frame_loader_manager.offset_all_frames(direction=Direction(1 if displacement > 0 else -1),
+                                                        src_idx=kwargs.get("src_idx"),
+                                                        steps=abs(displacement))
+
+        else:
+            raise InvalidTaskError(task)
+
+        self._report_frame_count_corrections()
+        self._scale_frames(neighbours=False)
+
+        self.on_frames_ready.emit()
+        self.on_task_finished.emit()
+
+        # Compressing and restoring frames is not needed to display the current frame.
+        self._update_frame_tiers()
+        self._scale_frames()
@@ -2,6 +2,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import override, Optional
 
+import numpy as np
 from PySide6.QtCore import Qt, Signal, QTimer
 from PySide6.QtGui import QPixmap, QImage, QKeyEvent, QResizeEvent, QMouseEvent, QCloseEvent
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QMainWindow, QPushButton, QHBoxLayout, QComboBox, \
@@ -13,6 +14,8 @@ from frame_comparison_tool.view.pannable_scroll_area import PannableScrollArea
 from frame_comparison_tool.view.spinning_circle import SpinningCircle
 from frame_comparison_tool.utils.video_formats import VideoFormats
 
+_RESIZE_DEBOUNCE_MS = 150
+
 
 class View(QMainWindow):
     """
@@ -34,6 +37,7 @@ class View(QMainWindow):
         - ``n_samples_changed``: Emitted when number of samples changes.
         - ``shown``: Emitted when window is first shown.
         - ``exit_app_requested``: Emitted when application exit is requested.
+        - ``overlay_toggled``: Emitted when user toggles the frame information overlay.
     """
 
     add_source_requested = Signal(list)
@@ -50,6 +54,7 @@ class View(QMainWindow):
     exit_app_requested = Signal()
     save_images_requested = Signal(str)
     offset_all_frames_requested = Signal(Direction)
+    overlay_toggled = Signal()
 
     def __init__(self):
         """
@@ -59,6 +64,17 @@ class View(QMainWindow):
 
         self.presenter: Optional['Presenter'] = None
         """``Presenter`` instance."""
+        self._displayed_frame: Optional[np.ndarray] = None
+        """Frame whose memory backs `_displayed_image`, kept alive as long as the image."""
+        self._displayed_image: Optional[QImage] = None
+        """Image wrapping the displayed frame without copying it."""
+        self._pinned_pixmaps: dict[int, tuple[np.ndarray, np.ndarray, QPixmap]] = {}
+        """
+        Ready-made pixmaps of pinned frames, keyed by the identity of the frame they were made from.
+        Each pixmap is kept with its frame and the memory backing it.
+        """
+        self._frames_to_pin: list[np.ndarray] = []
+        """Frames to be pinned once the current display is painted."""
 
         self._init_ui()
 
@@ -108,6 +124,14 @@ class View(QMainWindow):
         self._n_samples_timer.setSingleShot(True)
         self._n_samples_timer.timeout.connect(self._emit_n_samples)
 
+        self._resize_timer = QTimer()
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.timeout.connect(self._emit_resize)
+
+        self._pin_timer = QTimer()
+        self._pin_timer.setSingleShot(True)
+        self._pin_timer.timeout.connect(self._pin_pending_frames)
+
         self.n_samples_container = QHBoxLayout()
         self.n_samples_label = QLabel("Number of frames:")
         self.spin_box_n_samples = QSpinBox()
@@ -227,11 +251,11 @@ class View(QMainWindow):
     @override
     def resizeEvent(self, event: QResizeEvent) -> None:
         """
-        Handle window resize by updating frame display size.
+        Handle window resize by updating frame display size, once the window stops being resized.
 
         :param event: Resize event object.
         """
-        self.resize_requested.emit(self.get_max_frame_size())
+        self._resize_timer.start(_RESIZE_DEBOUNCE_MS)
         return super().resizeEvent(event)
 
     @override
@@ -245,6 +269,7 @@ class View(QMainWindow):
         - Plus/Minus: Offset frame
         - Ctrl + S: Save frames
         - Ctrl + Plus/Minus: Offset all frames of a certain source
+        - O: Toggle frame information overlay
 
         :param event: Key event object.
         """
@@ -267,6 +292,8 @@ class View(QMainWindow):
         elif event.modifiers() == Qt.KeyboardModifier.ControlModifier and event.key() == Qt.Key.Key_S:
             formatted_date = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
             self.save_images_requested.emit(formatted_date)
+        elif event.key() == Qt.Key.Key_O:
+            self.overlay_toggled.emit()
 
         return super().keyPressEvent(event)
 
@@ -413,6 +440,13 @@ class View(QMainWindow):
 
         self._n_samples_timer.start(1000)
 
+    def _emit_resize(self) -> None:
+        """
+        Emits a signal when the window was resized.
+        """
+
+        self.resize_requested.emit(self.get_max_frame_size())
+
     def _emit_seed(self) -> None:
         """
         Emits a signal when the seed value changes.
@@ -454,18 +488,22 @@ class View(QMainWindow):
 
     def update_display(self, view_data: ViewData) -> None:
         """
-        Updates the frame display with new data.
+        Updates the frame display with new data. A pinned frame is displayed with its ready-made pixmap.
 
         :param view_data: Data needed to update the UI.
         """
 
         if view_data.frame is None:
             self.frame_widget.clear()
+            self._displayed_frame = None
+            self._displayed_image = None
         else:
-            height, width, channels = view_data.frame.shape
-            bytes_per_line = 3 * width
-            image = QImage(view_data.frame.data, width, height, bytes_per_line, QImage.Format.Format_RGB888)
-            pixmap = QPixmap.fromImage(image)
+            # A pinned pixmap keeps its frame referenced, so no other frame can have the same id.
+            if (pinned := self._pinned_pixmaps.get(id(view_data.frame))) is not None:
+                pixmap = pinned[2]
+            else:
+                self._displayed_frame, self._displayed_image = self._wrap_frame(view_data.frame)
+                pixmap = QPixmap.fromImage(self._displayed_image)
 
             self.frame_widget.setMinimumSize(pixmap.size())
             self.frame_widget.setFixedSize(pixmap.size())
@@ -474,6 +512,64 @@ class View(QMainWindow):
             self.frame_widget.setAlignment(Qt.AlignmentFlag.AlignCenter)
             self.setFocus()
 
+    def pin_frames(self, frames: list[np.ndarray]) -> None:
+        """
+        Keeps ready-made pixmaps of the given frames, so that displaying one of them only swaps the pixmap.
+        Pixmaps of previously pinned frames that are not given are dropped.
+
+        Pixmaps are made after the current display is painted, so pinning never delays it.
+
+        :param frames: Frames to pin, must not be modified afterward.
+        """
+
+        self._frames_to_pin = frames
+        self._pin_timer.start(0)
+
+    def _pin_pending_frames(self) -> None:
+        """
+        Makes the pixmaps of the frames requested by ``pin_frames``, reusing the ones that are already pinned.
+        """
+
+        pinned_pixmaps: dict[int, tuple[np.ndarray, np.ndarray, QPixmap]] = {}
+
+        for frame in self._frames_to_pin:
+            if (pinned := self._pinned_pixmaps.get(id(frame))) is None:
+                backing_frame, image = self._wrap_frame(frame)
+                pinned = (frame, backing_frame, QPixmap.fromImage(image))
+
+            pinned_pixmaps[id(frame)] = pinned
+
+        self._pinned_pixmaps = pinned_pixmaps
+        self._frames_to_pin = []
+
+    @staticmethod
+    def _wrap_frame(frame: np.ndarray) -> tuple[np.ndarray, QImage]:
+        """
+        Wraps a BGR frame as a ``QImage`` without copying its pixels.
+
+        ``QImage`` does not own the wrapped memory, so the returned frame must be kept referenced as long as the image.
+
+        :param frame: BGR frame.
+        :return: Tuple containing the frame backing the image and the image.
+        """
+        # Frames are contiguous unless they were sliced, only then a copy is made.
+        frame = np.ascontiguousarray(frame)
+        height, width = frame.shape[:2]
+
+        return frame, QImage(frame.data, width, height, frame.strides[0], QImage.Format.Format_BGR888)
+
+    def get_refresh_interval(self) -> float:
+        """
+        Returns the time between two refreshes of the screen the window is on.
+
+        :return: Refresh interval in seconds.
+        """
+
+        screen = self.screen()
+        refresh_rate = screen.refreshRate() if screen is not None else 0
+
+        return 1 / refresh_rate if refresh_rate > 0 else 1 / 60
+
     def get_max_frame_size(self) -> tuple[int, int]:
         """
         Returns the maximal dimension the frame image can have.
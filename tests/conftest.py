@@ -0,0 +1,48 @@
+from pathlib import Path
+
+import cv2
+import numpy as np
+import pytest
+
+from frame_comparison_tool.utils import probe_cache as probe_cache_module
+
+CLIP_FRAMES: int = 120
+"""Number of frames of the generated clip."""
+CLIP_SIZE: tuple[int, int] = (160, 120)
+"""Width and height of the generated clip."""
+
+
+@pytest.fixture(autouse=True)
+def probe_cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """
+    Keeps the probe cache entries written by the tests out of the user cache directory.
+
+    :return: Path to the probe cache directory of the test.
+    """
+    monkeypatch.setattr(probe_cache_module, "PROBE_CACHE_DIR", str(tmp_path / "probe"))
+
+    return tmp_path / "probe"
+
+
+@pytest.fixture(scope="session")
+def clip_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """
+    Writes a short clip in which every frame differs from the others.
+
+    :return: Path to the clip.
+    """
+    path = tmp_path_factory.mktemp("clips") / "clip.mp4"
+    width, height = CLIP_SIZE
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter.fourcc(*"mp4v"), 25, CLIP_SIZE)
+    rng = np.random.default_rng(0)
+
+    try:
+        for frame_position in range(CLIP_FRAMES):
+            frame = rng.integers(0, 64, size=(height, width, 3), dtype=np.uint8)
+            cv2.rectangle(frame, (frame_position, 20), (frame_position + 30, 60), (255, 255, 255), thickness=-1)
+            cv2.putText(frame, str(frame_position), (10, height - 10), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
+            writer.write(frame)
+    finally:
+        writer.release()
+
+    return path
@@ -0,0 +1,242 @@
+from dataclasses import replace
+from pathlib import Path
+from typing import Iterator, Optional
+
+import numpy as np
+import pytest
+
+from frame_comparison_tool.utils import FrameLoader, FrameType, Direction
+from frame_comparison_tool.utils import frame_loader as frame_loader_module
+from frame_comparison_tool.utils.exceptions import NoMatchingFrameTypeError
+from frame_comparison_tool.utils.frame_format import FrameFormat
+from frame_comparison_tool.utils.process_decoder import ProcessDecoder
+
+FRAME_POSITIONS: list[int] = [0, 5, 17, 40, 41, 63, 90, 107]
+"""Starting frame positions sampled by the tests, including neighboring ones. Offsets reach both ends of the clip."""
+
+
+@pytest.fixture(params=[True, False], ids=["index", "no-index"])
+def frame_loaders(request: pytest.FixtureRequest, clip_path: Path,
+                  monkeypatch: pytest.MonkeyPatch) -> Iterator[tuple[FrameLoader, FrameLoader]]:
+    """
+    Opens two loaders of the same clip, with and without the frame type index.
+
+    :return: Tuple containing two ``FrameLoader`` instances.
+    """
+    monkeypatch.setattr(frame_loader_module, "BUILD_FRAME_INDEX", request.param)
+    frame_loaders = FrameLoader(clip_path), FrameLoader(clip_path)
+
+    for frame_loader in frame_loaders:
+        frame_loader.ensure_frame_index(wait=True)
+
+    yield frame_loaders
+
+    for frame_loader in frame_loaders:
+        frame_loader.close()
+
+
+def _snapshot(frame_loader: FrameLoader) -> list[tuple[int, int, np.ndarray]]:
+    """
+    Gets the positions and pixels of all sampled frames.
+
+    :param frame_loader: Loader to read the frames from.
+    :return: List of tuples containing the starting and the real frame position, and the frame without the overlay.
+    """
+    return [(frame_data.original_frame_position, frame_data.real_frame_position,
+             frame_loader.get_frame(frame_idx, overlay=False))
+            for frame_idx, frame_data in enumerate(frame_loader.frame_data)]
+
+
+@pytest.mark.parametrize("frame_type", [FrameType.I_TYPE, FrameType.P_TYPE])
+@pytest.mark.parametrize("direction", [Direction.FORWARD, Direction.BACKWARD])
+@pytest.mark.parametrize("steps", [1, 3])
+def test_offset_all_matches_offset(frame_loaders: tuple[FrameLoader, FrameLoader], frame_type: FrameType,
+                                   direction: Direction, steps: int) -> None:
+    batched, stepped = frame_loaders
+
+    for frame_loader in frame_loaders:
+        frame_loader.sample_frames(frame_positions=FRAME_POSITIONS, frame_type=frame_type)
+
+    for _ in range(2):
+        batched.offset_all(direction=direction, steps=steps)
+
+        for frame_idx in range(len(stepped.frame_data)):
+            stepped.offset(frame_idx=frame_idx, direction=direction, steps=steps)
+
+        batched_frames, stepped_frames = _snapshot(batched), _snapshot(stepped)
+
+        assert [frame[:2] for frame in batched_frames] == [frame[:2] for frame in stepped_frames]
+
+        for (_, _, batched_frame), (_, _, stepped_frame) in zip(batched_frames, stepped_frames):
+            np.testing.assert_array_equal(batched_frame, stepped_frame)
+
+
+@pytest.mark.parametrize("frame_format", [FrameFormat.BGR, FrameFormat.YUV420])
+def test_process_decoder_matches_in_process_sampling(clip_path: Path, frame_format: FrameFormat) -> None:
+    process_decoder = ProcessDecoder(max_workers=2)
+    frame_loaders = FrameLoader(clip_path, frame_format=frame_format), FrameLoader(clip_path, frame_format=frame_format)
+
+    try:
+        frame_loaders[0].sample_frames(frame_positions=FRAME_POSITIONS, frame_type=FrameType.P_TYPE, n_captures=2,
+                                       process_decoder=process_decoder)
+        frame_loaders[1].sample_frames(frame_positions=FRAME_POSITIONS, frame_type=FrameType.P_TYPE)
+
+        decoded_frames, sampled_frames = _snapshot(frame_loaders[0]), _snapshot(frame_loaders[1])
+
+        assert [frame[:2] for frame in decoded_frames] == [frame[:2] for frame in sampled_frames]
+
+        for (_, _, decoded_frame), (_, _, sampled_frame) in zip(decoded_frames, sampled_frames):
+            np.testing.assert_array_equal(decoded_frame, sampled_frame)
+    finally:
+        for frame_loader in frame_loaders:
+            frame_loader.close()
+
+        process_decoder.shutdown()
+
+
+def test_process_decoder_frees_shared_memory_blocks(clip_path: Path) -> None:
+    process_decoder = ProcessDecoder(max_workers=2)
+    frame_loader = FrameLoader(clip_path)
+
+    try:
+        frame_loader.sample_frames(frame_positions=FRAME_POSITIONS, frame_type=FrameType.P_TYPE, n_captures=2,
+                                   process_decoder=process_decoder)
+
+        # Frames are copied out of their shared memory blocks, so no block is held by a stored frame.
+        for frame_data in frame_loader.frame_data:
+            assert frame_loader.frame_store.peek(frame_data.frame_key).flags.owndata
+    finally:
+        frame_loader.close()
+        process_decoder.shutdown()
+
+
+def test_offset_before_sampling_does_nothing(clip_path: Path) -> None:
+    frame_loader = FrameLoader(clip_path)
+
+    try:
+        frame_loader.offset(frame_idx=0, direction=Direction.FORWARD)
+
+        assert frame_loader.frame_data == []
+    finally:
+        frame_loader.close()
+
+
+def test_reverse_scan_reaches_last_frame(clip_path: Path) -> None:
+    frame_loader = FrameLoader(clip_path)
+
+    try:
+        last_position = frame_loader.total_frames
+        frame_position, _ = frame_loader._find_previous_frame(frame_position=last_position,
+                                                              frame_type=FrameType.P_TYPE)
+
+        assert frame_position == last_position
+    finally:
+        frame_loader.close()
+
+
+@pytest.mark.parametrize("build_frame_index", [True, False], ids=["index", "no-index"])
+def test_refined_frame_count_is_reported_once(clip_path: Path, monkeypatch: pytest.MonkeyPatch,
+                                              build_frame_index: bool) -> None:
+    monkeypatch.setattr(frame_loader_module, "BUILD_FRAME_INDEX", build_frame_index)
+    frame_loader = FrameLoader(clip_path)
+
+    try:
+        last_position = frame_loader.total_frames
+        # A container reporting too many frames.
+        frame_loader._probe_result = replace(frame_loader._probe_result, frame_count_exact=False)
+        frame_loader._total_frames = last_position + 30
+
+        assert frame_loader.refine_frame_count() == last_position
+        assert frame_loader.frame_count_exact
+        assert frame_loader.pop_frame_count_correction() == last_position
+        assert frame_loader.pop_frame_count_correction() is None
+    finally:
+        frame_loader.close()
+
+
+def test_offsets_skip_preview_frames(clip_path: Path) -> None:
+    frame_loader = FrameLoader(clip_path)
+
+    try:
+        frame_loader.ensure_frame_index(wait=True)
+        frame_loader.preview_frames(frame_positions=FRAME_POSITIONS, frame_type=FrameType.P_TYPE)
+        previews = list(frame_loader.frame_data)
+
+        assert any(frame_data.preview for frame_data in previews)
+
+        frame_loader.offset(frame_idx=[frame_data.preview for frame_data in previews].index(True),
+                            direction=Direction.FORWARD)
+        frame_loader.offset_all(direction=Direction.BACKWARD)
+
+        for frame_data, preview in zip(frame_loader.frame_data, previews):
+            if preview.preview:
+                assert frame_data == preview
+            else:
+                assert frame_data != preview
+    finally:
+        frame_loader.close()
+
+
+def _find(frame_loader: FrameLoader, frame_position: int, direction: Direction,
+          frame_type: FrameType) -> Optional[tuple[int, np.ndarray]]:
+    """
+    Finds the closest frame of a frame type, without raising if none matched.
+
+    :return: Tuple containing the real frame position and the frame, ``None`` if no frame matched.
+    """
+    try:
+        return frame_loader._find_closest_frame(frame_position=frame_position, direction=direction,
+                                                frame_type=frame_type)
+    except NoMatchingFrameTypeError:
+        return None
+
+
+@pytest.mark.parametrize("max_frames_to_search", [1500, 11])
+def test_index_and_scan_find_the_same_frames_at_both_ends(clip_path: Path, monkeypatch: pytest.MonkeyPatch,
+                                                          max_frames_to_search: int) -> None:
+    monkeypatch.setattr(frame_loader_module, "MAX_FRAMES_TO_SEARCH", max_frames_to_search)
+    indexed = FrameLoader(clip_path)
+    indexed.ensure_frame_index(wait=True)
+    monkeypatch.setattr(frame_loader_module, "BUILD_FRAME_INDEX", False)
+    scanned = FrameLoader(clip_path)
+
+    try:
+        assert indexed.frame_index is not None and scanned.frame_index is None
+        last_position = indexed.total_frames
+
+        for frame_position in (0, 1, last_position - 1, last_position):
+            for direction in (Direction.FORWARD, Direction.BACKWARD):
+                for frame_type in (FrameType.I_TYPE, FrameType.P_TYPE):
+                    found = _find(indexed, frame_position, direction, frame_type)
+                    expected = _find(scanned, frame_position, direction, frame_type)
+
+                    assert (found is None) == (expected is None), (frame_position, direction, frame_type)
+
+                    if found is not None:
+                        assert found[0] == expected[0], (frame_position, direction, frame_type)
+                        np.testing.assert_array_equal(found[1], expected[1])
+    finally:
+        indexed.close()
+        scanned.close()
+
+
+def test_offset_past_the_last_match_remembers_only_found_frames(
+        frame_loaders: tuple[FrameLoader, FrameLoader]) -> None:
+    frame_loader, _ = frame_loaders
+    # The last keyframe of the clip is 108, the second step finds no keyframe.
+    frame_loader.sample_frames(frame_positions=[90], frame_type=FrameType.I_TYPE)
+    frame_loader.offset(frame_idx=0, direction=Direction.FORWARD, steps=3)
+
+    frame_data = frame_loader.frame_data[0]
+    assert (frame_data.original_frame_position, frame_data.real_frame_position) == (97, 108)
+    assert frame_loader.frame_memo.lookup(file_path=frame_loader.file_path, frame_position=109,
+                                          frame_type=FrameType.I_TYPE, direction=Direction.FORWARD) is None
+
+
+def test_close_releases_all_video_captures(clip_path: Path) -> None:
+    frame_loader = FrameLoader(clip_path)
+    video_captures = frame_loader._get_video_captures(3)
+
+    frame_loader.close()
+
+    assert not any(video_capture.isOpened() for video_capture in video_captures)
@@ -0,0 +1,44 @@
+import shutil
+from pathlib import Path
+
+from frame_comparison_tool.utils import FrameType
+from frame_comparison_tool.utils.frame_loader_manager import FrameLoaderManager
+
+
+def test_scaled_frame_waits_for_display_size(clip_path: Path) -> None:
+    frame_loader_manager = FrameLoaderManager(n_samples=4, seed=0, frame_type=FrameType.P_TYPE)
+
+    try:
+        frame_loader_manager.add_source(file_paths=[clip_path])
+        frame_loader_manager.sample_all_frames()
+
+        assert frame_loader_manager.get_scaled_frame(src_idx=0, frame_idx=0) is None
+
+        frame_loader_manager.display_size = (80, 0)
+        assert frame_loader_manager.get_scaled_frame(src_idx=0, frame_idx=0) is None
+
+        frame_loader_manager.display_size = (80, 60)
+        assert frame_loader_manager.get_scaled_frame(src_idx=0, frame_idx=0).shape[:2] == (60, 80)
+    finally:
+        frame_loader_manager.close()
+
+
+def test_deleted_source_releases_its_frames(clip_path: Path, tmp_path: Path) -> None:
+    other_clip_path = tmp_path / "other.mp4"
+    shutil.copyfile(clip_path, other_clip_path)
+    frame_loader_manager = FrameLoaderManager(n_samples=4, seed=0, frame_type=FrameType.P_TYPE)
+
+    try:
+        frame_loader_manager.add_source(file_paths=[clip_path, other_clip_path])
+        frame_loader_manager.sample_all_frames()
+        deleted_frame_loader = frame_loader_manager.sources[other_clip_path]
+        kept_bytes = frame_loader_manager.frame_store.resident_bytes
+
+        assert frame_loader_manager.delete_source(other_clip_path) == 1
+        assert deleted_frame_loader.frame_data == []
+        assert 0 < frame_loader_manager.frame_store.resident_bytes < kept_bytes
+
+        frame_loader_manager.delete_source(clip_path)
+        assert frame_loader_manager.frame_store.resident_bytes == 0
+    finally:
+        frame_loader_manager.close()
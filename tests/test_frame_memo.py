@@ -0,0 +1,103 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from frame_comparison_tool.utils import Direction, FrameType
+from frame_comparison_tool.utils.frame_memo import FrameMemo
+from frame_comparison_tool.utils.frame_store import FrameStore
+
+FRAME_NBYTES: int = 48
+"""Size of the frames remembered by the tests."""
+
+
+def _remember(frame_memo: FrameMemo, file_path: Path, frame_position: int) -> int:
+    """
+    Stores a frame and remembers it as the result of a forward search from a position, releasing the reference
+    of the store.
+
+    :return: Key of the stored frame.
+    """
+    frame_key = frame_memo.frame_store.put(np.full(FRAME_NBYTES, frame_position, dtype=np.uint8))
+    frame_memo.remember(file_path=file_path, frame_position=frame_position, frame_type=FrameType.P_TYPE,
+                        direction=Direction.FORWARD, real_frame_position=frame_position, frame_key=frame_key,
+                        nbytes=FRAME_NBYTES)
+    frame_memo.frame_store.discard(frame_key)
+
+    return frame_key
+
+
+def _remembered(frame_memo: FrameMemo, file_path: Path, frame_position: int) -> bool:
+    """
+    Checks whether a forward search from a position is remembered, releasing the reference of the lookup.
+    """
+    if (result := frame_memo.lookup(file_path=file_path, frame_position=frame_position, frame_type=FrameType.P_TYPE,
+                                     direction=Direction.FORWARD)) is None:
+        return False
+
+    frame_memo.frame_store.discard(result[1])
+
+    return True
+
+
+def test_budget_is_shared_between_videos() -> None:
+    frame_memo = FrameMemo(frame_store=FrameStore(budget_bytes=0), budget_bytes=2 * FRAME_NBYTES)
+
+    _remember(frame_memo, Path("a.mp4"), 0)
+    _remember(frame_memo, Path("b.mp4"), 0)
+    _remember(frame_memo, Path("b.mp4"), 1)
+
+    assert not _remembered(frame_memo, Path("a.mp4"), 0)
+    assert _remembered(frame_memo, Path("b.mp4"), 0)
+    assert _remembered(frame_memo, Path("b.mp4"), 1)
+
+
+def test_clear_forgets_only_the_given_video() -> None:
+    frame_memo = FrameMemo(frame_store=FrameStore(budget_bytes=0), budget_bytes=4 * FRAME_NBYTES)
+    removed_key = _remember(frame_memo, Path("a.mp4"), 0)
+    kept_key = _remember(frame_memo, Path("b.mp4"), 0)
+
+    frame_memo.clear(file_path=Path("a.mp4"))
+
+    assert not _remembered(frame_memo, Path("a.mp4"), 0)
+    assert _remembered(frame_memo, Path("b.mp4"), 0)
+    frame_memo.frame_store.peek(kept_key)
+
+    with pytest.raises(KeyError):
+        frame_memo.frame_store.peek(removed_key)
+
+
+def test_least_recently_used_results_are_forgotten() -> None:
+    frame_memo = FrameMemo(frame_store=FrameStore(budget_bytes=0), budget_bytes=2 * FRAME_NBYTES)
+    forgotten_key = _remember(frame_memo, Path("a.mp4"), 0)
+    _remember(frame_memo, Path("a.mp4"), 1)
+
+    assert _remembered(frame_memo, Path("a.mp4"), 0)
+    _remember(frame_memo, Path("a.mp4"), 2)
+
+    assert _remembered(frame_memo, Path("a.mp4"), 0)
+    assert not _remembered(frame_memo, Path("a.mp4"), 1)
+    assert _remembered(frame_memo, Path("a.mp4"), 2)
+    frame_memo.frame_store.peek(forgotten_key)
+
+    _remember(frame_memo, Path("a.mp4"), 3)
+    _remember(frame_memo, Path("a.mp4"), 4)
+
+    with pytest.raises(KeyError):
+        frame_memo.frame_store.peek(forgotten_key)
+
+
+def test_shared_frame_is_counted_once() -> None:
+    frame_memo = FrameMemo(frame_store=FrameStore(budget_bytes=0), budget_bytes=2 * FRAME_NBYTES)
+    frame_key = frame_memo.frame_store.put(np.zeros(FRAME_NBYTES, dtype=np.uint8))
+
+    for frame_position in range(3):
+        frame_memo.remember(file_path=Path("a.mp4"), frame_position=frame_position, frame_type=FrameType.P_TYPE,
+                            direction=Direction.FORWARD, real_frame_position=3, frame_key=frame_key,
+                            nbytes=FRAME_NBYTES)
+
+    frame_memo.frame_store.discard(frame_key)
+    _remember(frame_memo, Path("a.mp4"), 5)
+
+    assert all(_remembered(frame_memo, Path("a.mp4"), frame_position) for frame_position in (0, 1, 2, 5))
+    assert frame_memo.hit_rate == 1.0
@@ -0,0 +1,63 @@
+import pytest
+
+from frame_comparison_tool.utils.frame_sampler import generate_frame_positions
+
+
+def test_kept_positions_are_kept() -> None:
+    frame_positions = generate_frame_positions(seed=1, n_samples=20, min_frame_pos=0, max_frame_pos=999)
+    kept_frame_positions = [frame_position for frame_position in frame_positions if frame_position <= 499]
+
+    shortened = generate_frame_positions(seed=1, n_samples=20, min_frame_pos=0, max_frame_pos=499,
+                                         kept_frame_positions=frame_positions)
+
+    assert len(shortened) == 20
+    assert len(set(shortened)) == 20
+    assert set(kept_frame_positions) <= set(shortened)
+    assert max(shortened) <= 499
+
+
+def test_replaced_positions_are_spread_over_the_range() -> None:
+    # Kept positions ending right before the end of the range must not push the new ones against it.
+    kept_frame_positions = list(range(490, 496))
+
+    frame_positions = generate_frame_positions(seed=3, n_samples=16, min_frame_pos=0, max_frame_pos=499,
+                                               kept_frame_positions=kept_frame_positions)
+    new_frame_positions = sorted(set(frame_positions) - set(kept_frame_positions))
+
+    assert len(new_frame_positions) == 10
+    assert new_frame_positions[0] < 100
+    assert max(b - a for a, b in zip([0, *new_frame_positions], [*new_frame_positions, 499])) < 150
+
+
+@pytest.mark.parametrize('seed', [0, 1, 7])
+def test_positions_are_kept_when_adding_samples(seed: int) -> None:
+    frame_positions = generate_frame_positions(seed=seed, n_samples=8, min_frame_pos=0, max_frame_pos=999)
+
+    for n_samples in (9, 16, 40):
+        more_frame_positions = generate_frame_positions(seed=seed, n_samples=n_samples, min_frame_pos=0,
+                                                        max_frame_pos=999)
+
+        assert set(frame_positions) <= set(more_frame_positions)
+        frame_positions = more_frame_positions
+
+
+def test_positions_are_sorted_distinct_and_in_range() -> None:
+    frame_positions = generate_frame_positions(seed=5, n_samples=50, min_frame_pos=100, max_frame_pos=199)
+
+    assert frame_positions == sorted(frame_positions)
+    assert len(set(frame_positions)) == 50
+    assert all(100 <= frame_position <= 199 for frame_position in frame_positions)
+
+
+def test_positions_repeat_if_the_range_is_too_short() -> None:
+    frame_positions = generate_frame_positions(seed=5, n_samples=8, min_frame_pos=10, max_frame_pos=14)
+
+    assert len(frame_positions) == 8
+    assert set(frame_positions) == set(range(10, 15))
+
+
+def test_positions_resolving_to_the_same_frame_are_redrawn() -> None:
+    frame_positions = generate_frame_positions(seed=2, n_samples=4, min_frame_pos=0, max_frame_pos=99,
+                                               resolve=lambda frame_position: frame_position // 10)
+
+    assert len({frame_position // 10 for frame_position in frame_positions}) == 4
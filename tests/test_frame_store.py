@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+
+from frame_comparison_tool.utils.frame_store import FrameStore
+
+
+def _frame(value: int) -> np.ndarray:
+    return np.full((4, 4, 3), value, dtype=np.uint8)
+
+
+def test_peek_of_spilled_frame_survives_slot_reuse() -> None:
+    frame_store = FrameStore(budget_bytes=_frame(0).nbytes)
+
+    try:
+        spilled_key = frame_store.put(_frame(1))
+        frame_store.put(_frame(2))
+        assert frame_store.spilled_frames == 1
+
+        peeked = frame_store.peek(spilled_key)
+        frame_store.discard(spilled_key)
+        frame_store.put(_frame(3))
+        frame_store.put(_frame(4))
+
+        np.testing.assert_array_equal(peeked, _frame(1))
+    finally:
+        frame_store.close()
+
+
+def test_frame_is_removed_with_its_last_reference() -> None:
+    frame_store = FrameStore(budget_bytes=0)
+    frame_key = frame_store.put(_frame(1))
+    frame_store.retain(frame_key)
+
+    frame_store.discard(frame_key)
+    np.testing.assert_array_equal(frame_store.get(frame_key), _frame(1))
+
+    frame_store.discard(frame_key)
+
+    with pytest.raises(KeyError):
+        frame_store.get(frame_key)
+
+
+def test_frames_with_the_same_content_key_share_one_array() -> None:
+    frame_store = FrameStore(budget_bytes=0)
+    frame_key = frame_store.put(_frame(1), content_key=("a.mp4", 1))
+
+    assert frame_store.put(_frame(2), content_key=("a.mp4", 1)) == frame_key
+    assert frame_store.lookup(("a.mp4", 1)) == frame_key
+    assert frame_store.lookup(("a.mp4", 2)) is None
+    assert frame_store.deduplicated == 1
+    assert frame_store.resident_bytes == _frame(1).nbytes
+
+    for _ in range(3):
+        frame_store.discard(frame_key)
+
+    assert frame_store.lookup(("a.mp4", 1)) is None
+
+
+def test_least_recently_used_frames_are_spilled_and_read_back() -> None:
+    frame_store = FrameStore(budget_bytes=2 * _frame(0).nbytes)
+
+    try:
+        frame_keys = [frame_store.put(_frame(value)) for value in range(4)]
+
+        assert frame_store.spilled_frames == 2
+        assert frame_store.resident_bytes <= frame_store.budget_bytes
+
+        np.testing.assert_array_equal(frame_store.get(frame_keys[3]), _frame(3))
+        np.testing.assert_array_equal(frame_store.get(frame_keys[0]), _frame(0))
+        assert (frame_store.hits, frame_store.misses) == (1, 1)
+        assert frame_store.resident_bytes <= frame_store.budget_bytes
+
+        for value, frame_key in enumerate(frame_keys):
+            np.testing.assert_array_equal(frame_store.get(frame_key), _frame(value))
+    finally:
+        frame_store.close()
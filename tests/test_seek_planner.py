@@ -0,0 +1,47 @@
+from frame_comparison_tool.utils.frame_index import FrameIndex
+from frame_comparison_tool.utils.seek_action import SeekAction
+from frame_comparison_tool.utils.seek_planner import SeekCosts, plan_seeks
+
+
+def _targets(*target_positions: int) -> list[tuple[int, int, int]]:
+    return [(frame_idx, target_position, target_position) for frame_idx, target_position in enumerate(target_positions)]
+
+
+def test_dense_targets_are_decoded_in_one_sweep() -> None:
+    plan = plan_seeks(targets=_targets(0, 4, 9, 15), costs=SeekCosts(seek_seconds=0.016, grab_seconds=0.001),
+                      start_position=0)
+
+    assert [step.action for step in plan.steps] == [SeekAction.GRAB] * 4
+    assert plan.sweep
+    assert plan.n_seeks == 0
+    assert abs(plan.estimated_seconds - 0.012) < 1e-9
+
+
+def test_distant_and_backward_targets_are_sought() -> None:
+    plan = plan_seeks(targets=_targets(100, 110, 50), costs=SeekCosts(seek_seconds=0.016, grab_seconds=0.001),
+                      start_position=0)
+
+    assert [step.action for step in plan.steps] == [SeekAction.SEEK, SeekAction.GRAB, SeekAction.SEEK]
+    assert not plan.sweep
+    assert plan.n_seeks == 2
+    assert abs(plan.estimated_seconds - (0.016 + 0.009 + 0.016)) < 1e-9
+
+
+def test_targets_sharing_a_keyframe_are_grabbed() -> None:
+    frame_index = FrameIndex.from_string('I' + 'P' * 99)
+
+    plan = plan_seeks(targets=_targets(10, 90), costs=SeekCosts(seek_seconds=0.016, grab_seconds=0.001),
+                      start_position=0, frame_index=frame_index)
+
+    assert [step.action for step in plan.steps] == [SeekAction.GRAB, SeekAction.GRAB]
+
+
+def test_measurements_update_the_costs() -> None:
+    costs = SeekCosts(seek_seconds=0.02, grab_seconds=0.002, smoothing=0.5)
+
+    costs.record_seek(0.04)
+    costs.record_grabs(0.01, n_frames=10)
+    costs.record_grabs(1.0, n_frames=0)
+
+    assert abs(costs.seek_seconds - 0.03) < 1e-9
+    assert abs(costs.grab_seconds - 0.0015) < 1e-9
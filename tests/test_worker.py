@@ -0,0 +1,124 @@
+import threading
+from typing import Optional, Callable
+
+import pytest
+
+from frame_comparison_tool.utils import Direction, Task
+from frame_comparison_tool.utils.exceptions import TaskCancelledError
+
+# The worker requires Python 3.12 and PySide6.
+worker = pytest.importorskip("frame_comparison_tool.utils.worker", exc_type=ImportError)
+
+
+def _offset(displacement: int, frame_idx: int = 0) -> tuple[Task, dict]:
+    return Task.OFFSET, {'src_idx': 0, 'frame_idx': frame_idx, 'direction': Direction(displacement)}
+
+
+def test_same_direction_offsets_are_merged() -> None:
+    tasks = worker.Worker._coalesce_tasks([_offset(1), _offset(1), _offset(1)])
+
+    assert tasks == [(Task.OFFSET, {'src_idx': 0, 'frame_idx': 0, 'displacement': 3})]
+
+
+def test_opposite_offsets_are_kept() -> None:
+    tasks = worker.Worker._coalesce_tasks([_offset(1), _offset(1), _offset(-1)])
+
+    assert [kwargs['displacement'] for _, kwargs in tasks] == [2, -1]
+
+
+def test_offsets_of_other_frames_are_not_merged() -> None:
+    tasks = worker.Worker._coalesce_tasks([_offset(1), _offset(1, frame_idx=1), _offset(1)])
+
+    assert [kwargs['frame_idx'] for _, kwargs in tasks] == [0, 1, 0]
+
+
+def test_offsets_stay_after_their_sampling() -> None:
+    tasks = worker.Worker._coalesce_tasks([(Task.SAMPLE, {}), _offset(1), (Task.RESAMPLE, {}), (Task.SAMPLE, {}),
+                                           _offset(-1)])
+
+    assert [task for task, _ in tasks] == [Task.SAMPLE, Task.OFFSET, Task.RESAMPLE, Task.OFFSET]
+
+
+def test_repeated_refocus_is_dropped() -> None:
+    tasks = worker.Worker._coalesce_tasks([(Task.REFOCUS, {}), _offset(1), (Task.REFOCUS, {})])
+
+    assert [task for task, _ in tasks] == [Task.OFFSET, Task.REFOCUS]
+
+
+class _SamplingFrameLoaderManager:
+    """
+    Frame loader manager requesting a rescale while it samples two frames, recording the scaled frames.
+    """
+
+    preview_sampling: bool = False
+
+    def __init__(self):
+        self.worker: Optional[worker.Worker] = None
+        self.scaled: list[tuple[tuple[int, int], bool]] = []
+
+    def sample_all_frames(self, cancel_event: threading.Event, focus: Optional[tuple[int, int]],
+                          on_frame_ready: Callable[[int, int], None]) -> None:
+        on_frame_ready(0, 0)
+        self.worker.add_task(Task.RESCALE)
+        assert self.scaled == []
+        on_frame_ready(0, 1)
+
+    def scale_frames(self, focus: tuple[int, int], neighbours: bool = True) -> None:
+        self.scaled.append((focus, neighbours))
+
+
+def test_rescale_is_handled_during_sampling() -> None:
+    frame_loader_manager = _SamplingFrameLoaderManager()
+    sampling_worker = worker.Worker(frame_loader_manager, get_focus=lambda: (0, 3))
+    frame_loader_manager.worker = sampling_worker
+    frames_ready: list[None] = []
+    sampling_worker.on_frames_ready.connect(lambda: frames_ready.append(None))
+
+    sampling_worker._sample_all_frames()
+
+    assert frame_loader_manager.scaled == [((0, 3), False)]
+    assert len(frames_ready) == 1
+    assert sampling_worker.queue.get_nowait() == (Task.RESCALE, {})
+
+
+class _CancellableFrameLoaderManager:
+    """
+    Frame loader manager whose sampling runs until it is cancelled.
+    """
+
+    preview_sampling: bool = False
+
+    def __init__(self):
+        self.sampling = threading.Event()
+        self.cancelled = threading.Event()
+
+    def sample_all_frames(self, cancel_event: threading.Event, focus: Optional[tuple[int, int]],
+                          on_frame_ready: Callable[[int, int], None]) -> None:
+        self.sampling.set()
+
+        if cancel_event.wait(timeout=10):
+            self.cancelled.set()
+            raise TaskCancelledError()
+
+    def pop_frame_count_corrections(self) -> list:
+        return []
+
+
+def test_paused_worker_cancels_and_requeues_sampling() -> None:
+    frame_loader_manager = _CancellableFrameLoaderManager()
+    sampling_worker = worker.Worker(frame_loader_manager)
+    sampling_worker.start()
+
+    try:
+        sampling_worker.add_task(Task.SAMPLE)
+        assert frame_loader_manager.sampling.wait(timeout=10)
+
+        with sampling_worker.paused():
+            assert frame_loader_manager.cancelled.is_set()
+            frame_loader_manager.sampling.clear()
+            frame_loader_manager.cancelled.clear()
+
+        # The interrupted sampling runs again once the worker continues.
+        assert frame_loader_manager.sampling.wait(timeout=10)
+    finally:
+        sampling_worker.stop()